@@ -0,0 +1,105 @@
+"""Greedy vs optimal assignment: runtime and total Match % on synthetic rosters.
+
+Run from the repository root:  python benchmarks/bench_assignment.py --sizes 1000x50 5000x200 10000x300
+
+greedy_assignment and optimal_assignment run on a precomputed matrix. The
+"backend" columns time the version2 backend's greedy path end to end
+(assign_employees_to_projects: scoring plus the per-project sort loop) on
+the same roster in that schema; it resolves skills through a vocabulary, so
+its total is not comparable to the other two.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workforce.assignment import assignment_score, greedy_assignment, optimal_assignment
+from workforce.matching import LANGUAGES_REQUIRED, SKILLS_REQUIRED, TOOLS_REQUIRED, compute_match_matrix
+from workforce.version2 import assign_employees_to_projects
+
+languages = ["Julia", "Python", "R", "SQL", "Javascript", "NoSQL", "Java", "HTML"]
+tools = ["Tableau", "PowerBI", "Git", "VS Code", "Microsoft Excel", "Looker", "AWS", "Azure", "GCP", "Jira"]
+skills = ["Data Cleaning", "Data Visualization", "Data Analysis", "Data Collection", "ETL",
+          "Process Mapping", "Database Management", "Agile"]
+
+SIZES = ['1000x50', '5000x200', '10000x300']
+
+def make_roster(n_employees, n_projects, seed=0):
+    rng = random.Random(seed)
+    employees = pd.DataFrame({
+        'Id': range(1, n_employees + 1),
+        'Languages': [';'.join(rng.sample(languages, rng.randint(1, 3))) + ';' for _ in range(n_employees)],
+        'Experience': [';'.join(rng.sample(skills, rng.randint(1, 3))) + ';' for _ in range(n_employees)],
+        'Tools': [';'.join(rng.sample(tools, rng.randint(1, 4))) + ';' for _ in range(n_employees)],
+        'Certifications': [rng.choice([None, None, 'CompTIA Data+']) for _ in range(n_employees)],
+    })
+    projects = pd.DataFrame({
+        'Project Name': [f"Project {i + 1}" for i in range(n_projects)],
+        LANGUAGES_REQUIRED: [', '.join(rng.sample(languages, rng.randint(1, 2))) for _ in range(n_projects)],
+        SKILLS_REQUIRED: [', '.join(rng.sample(skills, rng.randint(1, 2))) for _ in range(n_projects)],
+        TOOLS_REQUIRED: [', '.join(rng.sample(tools, rng.randint(1, 2))) for _ in range(n_projects)],
+        'Number of Employees Needed': [rng.randint(1, 5) for _ in range(n_projects)],
+    })
+    return employees, projects
+
+def as_version2(employees, projects):
+    """The same roster and projects in the version2 schema (everyone valid and free)."""
+    v2_employees = employees.rename(columns={'Experience': 'Skills'}).assign(**{
+        'Name': [f"Employee {i}" for i in employees['Id']],
+        'Availability': 'Full-time',
+        'End Date': pd.Timestamp.today().normalize() + pd.Timedelta(days=365),
+        'Current Projects': 0,
+        'Current Availability': 0,
+    })
+    v2_projects = projects.rename(columns={
+        LANGUAGES_REQUIRED: 'Languages', SKILLS_REQUIRED: 'Skills', TOOLS_REQUIRED: 'Tools',
+        'Number of Employees Needed': 'Number of People Required',
+    })
+    return v2_employees, v2_projects
+
+def parse_size(text):
+    n_employees, _, n_projects = text.partition('x')
+    return int(n_employees), int(n_projects)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[parse_size(s) for s in SIZES],
+                        metavar='EMPLOYEESxPROJECTS')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    print(f"{'employees':>9} {'projects':>8} {'seats':>6} | {'greedy s':>8} {'greedy total':>12} | "
+          f"{'optimal s':>9} {'optimal total':>13} | {'gain':>6} | {'backend s':>9} {'backend total':>13}")
+    for n_employees, n_projects in args.sizes:
+        employees, projects = make_roster(n_employees, n_projects, args.seed)
+        scores = compute_match_matrix(employees, projects)
+        seats = projects['Number of Employees Needed'].to_numpy()
+
+        start = time.perf_counter()
+        greedy = greedy_assignment(scores, seats)
+        greedy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        optimal = optimal_assignment(scores, seats, ids=employees['Id'].to_numpy())
+        optimal_time = time.perf_counter() - start
+
+        v2_employees, v2_projects = as_version2(employees, projects)
+        start = time.perf_counter()
+        backend, _, _ = assign_employees_to_projects(v2_projects, v2_employees)
+        backend_time = time.perf_counter() - start
+
+        greedy_total = assignment_score(scores, greedy)
+        optimal_total = assignment_score(scores, optimal)
+        gain = (optimal_total / greedy_total - 1) * 100 if greedy_total else 0
+        backend_total = sum(table['Match %'].sum() for table in backend.values())
+        print(f"{n_employees:>9} {n_projects:>8} {int(seats.sum()):>6} | {greedy_time:>8.3f} {greedy_total:>12.1f} | "
+              f"{optimal_time:>9.3f} {optimal_total:>13.1f} | {gain:>5.1f}% | "
+              f"{backend_time:>9.3f} {backend_total:>13.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""Memory of the roster and score data: float64/object representations vs the compact ones.
+
+Generates a seeded synthetic InternRecords roster with workforce.synthetic and
+reports, per component, the bytes kept alive and the peak allocation while
+building it (tracemalloc):
+
+    roster     raw object columns vs normalize_intern_records (categoricals)
+    terms      employee x term matrix with float64 data vs uint8 data
+    scores     dense float64 Match % matrix vs MatchCounts
+    weighted   the app's scoring (weights + certificate relevance): float64 vs WeightedCounts
+    optimal    scoring + optimal assignment on each score representation
+    backends   peak of each realdata mode end to end, unweighted and with the app's scoring
+    matcher    the app's IncrementalMatcher (same scoring): first run, then an edit of 1% of the rows
+
+tracemalloc only sees allocations made through Python's allocators, so it
+misses the Arrow buffers behind pandas' string columns. The max RSS column
+is the process high-water mark (getrusage) after each step: it includes
+those buffers, but it never goes down, so a step only shows its own peak
+when it raises the mark above every earlier step.
+
+Both score representations are checked to give identical assignments.
+Run from the repository root:
+    python benchmarks/bench_memory.py --employees 50000 --projects 1000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Unix only; the max RSS column is left blank elsewhere
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from workforce import realdata
+from workforce.assignment import optimal_assignment
+from workforce.incremental import IncrementalMatcher
+from workforce.matching import MATCH_FIELDS, SkillMatrix
+from workforce.normalize import normalize_intern_records
+from workforce.ranking import employee_ids
+from workforce.scoring import ScoringModel
+from workforce.synthetic import generate
+from workforce.vocabulary import SkillVocabulary
+
+def traced(fn):
+    """(result, seconds, peak MB) of one call under tracemalloc."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = fn()
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak / 1e6
+
+def max_rss_mb():
+    """High-water resident set size of this process so far, or None where getrusage is missing."""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+def frame_mb(df):
+    return df.memory_usage(deep=True).sum() / 1e6
+
+def terms_mb(matrix, data_itemsize=None):
+    """Bytes of a CSR matrix, optionally as if its data had another item size."""
+    itemsize = data_itemsize or matrix.data.itemsize
+    return (matrix.nnz * itemsize + matrix.indices.nbytes + matrix.indptr.nbytes) / 1e6
+
+def scores_mb(scores):
+    return scores.nbytes / 1e6
+
+def row(component, representation, kept_mb, peak_mb, seconds):
+    rss = max_rss_mb()
+    rss = f"{rss:>11.1f}" if rss is not None else f"{'-':>11}"
+    print(f"{component:<9} {representation:<41} {kept_mb:>9.1f} {peak_mb:>9.1f} {rss} {seconds:>8.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=50_000)
+    parser.add_argument('--projects', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    raw, projects = generate('realdata', args.employees, args.projects, args.seed)
+    print(f"{len(raw)} intern records x {len(projects)} projects (seed {args.seed})")
+    print(f"{'component':<9} {'representation':<41} {'kept MB':>9} {'peak MB':>9} {'max RSS MB':>11} {'seconds':>8}")
+
+    employees, seconds, peak = traced(lambda: normalize_intern_records(raw))
+    row('roster', 'object columns (raw export)', frame_mb(raw), 0.0, 0.0)
+    row('roster', 'categoricals (normalized)', frame_mb(employees), peak, seconds)
+
+    valid = realdata.filter_valid_employees(employees)
+    print(f"{len(valid)} valid employees")
+    skills, seconds, peak = traced(lambda: SkillMatrix(valid, projects, MATCH_FIELDS, SkillVocabulary()))
+    if hasattr(skills.employee_terms, 'nnz'):
+        row('terms', 'float64 data', terms_mb(skills.employee_terms, 8), 0.0, 0.0)
+        row('terms', 'uint8 data', terms_mb(skills.employee_terms), peak, seconds)
+
+    dense, seconds, peak = traced(skills.scores)
+    row('scores', 'float64 matrix', scores_mb(dense), peak, seconds)
+    compact, seconds, peak = traced(skills.match_scores)
+    row('scores', f'MatchCounts ({compact.counts.dtype})', scores_mb(compact), peak, seconds)
+
+    # Weights as set in the app's sidebar, with certificates scored by relevance (its default)
+    model = ScoringModel({'Languages': 2.0, 'Experience': 1.5, 'Tools': 1.0, 'Certifications': 0.5})
+    weighted = SkillMatrix(valid, projects, MATCH_FIELDS, SkillVocabulary(), model)
+    dense, seconds, peak = traced(lambda: weighted.score_breakdown()[0])
+    row('weighted', 'float64 matrix', scores_mb(dense), peak, seconds)
+    compact, seconds, peak = traced(weighted.match_scores)
+    row('weighted', f'WeightedCounts ({compact.counts.dtype})', scores_mb(compact), peak, seconds)
+    if not np.array_equal(np.asarray(compact), dense):
+        raise SystemExit('WeightedCounts differs from the float64 matrix')
+    del dense, compact
+
+    seats = projects['Number of Employees Needed'].fillna(0).astype(int).to_numpy()
+    ids = employee_ids(valid)
+    assigned = {}
+    for label, score in (('float64 matrix', skills.scores), ('MatchCounts', skills.match_scores)):
+        assigned[label], seconds, peak = traced(lambda: optimal_assignment(score(), seats, ids=ids))
+        row('optimal', label, 0.0, peak, seconds)
+    if not np.array_equal(*assigned.values()):
+        raise SystemExit('score representations gave different assignments')
+    print('assignments identical')
+
+    for name in ('assign_employees_to_projects', 'allocate_employees_to_projects', 'schedule_employee_hours'):
+        backend = getattr(realdata, name)
+        for label, scoring in ((name, None), (f'{name} (weighted)', model)):
+            _, seconds, peak = traced(lambda: backend(projects, employees, skill_vocabulary=SkillVocabulary(),
+                                                      scoring=scoring))
+            row('backends', label, 0.0, peak, seconds)
+
+    matcher = IncrementalMatcher(skill_vocabulary=SkillVocabulary(), model=model)
+    update, seconds, peak = traced(lambda: matcher.update(valid, projects))
+    row('matcher', 'first update', scores_mb(update.scores), peak, seconds)
+    edited = valid.astype({'Tools': object})
+    edited.iloc[:max(1, len(edited) // 100), edited.columns.get_loc('Tools')] = 'Python'
+    update, seconds, peak = traced(lambda: matcher.update(edited, projects))
+    row('matcher', f'{update.rescored_employees} rows edited', scores_mb(update.scores), peak, seconds)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Process-pool scoring: wall time at 1/2/4/8 workers on a synthetic roster.
+
+Run from the repository root:  python benchmarks/bench_parallel.py --employees 50000 --projects 1000
+
+Every worker count is checked against the single-process matrix and top-k
+lists, so a speedup never comes at the cost of different results.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_assignment import make_roster
+from workforce.matching import compute_match_matrix
+from workforce.parallel import default_workers, parallel_match_matrix, parallel_top_k
+from workforce.ranking import top_k
+
+WORKERS = [1, 2, 4, 8]
+TOP_N = 10
+
+def best_of(fn, repeats=3):
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=50_000)
+    parser.add_argument('--projects', type=int, default=1000)
+    args = parser.parse_args(argv)
+    n_employees, n_projects = args.employees, args.projects
+    employees, projects = make_roster(n_employees, n_projects)
+    ids = employees['Id'].to_numpy()
+
+    reference = compute_match_matrix(employees, projects)
+    reference_top = [top_k(reference[:, c], TOP_N, ids) for c in range(reference.shape[1])]
+
+    print(f"{n_employees} employees x {n_projects} projects, {default_workers()} CPUs available")
+    print(f"{'workers':>7} | {'matrix s':>8} {'speedup':>7} | {'top-k s':>7} {'speedup':>7} | {'identical':>9}")
+    base_matrix = base_top = None
+    for workers in WORKERS:
+        matrix_time, matrix = best_of(lambda: parallel_match_matrix(employees, projects, workers=workers))
+        top_time, top = best_of(lambda: parallel_top_k(employees, projects, k=TOP_N, ids=ids, workers=workers))
+        base_matrix = base_matrix or matrix_time
+        base_top = base_top or top_time
+        identical = np.array_equal(matrix, reference) and all(
+            np.array_equal(top[c][0], reference_top[c]) for c in range(n_projects)
+        )
+        print(f"{workers:>7} | {matrix_time:>8.2f} {base_matrix / matrix_time:>6.2f}x | "
+              f"{top_time:>7.2f} {base_top / top_time:>6.2f}x | {str(identical):>9}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""End-to-end pipeline stages on a seeded synthetic dataset, with a results history.
+
+Generates employees/projects with workforce.synthetic, then times ingestion,
+filtering, scoring, assignment and export separately (best of --repeats,
+without tracemalloc) and records each stage's peak allocation in a second,
+traced pass. tracemalloc misses the Arrow buffers behind string columns, so
+the process's max RSS after each stage's timed runs is recorded too; it is
+a high-water mark, so a stage only shows its own peak when it raises it.
+Every run is appended to a JSON-lines file together with the
+git revision, so the printed deltas against the last run with the same
+parameters show regressions between versions.
+
+Run from the repository root:
+    python benchmarks/bench_pipeline.py --employees 100000 --projects 2000 --format parquet
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_memory import max_rss_mb
+from workforce import normalize, realdata, version2
+from workforce.assignment import greedy_assignment, optimal_assignment
+from workforce.batch import SCHEMAS, run_matching
+from workforce.capacity import CapacityLedger, parse_weekly_hours, schedule_hours
+from workforce.export import export_assignments
+from workforce.ingest import clear_cache, load_table
+from workforce.matching import MATCH_FIELDS, SkillMatrix
+from workforce.ranking import CandidateRanking, employee_ids
+from workforce.synthetic import FORMATS, write_dataset
+from workforce.vocabulary import SkillVocabulary
+
+STAGES = ['ingestion', 'filtering', 'scoring', 'assignment', 'export']
+RESULTS = os.path.join(ROOT, 'benchmarks', 'results', 'pipeline.jsonl')
+TOP_N = 10
+
+# -------------------- Stages --------------------
+
+def ingest(schema, paths, scratch):
+    # Empty the in-process cache (scratch holds no cache files) so every repeat parses the files again
+    clear_cache(scratch)
+    normalizer = getattr(normalize, SCHEMAS[schema][1])
+    return (load_table(paths[0], normalize=normalizer, cache_dir=None),
+            load_table(paths[1], cache_dir=None))
+
+def filter_employees(schema, employee_df):
+    backend = realdata if schema == 'realdata' else version2
+    return backend.filter_valid_employees(employee_df)
+
+def score(schema, mode, valid, projects):
+    if schema == 'realdata' and mode == 'top':
+        # Top mode only scores the employees sharing a term with each project
+        skills = SkillMatrix(valid, projects, MATCH_FIELDS, SkillVocabulary())
+        rows, cols, scores, floor = skills.candidate_scores()
+        return CandidateRanking(len(valid), rows, cols, scores, floor, skills.certified, employee_ids(valid))
+    if schema == 'realdata':
+        # Matched-token counts (MatchCounts), as the optimal and hours modes keep them
+        return SkillMatrix(valid, projects, MATCH_FIELDS, SkillVocabulary()).match_scores()
+    return version2.skill_match_scores(valid, projects)
+
+def assign(schema, mode, valid, projects, scores):
+    """The assignment step alone, on the precomputed scores (as the backends call it)."""
+    if schema == 'realdata':
+        ids = employee_ids(valid)
+        seats = projects['Number of Employees Needed'].fillna(0).astype(int).to_numpy()
+        if mode == 'top':
+            return [scores.top(col, TOP_N) for col in range(len(projects))]
+        if mode == 'optimal':
+            return optimal_assignment(scores, seats, ids=ids)
+        hours_per_person = parse_weekly_hours(projects['Time Commitment per Person (hrs/week)'])
+        ledger = CapacityLedger(valid['Available Hours'], np.zeros(len(valid), dtype=int),
+                                hours_per_person * seats)
+        schedule_hours(scores, ids, ledger, hours_per_person)
+        return ledger.allocations()
+
+    seats = projects['Number of People Required'].fillna(0).astype(int).to_numpy()
+    if mode == 'greedy':
+        return greedy_assignment(scores, seats)
+    if mode == 'optimal':
+        return optimal_assignment(scores, seats, ids=valid['Name'].astype(str).to_numpy())
+    project_hours = projects['Hours Required'].fillna(0).astype(int).to_numpy()
+    ledger = CapacityLedger(valid['Available Hours'], valid['Current Projects'].fillna(0).astype(int),
+                            project_hours)
+    schedule_hours(scores, np.arange(len(valid)), ledger, project_hours // np.maximum(seats, 1))
+    return ledger.allocations()
+
+# -------------------- Measurement --------------------
+
+def best_of(fn, repeats):
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def peak_mb(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1e6
+
+def run_stages(args, paths, scratch):
+    schema, mode = args.schema, args.mode or SCHEMAS[args.schema][2]
+    stages = {}
+
+    def stage(name, fn):
+        seconds, value = best_of(fn, args.repeats)
+        stages[name] = {'seconds': round(seconds, 4)}
+        rss = max_rss_mb()
+        if rss is not None:
+            stages[name]['max_rss_mb'] = round(rss, 1)
+        if not args.no_memory:
+            stages[name]['peak_mb'] = round(peak_mb(fn), 1)
+        return value
+
+    employee_df, projects = stage('ingestion', lambda: ingest(schema, paths, scratch))
+    valid = stage('filtering', lambda: filter_employees(schema, employee_df))
+    scores = stage('scoring', lambda: score(schema, mode, valid, projects))
+    stage('assignment', lambda: assign(schema, mode, valid, projects, scores))
+    # Export serializes the same tables the app offers for download
+    assignments = run_matching(employee_df.copy(), projects, schema=schema, mode=mode, top_n=TOP_N)
+    stage('export', lambda: export_assignments(assignments, args.export_format))
+
+    rows = {
+        'employees': len(employee_df), 'valid_employees': len(valid), 'projects': len(projects),
+        'matched_rows': int(sum(len(df) for df in assignments.values())),
+    }
+    return rows, stages
+
+# -------------------- Results History --------------------
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def previous_run(path, params):
+    """Latest recorded run with the same parameters, or None."""
+    if not os.path.exists(path):
+        return None
+    match = None
+    with open(path) as fh:
+        for line in fh:
+            entry = json.loads(line)
+            if entry.get('params') == params:
+                match = entry
+    return match
+
+def print_table(entry, previous):
+    print(f"{'stage':<11} {'seconds':>9} {'peak MB':>8} {'max RSS MB':>11} {'vs prev':>9}")
+    for name in STAGES:
+        current = entry['stages'][name]
+        delta = ''
+        if previous is not None and name in previous['stages']:
+            before = previous['stages'][name]['seconds']
+            if before > 0:
+                delta = f"{(current['seconds'] - before) / before:+.0%}"
+        peak = f"{current['peak_mb']:.1f}" if 'peak_mb' in current else '-'
+        rss = f"{current['max_rss_mb']:.1f}" if 'max_rss_mb' in current else '-'
+        print(f"{name:<11} {current['seconds']:>9.3f} {peak:>8} {rss:>11} {delta:>9}")
+    total = sum(entry['stages'][name]['seconds'] for name in STAGES)
+    print(f"{'total':<11} {total:>9.3f}")
+    if previous is not None:
+        print(f"compared with {previous.get('revision') or 'unknown revision'} at {previous['timestamp']}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--schema', choices=sorted(SCHEMAS), default='realdata')
+    parser.add_argument('--mode', help='Assignment mode (default: the schema default)')
+    parser.add_argument('--employees', type=int, default=100_000)
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--format', choices=FORMATS, default='parquet', help='Input file format')
+    parser.add_argument('--export-format', default='Parquet (single table)',
+                        help="Export label from workforce.export.EXPORT_FORMATS")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory pass')
+    parser.add_argument('--results', default=RESULTS, help='JSON-lines history file (default %(default)s)')
+    parser.add_argument('--label', help='Free-form note stored with the run')
+    args = parser.parse_args(argv)
+
+    params = {
+        'schema': args.schema, 'mode': args.mode or SCHEMAS[args.schema][2], 'employees': args.employees,
+        'projects': args.projects, 'format': args.format, 'export_format': args.export_format, 'seed': args.seed,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        # Dates are generated relative to today, so the filtered row counts stay comparable across days
+        paths = write_dataset(tmp, args.schema, args.employees, args.projects, args.seed, args.format)
+        print(f"generated {args.employees} employees x {args.projects} projects "
+              f"({args.schema}, {args.format}) in {time.perf_counter() - start:.1f}s")
+        rows, stages = run_stages(args, paths, os.path.join(tmp, 'no-cache'))
+
+    entry = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'label': args.label,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'params': params,
+        'rows': rows,
+        'stages': stages,
+    }
+    previous = previous_run(args.results, params)
+    print(', '.join(f"{key} {value}" for key, value in entry['rows'].items()))
+    print_table(entry, previous)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.results)), exist_ok=True)
+    with open(args.results, 'a') as fh:
+        fh.write(json.dumps(entry) + '\n')
+
+if __name__ == '__main__':
+    main()
@@ -1,117 +1,177 @@
-import streamlit as st
+import contextlib
+import threading
+import time
+
 import pandas as pd
-from datetime import datetime, timedelta
-from io import BytesIO
-
-# -------------------- Helper Functions --------------------
-
-def filter_valid_employees(df):
-    """Filter employees who are not currently assigned to any project."""
-    today = pd.to_datetime(datetime.today().date())
-    threshold_date = today + timedelta(days=15)
-    df['Please Enter Your End Date'] = pd.to_datetime(df['Please Enter Your End Date'], errors='coerce')
-    
-    valid_df = df[
-        (df['Please Enter Your End Date'] > threshold_date) & 
-        (df['Are you currently assigned to a project?'].str.strip().str.lower() == 'no')
-    ].copy()
-    
-    valid_df['Available Hours'] = valid_df['Availability'].apply(
-        lambda x: 40 if str(x).strip().lower() == 'full-time' else 20
-    )
-    return valid_df
-
-def calculate_match_percentage(employee, project):
-    """Calculate match percentage based on Languages, Experience, Tools, and Certifications."""
-    match_count = 0
-    total_count = 0
-    match_fields = [
-        ('Languages', 'Langauages proficiency required (e.g. Python, Java)'),
-        ('Experience', 'Skills Required (e.g. Risk Management, Data Analysis, Data Visualization )'),
-        ('Tools', 'Tools (e.g. Power BI, Jira)')
-    ]
-    
-    for emp_field, proj_field in match_fields:
-        emp_val = str(employee[emp_field]).strip().lower().split(';')
-        proj_val = str(project[proj_field]).strip().lower().split(',')
-        if proj_val and proj_val[0] != 'n/a' and proj_val[0] != '':
-            total_count += len(proj_val)
-            match_count += sum(1 for val in proj_val if val.strip() in [v.strip() for v in emp_val])
-    
-    if pd.notna(employee['Certifications']) and str(employee['Certifications']).strip().lower() != 'n/a':
-        total_count += 1
-        match_count += 1
-    
-    return (match_count / total_count) * 100 if total_count else 0
-
-def match_employees_to_project(project, available_employees):
-    """Match employees to a project based on requirements and update availability."""
-    required_people = int(project['Number of Employees Needed'])
-    available_employees.loc[:, 'Match %'] = available_employees.apply(
-        lambda emp: calculate_match_percentage(emp, project), axis=1
-    )
+import streamlit as st
+
+from workforce.capacity import DEFAULT_MAX_PROJECTS
+from workforce.export import EXPORT_FORMATS, export_assignments
+from workforce.incremental import IncrementalMatcher
+from workforce.ingest import content_hash, load_table
+from workforce.jobs import MAX_CACHED_JOBS, JobCache, make_executor
+from workforce.normalize import is_unassigned, normalize_intern_records
+from workforce.parallel import default_workers
+from workforce.profiling import Trace
+from workforce.realdata import (
+    allocate_employees_to_projects, rank_employees, schedule_employee_hours
+)
+from workforce.scoring import CERTIFICATION_SKILLS, ScoringModel
+from workforce.store import DEFAULT_STORE, RosterStore
+from workforce.vocabulary import SkillVocabulary
+from workforce.whatif import ScenarioBase, compare_projects, compare_totals
+
+# -------------------- Background Matching --------------------
+
+# Seconds between progress redraws while a job runs
+POLL_SECONDS = 0.5
+
+# Ranks every worker process sends back per project (the top matches input's maximum)
+RANK_DEPTH = 100
+
+def rank_depth(last_rank):
+    """Ranks to keep from worker processes to show up to last_rank, doubled past RANK_DEPTH."""
+    depth = RANK_DEPTH
+    while depth < last_rank:
+        depth *= 2
+    return depth
+
+@st.cache_resource
+def match_executor():
+    """One matching thread pool per server process, shared by every session."""
+    return make_executor()
+
+def run_pipeline(emp_file, proj_file, settings, diagnostics, matcher, matcher_lock, progress):
+    """Load, filter and match in a background thread; must not call Streamlit.
 
+    diagnostics is (record stage timings, run under cProfile); the trace is returned with the results.
+    """
+    record_performance, profile = diagnostics
+    trace = Trace(profile=profile) if record_performance or profile else None
+    with trace or contextlib.nullcontext():
+        result = match_uploads(emp_file, proj_file, settings, matcher, matcher_lock, progress)
+    result['trace'] = trace
+    result['diagnostics'] = diagnostics
+    return result
 
-    available_employees = available_employees[available_employees['Match %'] > 0]
-    sorted_emps = available_employees.sort_values(by='Match %', ascending=False)
-    selected = sorted_emps.head(required_people)
-    
-    for idx in selected.index:
-        available_employees.loc[idx, 'Are you currently assigned to a project?'] = 'Yes'
-    
-    return selected.copy(), available_employees
-
-def assign_employees_to_projects(projects_df, employee_df):
-    """For each project, show top 10 employees with highest match percentage."""
-    valid_employees = filter_valid_employees(employee_df)
-    project_assignments = {}
-
-    for _, project in projects_df.iterrows():
-        # Calculate match % for every employee
-        valid_employees.loc[:, 'Match %'] = valid_employees.apply(
-            lambda emp: calculate_match_percentage(emp, project), axis=1
+def match_uploads(emp_file, proj_file, settings, matcher, matcher_lock, progress):
+    (view_mode, depth, max_projects, workers, match_synonyms, weights, relevant_certifications, use_store,
+     project_dates, plan_date) = settings
+    skill_vocabulary = SkillVocabulary() if match_synonyms else None
+    progress(0.05, "Reading project requirements")
+    project_df = load_table(proj_file)
+    skipped_records = 0
+    if use_store:
+        # The upload is merged into the stored history; only this run's candidates are loaded back
+        progress(0.1, "Saving employee records to the roster database")
+        with RosterStore(DEFAULT_STORE) as store:
+            records = load_table(emp_file)
+            skipped_records = len(records) - store.upsert_records(records)
+            store.upsert_projects(project_df)
+            progress(0.2, "Querying available employees")
+            # Candidates are picked with the vocabulary that will score them (the matcher's for top matches)
+            top_matches = view_mode == "Top matches per project" and not project_dates and workers == 1
+            with matcher_lock if top_matches else contextlib.nullcontext():
+                employee_df = store.employees(
+                    valid_only=not project_dates, projects=project_df,
+                    skill_vocabulary=matcher.skill_vocabulary if top_matches else skill_vocabulary, today=plan_date
+                )
+            unassigned = store.counts()['unassigned']
+    else:
+        progress(0.1, "Reading employee data")
+        # Parsed and deduplicated once per file content; later runs are served from the cache
+        employee_df = load_table(emp_file, normalize=normalize_intern_records)
+        unassigned = int(is_unassigned(employee_df['Are you currently assigned to a project?']).sum())
+
+    progress(0.3, "Matching employees to projects")
+    scoring = ScoringModel(dict(weights), CERTIFICATION_SKILLS if relevant_certifications else None)
+    update = rankings = assignments = None
+    if view_mode == "Optimal assignment":
+        assignments, _, _ = allocate_employees_to_projects(
+            project_df, employee_df, workers=workers, skill_vocabulary=skill_vocabulary, scoring=scoring,
+            project_dates=project_dates, today=plan_date
+        )
+    elif view_mode == "Hours-based schedule":
+        assignments, _, _ = schedule_employee_hours(
+            project_df, employee_df, max_projects, workers=workers,
+            skill_vocabulary=skill_vocabulary, scoring=scoring, project_dates=project_dates, today=plan_date
+        )
+    elif project_dates or workers > 1:
+        # Availability differs per project window, and worker processes score the whole roster,
+        # so both run without the session's matcher
+        rankings, _ = rank_employees(
+            project_df, employee_df, depth, workers=workers, skill_vocabulary=skill_vocabulary,
+            scoring=scoring, project_dates=project_dates, today=plan_date
         )
+    else:
+        # The session's matcher keeps the previous scores, so re-uploads only rescore changed rows;
+        # it keeps its own top-n current, and longer rankings are cut from its scores on demand
+        with matcher_lock:
+            rankings, _ = rank_employees(project_df, employee_df, matcher.top_n, matcher=matcher)
+            last = matcher.last_update
+            update = {
+                'first_run': last.first_run, 'rescored_employees': last.rescored_employees,
+                'rescored_projects': last.rescored_projects, 'changed_projects': last.changed_projects,
+            }
 
-        # Sort and get top 10 matches with Match % > 0
-        top_matches = valid_employees[valid_employees['Match %'] > 0]
-        top_matches = top_matches.sort_values(by='Match %', ascending=False).head(10)
-
-        project_assignments[project['Project Name']] = top_matches[[
-            'Name', 'Availability', 'Languages', 'Experience', 'Tools', 'Certifications', 'Match %'
-        ]]
-
-    return project_assignments, valid_employees, employee_df
-
-def sanitize_sheet_name(name):
-    """Sanitize sheet names for Excel compatibility."""
-    invalid_chars = ['\\', '/', '*', '?', ':', '[', ']']
-    for char in invalid_chars:
-        name = name.replace(char, '-')
-    return name[:31]
-
-def to_excel_download(assignments):
-    """Convert project assignments to Excel for download."""
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        for sheet_name, df in assignments.items():
-            df_reset = df.reset_index(drop=True)
-            safe_name = sanitize_sheet_name(sheet_name)
-            df_reset.to_excel(writer, sheet_name=safe_name, index=False)
-    output.seek(0)
-
-    #(THIS IS THE CODE FOR DOWNLOADING UPDATED EMPLOYEE DATA) REMOVED FOR NOW AS IT IS NOT USED IN THE CURRENT VERSION
-    #    updated_employee_io = BytesIO()  
-    #    updated_employee_df.to_excel(updated_employee_io, index=False)
-    #    updated_employee_io.seek(0)
-    #    st.download_button(
-    #        label="📥 Download Updated Employee Data (Excel)",
-    #        data=updated_employee_io,
-    #        file_name="UpdatedEmployeeData.xlsx",
-    #        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    #        help="Download the updated employee data with assignment status."
-    #    )
-
-    return output
+    progress(0.95, "Preparing result tables")
+    return {
+        'assignments': assignments,
+        'rankings': rankings,
+        'total_projects': len(project_df),
+        'unassigned': unassigned,
+        'skipped_records': skipped_records,
+        'update': update,
+    }
+
+def performance_table(records):
+    """Trace records as a display table, nested stages indented under their parent."""
+    table = pd.DataFrame([r for r in records if r is not None])
+    table['stage'] = ['\u2003' * depth + stage for depth, stage in zip(table.pop('depth'), table['stage'])]
+    return table
+
+def session_matcher(match_synonyms, weights, relevant_certifications):
+    """The session's IncrementalMatcher; changing synonym or scoring settings starts a fresh one."""
+    matcher_settings = (match_synonyms, tuple(weights.items()), relevant_certifications)
+    if st.session_state.get('matcher_settings') != matcher_settings:
+        st.session_state.matcher = IncrementalMatcher(
+            skill_vocabulary=SkillVocabulary() if match_synonyms else None,
+            model=ScoringModel(weights, CERTIFICATION_SKILLS if relevant_certifications else None),
+        )
+        st.session_state.matcher_settings = matcher_settings
+    return st.session_state.matcher
+
+# Assignment mode of each results view, as the batch runner and the what-if engine name them
+VIEW_MODES = {"Top matches per project": 'top', "Optimal assignment": 'optimal', "Hours-based schedule": 'hours'}
+
+def build_scenario_base(emp_file, proj_file, settings, progress):
+    """Load the uploads and score the what-if base in a background thread, as the matching run does; no Streamlit.
+
+    settings are the matching settings that decide the scores (the assignment options only apply on evaluate).
+    """
+    workers, match_synonyms, weights, relevant_certifications, use_store, project_dates, plan_date = settings
+    skill_vocabulary = SkillVocabulary() if match_synonyms else None
+    progress(0.05, "Reading project requirements")
+    project_df = load_table(proj_file)
+    if use_store:
+        # The matching run already merged this upload; every latest record is loaded, since an edit can make
+        # an intern valid, but only those who share a requirement with some project
+        progress(0.1, "Querying the roster database")
+        with RosterStore(DEFAULT_STORE) as store:
+            employee_df = store.employees(projects=project_df, skill_vocabulary=skill_vocabulary, today=plan_date)
+    else:
+        progress(0.1, "Reading employee data")
+        employee_df = load_table(emp_file, normalize=normalize_intern_records)
+    progress(0.3, "Scoring the roster for scenarios")
+    base = ScenarioBase(
+        project_df, employee_df, skill_vocabulary=skill_vocabulary,
+        scoring=ScoringModel(dict(weights), CERTIFICATION_SKILLS if relevant_certifications else None),
+        workers=workers, project_dates=project_dates, today=plan_date,
+    )
+    return {
+        'base': base, 'baseline': base.scenario('Base'), 'scenarios': {},
+        'labels': {i: f"{name} (Id {i})" for i, name in zip(base.ids.tolist(), base.roster['Name'].astype(str))},
+    }
 
 # -------------------- Streamlit UI --------------------
 
@@ -137,15 +197,82 @@ with st.sidebar:
     st.markdown("### Navigation")
     st.markdown("- Upload Employee Data\n- Upload project requirements\n- View matching results\n- Download assignments")
     st.markdown("---")
+    view_mode = st.radio(
+        "Results view",
+        ["Top matches per project", "Optimal assignment", "Hours-based schedule"],
+        help="Optimal assignment gives each employee at most one project and fills 'Number of Employees Needed' to maximize total match. "
+             "Hours-based schedule splits each intern's weekly hours across several projects."
+    )
+    max_projects = st.number_input("Max projects per employee", min_value=1, max_value=10, value=DEFAULT_MAX_PROJECTS)
+    workers = st.number_input(
+        "Scoring processes", min_value=1, max_value=default_workers(), value=1,
+        help="Score large rosters across several CPU cores. With more than one, top matches rescore the "
+             "whole roster on every run instead of only the rows changed since the last upload."
+    )
+    top_n = st.number_input("Top matches per project", min_value=1, max_value=100, value=10, step=5)
+    first_rank = st.number_input(
+        "Starting at rank", min_value=1, value=1, step=int(top_n),
+        help="Page through each project's ranking; pages are cut from the cached ranking without rescoring."
+    )
+    match_synonyms = st.checkbox(
+        "Match skill synonyms and typos", value=True,
+        help="Treat aliases and spelling variants as the same skill, e.g. 'PowerBI' and 'Power BI', "
+             "'MS Excel' and 'Microsoft Excel'. Off: exact token matches only."
+    )
+    with st.expander("⚖️ Scoring weights"):
+        weights = {
+            criterion: st.slider(criterion, min_value=0.0, max_value=5.0, value=1.0, step=0.5)
+            for criterion in ("Languages", "Experience", "Tools", "Certifications")
+        }
+        relevant_certifications = st.checkbox(
+            "Score certificates by relevance", value=True,
+            help="A known certificate earns credit for the share of the project's requirements it covers. "
+                 "Off: any certificate earns the full Certifications weight."
+        )
+    with st.expander("📅 Availability"):
+        project_dates = st.checkbox(
+            "Plan with project dates", value=False,
+            help="Match each project only with interns whose stay covers its start and estimated end dates "
+                 "and who have its hours/week free. Off: interns available for the next 15 days."
+        )
+        plan_date = st.date_input("Plan as of", value="today", help="Projects are staffed from this date on.")
+    with st.expander("⏱️ Diagnostics"):
+        record_performance = st.checkbox(
+            "Record stage timings", value=False,
+            help="Time each pipeline stage (load, filter, score, assign, export) with row counts and memory deltas."
+        )
+        profile = st.checkbox("Profile with cProfile", value=False, help="Slower; lists the most expensive functions.")
+    use_store = st.checkbox(
+        "Keep roster in a local database", value=False,
+        help="Merge each employee upload into a SQLite roster (by Id) and match against the latest record per intern, "
+             "loading only employees who share a requirement with some project."
+    )
+    clear_results = st.button("🔄 Clear cached results", help="Forget cached matching results and run again.")
+    st.markdown("---")
     st.markdown("Developed by: Data Analytics Team")
 
+# Per-session result cache: finished matching jobs and prepared downloads
+if 'jobs' not in st.session_state:
+    st.session_state.jobs = JobCache(match_executor())
+    st.session_state.exports = {}
+    st.session_state.export_stages = {}
+    st.session_state.page_stages = {}
+    st.session_state.matcher_lock = threading.Lock()
+if clear_results:
+    st.session_state.jobs.clear()
+    st.session_state.exports.clear()
+    st.session_state.export_stages.clear()
+    st.session_state.page_stages.clear()
+    st.session_state.pop('matcher_settings', None)
+    st.session_state.pop('whatif', None)
+
 # Main content
 st.title("💼 Workforce Planning Tool")
 st.markdown("**Match employees to projects based on skills, tools, languages, and certifications.**")
 st.markdown("---")
 
 st.header("📁 Upload Employee Data")
-emp_file = st.file_uploader("Upload Employee Data Excel File (.xlsx)", type=["xlsx"], help="Upload an Excel file containing employee data.")
+emp_file = st.file_uploader("Upload Employee Data Excel File (.xlsx)", type=["xlsx", "csv", "parquet"], help="Upload an Excel file containing employee data. CSV and Parquet exports are also accepted.")
 
 # Load employee data
 #try:
@@ -155,62 +282,219 @@ emp_file = st.file_uploader("Upload Employee Data Excel File (.xlsx)", type=["xl
 
 # Project file uploader
 st.header("📁 Upload Project Requirements")
-proj_file = st.file_uploader("Upload Project Requirements Excel File (.xlsx)", type=["xlsx"], help="Upload an Excel file containing project requirements.")
+proj_file = st.file_uploader("Upload Project Requirements Excel File (.xlsx)", type=["xlsx", "csv", "parquet"], help="Upload an Excel file containing project requirements. CSV and Parquet exports are also accepted.")
 
 if proj_file and emp_file:
     try:
-        
-        #employee_df = pd.read_excel("InternRecords.xlsx")
-        employee_df = pd.read_excel(emp_file)
-        # Step 1: Normalize Name1 to lowercase for duplicate detection
-        employee_df['Name1_clean'] = employee_df['Name1'].str.strip().str.lower()
-
-        # Step 2: Keep the row with the highest ID for each Name1
-        employee_df = employee_df.sort_values(by='Id', ascending=False)
-        employee_df = employee_df.drop_duplicates(subset='Name1_clean', keep='first')
-
-        # Step 3: (Optional) Drop the helper column after filtering
-        employee_df.drop(columns='Name1_clean', inplace=True)
-        employee_df.drop(columns='Name', inplace=True)
-        employee_df['Name1'] = employee_df['Name1'].str.title()
-        employee_df = employee_df.rename(columns={'Name1': 'Name'})
-
-        project_df = pd.read_excel(proj_file)
-        st.success("✅ Project file loaded successfully!")
+        # Results are cached per session, keyed on both files' contents and every setting that affects them;
+        # diagnostics only apply to the next run, so toggling them never discards a cached result.
+        # Top matches keep each project's ranking, so the number shown and the page are cut from it per
+        # rerun; only worker processes send back a fixed depth, which grows when a page reaches past it
+        top_view = view_mode == "Top matches per project"
+        offset, limit = int(first_rank) - 1, int(top_n)
+        depth = rank_depth(offset + limit) if top_view and workers > 1 and not project_dates else None
+        settings = (
+            view_mode, depth, int(max_projects), int(workers), match_synonyms,
+            tuple(weights.items()), relevant_certifications, use_store, project_dates, plan_date,
+        )
+        diagnostics = (record_performance, profile)
+        hashes = (content_hash(emp_file.getvalue()), content_hash(proj_file.getvalue()))
+        key = (*hashes, settings)
+        matcher = session_matcher(match_synonyms, weights, relevant_certifications)
+        job = st.session_state.jobs.get_or_submit(
+            key, run_pipeline, emp_file, proj_file, settings, diagnostics, matcher, st.session_state.matcher_lock
+        )
+
+        if not job.done:
+            # Matching runs in the background; redraw the progress until it finishes
+            st.progress(job.progress, text=f"⏳ {job.message}... ({job.elapsed:.0f}s)")
+            time.sleep(POLL_SECONDS)
+            st.rerun()
+        if job.error is not None:
+            raise job.error
+        result = job.result()
+        page_key = (key, offset, limit) if top_view else key
+        if top_view:
+            # Pages are cut in this thread; their stages are kept from the first time each is built.
+            # The matcher's breakdowns read its vocabulary, which a running job may be extending
+            lock = st.session_state.matcher_lock if result['update'] is not None else contextlib.nullcontext()
+            with lock, Trace() if record_performance else contextlib.nullcontext() as page_trace:
+                assignments = result['rankings'].page(offset, limit)
+            page_stages = st.session_state.page_stages
+            if page_trace is not None and page_trace.records:
+                page_stages[page_key] = page_trace.records
+                while len(page_stages) > MAX_CACHED_JOBS:
+                    page_stages.pop(next(iter(page_stages)))
+            first_row = offset + 1
+        else:
+            assignments, first_row = result['assignments'], 1
+        st.success(f"✅ Project file loaded successfully! Matched in {job.elapsed:.1f}s.")
         
         # Summary metrics
         st.markdown("### 📊 Assignment Summary")
         col1, col2, col3 = st.columns(3)
-        col1.metric("Total Projects", len(project_df))
-        col2.metric("Not-Assigned Employees", len(employee_df[employee_df['Are you currently assigned to a project?'].str.lower() == 'no']))
+        col1.metric("Total Projects", result['total_projects'])
+        col2.metric("Not-Assigned Employees", result['unassigned'])
         col3.metric("Matching Criteria", "Skills, Tools, Languages, Certifications")
+        if result['skipped_records']:
+            st.warning(f"⚠️ {result['skipped_records']} employee record(s) without an Id were not saved to the roster.")
+
+        update = result['update']
+        if update is not None and not update['first_run'] and (update['rescored_employees'] or update['rescored_projects']):
+            st.info(
+                f"🔄 Rescored {update['rescored_employees']} employee(s) and {update['rescored_projects']} project(s). "
+                f"Top matches changed for: {', '.join(update['changed_projects']) or 'no projects'}."
+            )
         
-        # Run matching logic
-        assignments, updated_available_emps, updated_employee_df = assign_employees_to_projects(project_df, employee_df)
-        
-        st.markdown("### 🧠 Project Assignments")
-        for project_name, df in assignments.items():
-            st.subheader(f"📌 {project_name}")
-            if df.empty:
-                st.warning("No matching employees found.")
-            else:
-                df_display = df.reset_index(drop=True)
-                df_display.index += 1  # 📌 Start index from 1
-                df_display.index.name = "S.No."  # Optional: Name the index column
-                st.dataframe(df_display, use_container_width=True)
+        results_tab, whatif_tab = st.tabs(["🧠 Project Assignments", "🔮 What-if Scenarios"])
+        with results_tab:
+            st.markdown("### 🧠 Project Assignments")
+            # Switching projects only redraws a cached table
+            shown = st.selectbox("Show project", ["All projects"] + list(assignments))
+            for project_name in (assignments if shown == "All projects" else [shown]):
+                df = assignments[project_name]
+                st.subheader(f"📌 {project_name}")
+                if df.empty:
+                    st.warning("No matching employees found.")
+                else:
+                    df_display = df.reset_index(drop=True)
+                    df_display.index += first_row  # 📌 Start index from the first rank shown
+                    df_display.index.name = "S.No."  # Optional: Name the index column
+                    st.dataframe(df_display, use_container_width=True)
+
+        with whatif_tab:
+            st.caption("Try changes without editing and re-uploading the files. Scenarios start from the uploaded "
+                       "files and store only their edits; the roster and its scores are shared by all of them.")
+            # The base is scored in the background, only on request, with the settings of the matching run;
+            # once built it stays with the session (new uploads or scoring settings start over)
+            base_settings = (
+                int(workers), match_synonyms, tuple(weights.items()), relevant_certifications, use_store,
+                project_dates, plan_date,
+            )
+            base_key = ('whatif', *hashes, base_settings)
+            whatif = st.session_state.get('whatif')
+            if whatif is None or whatif['key'] != base_key:
+                whatif = None
+                base_job = st.session_state.jobs.get(base_key)
+                if base_job is None and st.button("🔮 Score the roster for scenarios"):
+                    base_job = st.session_state.jobs.get_or_submit(
+                        base_key, build_scenario_base, emp_file, proj_file, base_settings
+                    )
+                if base_job is None:
+                    st.info("Scenarios share one scoring of the whole roster; press the button above to build it.")
+                elif not base_job.done:
+                    st.progress(base_job.progress, text=f"⏳ {base_job.message}... ({base_job.elapsed:.0f}s)")
+                    time.sleep(POLL_SECONDS)
+                    st.rerun()
+                elif base_job.error is not None:
+                    raise base_job.error
+                else:
+                    whatif = {'key': base_key, **base_job.result()}
+                    st.session_state.whatif = whatif
+                    # The session holds the base from here on; the job slot is left to matching runs
+                    st.session_state.jobs.discard(base_key)
+            if whatif is not None:
+                base, scenarios = whatif['base'], whatif['scenarios']
+                project_names = list(base.projects['Project Name'])
+
+                with st.form("whatif_change"):
+                    target = st.selectbox("Add the change to", ["New scenario"] + list(scenarios))
+                    new_name = st.text_input("New scenario name", value=f"Scenario {len(scenarios) + 1}")
+                    change = st.radio("Change", ["Extend end dates", "Add people to a project"], horizontal=True)
+                    interns = st.multiselect("Interns", list(whatif['labels']), format_func=whatif['labels'].get)
+                    days = st.number_input("Extend end dates by (days)", min_value=-365, max_value=365, value=14)
+                    seats_project = st.selectbox("Project", project_names)
+                    seats = st.number_input("Additional people needed (negative to remove)",
+                                            min_value=-50, max_value=50, value=1)
+                    apply_change = st.form_submit_button("➕ Apply change")
+                if apply_change:
+                    name = new_name.strip()
+                    if target == "New scenario" and (not name or name == 'Base' or name in scenarios):
+                        st.warning("⚠️ Pick a scenario name that is not used yet.")
+                    else:
+                        scenario = scenarios[target] if target in scenarios else base.scenario(name)
+                        if change == "Extend end dates":
+                            scenario.extend_end_dates(interns, days)
+                        else:
+                            scenario.add_seats(seats_project, seats)
+                        scenarios[scenario.name] = scenario
+
+                if scenarios:
+                    # Only edited interns and projects are rescored; unchanged rankings come from the shared base
+                    mode = VIEW_MODES[view_mode]
+                    results = {
+                        name: scenario.evaluate(mode, int(top_n), int(max_projects))
+                        for name, scenario in [('Base', whatif['baseline']), *scenarios.items()]
+                    }
+                    st.markdown(f"#### Scenario Comparison ({view_mode})")
+                    st.dataframe(compare_totals(results), use_container_width=True)
+                    by_project = compare_projects(results)
+                    by_project.columns = [f"{scenario} · {metric}" for scenario, metric in by_project.columns]
+                    st.dataframe(by_project, use_container_width=True)
+
+                    compared = st.selectbox("Compare project", project_names, key="whatif_project")
+                    for column, (name, scenario_result) in zip(st.columns(len(results)), results.items()):
+                        column.markdown(f"**{name}**")
+                        column.dataframe(scenario_result.table(compared), use_container_width=True, hide_index=True)
+
+                    with st.expander("✏️ Scenario edits"):
+                        for name, scenario in list(scenarios.items()):
+                            st.markdown(f"**{name}**")
+                            st.dataframe(scenario.changes().astype({'Value': str}), use_container_width=True,
+                                         hide_index=True)
+                            if st.button(f"🗑️ Remove {name}", key=f"whatif_remove_{name}"):
+                                scenarios.pop(name)
+                                st.rerun()
+                else:
+                    st.info("Apply a change above to create a scenario; it is then compared side by side with the uploads.")
         
         # Download results
         st.markdown("### 📥 Download Results")
-        excel_data = to_excel_download(assignments)
-        st.download_button(
-            label="📥 Download Project Assignments (Excel)",
-            data=excel_data,
-            file_name="ProjectAssignments.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            help="Download the matched employee assignments for all projects."
+        export_format = st.selectbox(
+            "Export format", list(EXPORT_FORMATS),
+            help="Single-sheet, CSV and Parquet exports put every project in one table with a 'Project' column."
         )
+        extension, mime = EXPORT_FORMATS[export_format]
+        # The export is only built when requested, then kept with the cached results
+        exports = st.session_state.exports
+        # Top matches export the page shown
+        export_key = (page_key, export_format)
+        if export_key not in exports and st.button("📦 Prepare Download"):
+            with Trace() if record_performance else contextlib.nullcontext() as export_trace:
+                exports[export_key] = export_assignments(assignments, export_format).getvalue()
+            if export_trace is not None:
+                st.session_state.export_stages[export_key] = export_trace.records
+            while len(exports) > MAX_CACHED_JOBS:
+                stale = next(iter(exports))
+                exports.pop(stale)
+                st.session_state.export_stages.pop(stale, None)
+        if export_key in exports:
+            st.download_button(
+                label=f"📥 Download Project Assignments ({extension.upper()})",
+                data=exports[export_key],
+                file_name=f"ProjectAssignments.{extension}",
+                mime=mime,
+                help="Download the matched employee assignments for all projects."
+            )
+
+        if any(diagnostics) and result['diagnostics'] != diagnostics:
+            st.info("⏱️ These results were matched with other diagnostics settings.")
+            if st.button("🔁 Rerun with diagnostics", help="Match again to record the chosen diagnostics."):
+                st.session_state.jobs.discard(key)
+                st.rerun()
+
+        trace = result['trace']
+        if trace is not None and any(diagnostics):
+            with st.expander("⏱️ Performance", expanded=False):
+                records = (trace.records + st.session_state.page_stages.get(page_key, [])
+                           + st.session_state.export_stages.get(export_key, []))
+                st.caption(f"Background job finished in {job.elapsed:.2f}s. "
+                           "mem_mb is the change in process memory over the stage.")
+                st.dataframe(performance_table(records), use_container_width=True, hide_index=True)
+                if trace.profiler is not None:
+                    st.code(trace.profile_text(limit=25), language=None)
         
     except Exception as e:
         st.error(f"❌ Error processing project file: {e}")
 else:
-    st.info("⬆️ Please upload a project requirements and employee data Excel file to begin.")
\ No newline at end of file
+    st.info("⬆️ Please upload a project requirements and employee data Excel file to begin.")
@@ -0,0 +1,28 @@
+"""Matching engine shared by the Workforce Planning Tool apps.
+
+Importing the package is cheap: pandas, NumPy and SciPy are only loaded
+when one of the attributes below is first used.
+"""
+
+from importlib import import_module
+
+# Public name -> defining submodule, resolved lazily on first access
+_EXPORTS = {
+    'MATCH_FIELDS': 'workforce.matching',
+    'SkillMatrix': 'workforce.matching',
+    'compute_match_matrix': 'workforce.matching',
+    'SkillVocabulary': 'workforce.vocabulary',
+    'load_table': 'workforce.ingest',
+    'export_assignments': 'workforce.export',
+    'run_matching': 'workforce.batch',
+    'run_scenario': 'workforce.batch',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'workforce' has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,92 @@
+import numpy as np
+
+from workforce.compact import as_score_matrix
+
+# -------------------- Greedy Assignment --------------------
+
+def greedy_assignment(scores, seats):
+    """Project-by-project allocation in row order, as version2.py's loop does it.
+
+    Each project takes its best remaining employees (including zero matches)
+    and removes them from the pool. Returns the assigned project column per
+    employee, -1 for unassigned.
+    """
+    scores = as_score_matrix(scores)
+    assigned = np.full(scores.shape[0], -1, dtype=np.int64)
+    available = np.ones(scores.shape[0], dtype=bool)
+    for col, need in enumerate(seats):
+        pool = np.flatnonzero(available)
+        if need <= 0 or len(pool) == 0:
+            continue
+        # Stable sort so ties keep roster order
+        chosen = pool[np.argsort(-scores[pool, col], kind='stable')[:need]]
+        assigned[chosen] = col
+        available[chosen] = False
+    return assigned
+
+# -------------------- Optimal Assignment --------------------
+
+def optimal_assignment(scores, seats, ids=None, min_score=0):
+    """Globally optimal employee -> project allocation maximizing total Match %.
+
+    Every project column is expanded into one column per seat and the
+    resulting employee x seat matrix is solved as a rectangular assignment
+    problem (Hungarian / Jonker-Volgenant via SciPy). Each project only keeps
+    its top sum(seats) candidates, which cannot change the optimum: an
+    employee ranked lower for a project can always be swapped for a free,
+    better-ranked one. Pairs scoring <= min_score are never assigned. Rows are
+    solved in ids order so the result does not depend on how the sheet is sorted.
+    Only the pruned candidates' scores are copied (scores may be a MatchCounts).
+
+    Returns the assigned project column per employee, -1 for unassigned.
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    scores = as_score_matrix(scores)
+    seats = np.maximum(np.asarray(seats, dtype=np.int64), 0)
+    n_employees, n_projects = scores.shape
+    assigned = np.full(n_employees, -1, dtype=np.int64)
+    total_seats = int(seats.sum())
+    if n_employees == 0 or total_seats == 0:
+        return assigned
+
+    order = np.argsort(ids, kind='stable') if ids is not None else np.arange(n_employees)
+
+    # Candidate pruning: union of each project's top total_seats rows
+    keep = np.zeros(n_employees, dtype=bool)
+    for col in range(n_projects):
+        if seats[col] == 0:
+            continue
+        column = scores[:, col]
+        positive = np.flatnonzero(column > min_score)
+        if len(positive) > total_seats:
+            kth = np.partition(column[positive], -total_seats)[-total_seats]
+            positive = positive[column[positive] >= kth]
+        keep[positive] = True
+    # Kept rows in ids order
+    rows = order[keep[order]]
+    if len(rows) == 0:
+        return assigned
+
+    seat_cols = np.repeat(np.arange(n_projects), seats)
+    gain = np.asarray(scores[np.ix_(rows, seat_cols)], dtype=np.float64)
+    gain[gain <= min_score] = 0
+    row_ind, col_ind = linear_sum_assignment(gain, maximize=True)
+
+    matched = gain[row_ind, col_ind] > 0
+    assigned[rows[row_ind[matched]]] = seat_cols[col_ind[matched]]
+    return assigned
+
+# -------------------- Helpers --------------------
+
+def assignment_score(scores, assigned):
+    """Total Match % of an assignment vector."""
+    rows = np.flatnonzero(assigned >= 0)
+    return float(as_score_matrix(scores)[rows, assigned[rows]].sum())
+
+def project_members(assigned, col, scores=None):
+    """Positions assigned to a project column, best match first when scores are given."""
+    members = np.flatnonzero(assigned == col)
+    if scores is not None:
+        members = members[np.argsort(-as_score_matrix(scores)[members, col], kind='stable')]
+    return members
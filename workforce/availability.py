@@ -0,0 +1,261 @@
+"""Employee availability over time: stays, weekly hours and booked intervals, queried by date window.
+
+filter_valid_employees answers one fixed question (unassigned, end date more
+than VALID_AFTER_DAYS away). An AvailabilityCalendar answers it for any
+window, and for many windows at once:
+
+    calendar = AvailabilityCalendar.from_intern_records(employees)
+    calendar.free_employees('2025-03-01', '2025-07-01', hours=20)   # free >= 20 h/week, March-June
+    starts, stops = project_windows(projects_df)
+    mask = calendar.available(starts, stops, hours_per_person)      # employees x projects, one batched query
+
+All intervals are half-open day ranges [start, stop): an intern is available
+from their start date until (not including) their end date, and a project
+window runs from its start date until its estimated end date.
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from workforce.compact import CHUNK_CELLS
+from workforce.normalize import ASSIGNED_FLAG, END_DATE, available_hours, is_unassigned
+
+START_DATE = 'Please Enter Your Start Date'
+PROJECT_START = 'Project Start Date'
+PROJECT_END = 'Estimated End Date'
+
+# filter_valid_employees' horizon: the end date must be more than this many days away
+VALID_AFTER_DAYS = 15
+
+# Day number standing in for a missing date (before any real date)
+NO_DAY = np.iinfo(np.int64).min // 2
+
+# -------------------- Dates --------------------
+
+def planning_date(today=None):
+    """The reference date as a midnight Timestamp (today when None)."""
+    return pd.Timestamp(today if today is not None else date.today()).normalize()
+
+def day_numbers(values, missing=NO_DAY):
+    """Dates (strings, datetimes or day numbers) as int64 days since 1970-01-01; unparseable -> missing."""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return values.astype(np.int64)
+    days = pd.to_datetime(pd.Series(values.ravel()), errors='coerce').to_numpy().astype('datetime64[D]')
+    return np.where(np.isnat(days), missing, days.astype(np.int64))
+
+def horizon(today=None):
+    """filter_valid_employees' window as (start, stop) day numbers: today until VALID_AFTER_DAYS from now."""
+    start = day_numbers([planning_date(today)])[0]
+    return start, start + VALID_AFTER_DAYS + 1
+
+def project_windows(projects_df, today=None):
+    """(starts, stops) day numbers per project, never starting before today.
+
+    Projects without a start date start today; without an end date (or with
+    one that leaves nothing to staff) they fall back to the fixed horizon.
+    """
+    first, default_length = horizon(today)
+    default_length -= first
+    starts = day_numbers(projects_df[PROJECT_START]) if PROJECT_START in projects_df.columns \
+        else np.full(len(projects_df), NO_DAY)
+    stops = day_numbers(projects_df[PROJECT_END]) if PROJECT_END in projects_df.columns \
+        else np.full(len(projects_df), NO_DAY)
+    starts = np.maximum(starts, first)
+    stops = np.where(stops > starts, stops, starts + default_length)
+    return starts, stops
+
+# -------------------- Calendar --------------------
+
+class AvailabilityCalendar:
+    """Per-employee stay, weekly hours and booked hours, indexed for batched window queries.
+
+    Bookings (employee position, start, stop, hours/week) are merged per
+    employee into a step function of booked hours. Its segments are kept in
+    flat arrays sorted by employee and start (the interval index), with one
+    offset per booked employee. Free hours over a window are the weekly hours
+    minus the busiest booked week inside it, or 0 unless the stay covers the
+    whole window. Employees without bookings need only their stay, so a
+    query for P windows costs O(employees x P) comparisons plus
+    O(booked segments x P).
+    """
+
+    def __init__(self, starts, ends, weekly_hours, bookings=None):
+        self.starts = day_numbers(starts)
+        # A missing end date leaves no stay (the filter_valid_employees rule)
+        self.ends = day_numbers(ends)
+        self.weekly_hours = np.asarray(weekly_hours, dtype=np.float64)
+        if bookings is None:
+            bookings = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64),
+                        np.zeros(0, dtype=np.int64), np.zeros(0))
+        emps, b_starts, b_stops, hours = bookings
+        self.bookings = (np.asarray(emps, dtype=np.int64), day_numbers(b_starts), day_numbers(b_stops),
+                         np.asarray(hours, dtype=np.float64))
+        self._index()
+
+    @classmethod
+    def from_intern_records(cls, df, bookings=None, assigned_booked=True):
+        """Calendar for normalized InternRecords rows, in row order.
+
+        The assignment flag carries no dates, so interns flagged as assigned
+        are booked for their whole stay; pass assigned_booked=False with
+        explicit bookings to plan around their actual assignments instead.
+        """
+        starts = df[START_DATE] if START_DATE in df.columns else np.full(len(df), NO_DAY)
+        weekly = available_hours(df['Availability']).astype(np.float64)
+        if assigned_booked:
+            weekly = np.where(is_unassigned(df[ASSIGNED_FLAG]), weekly, 0.0)
+        return cls(starts, df[END_DATE], weekly, bookings)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _index(self):
+        """Merge the bookings into per-employee segments of constant booked hours."""
+        emps, starts, stops, hours = self.bookings
+        keep = (stops > starts) & (hours != 0)
+        emps, starts, stops, hours = emps[keep], starts[keep], stops[keep], hours[keep]
+        owner = np.concatenate([emps, emps])
+        times = np.concatenate([starts, stops])
+        delta = np.concatenate([hours, -hours])
+        order = np.lexsort((times, owner))
+        owner, times, delta = owner[order], times[order], delta[order]
+
+        # Running booked hours per employee (each employee's deltas sum to zero)
+        load = np.cumsum(delta)
+        first = np.r_[True, owner[1:] != owner[:-1]] if len(owner) else np.zeros(0, dtype=bool)
+        load -= (load - delta)[np.flatnonzero(first)][np.cumsum(first) - 1] if len(owner) else 0
+
+        segment = (owner[:-1] == owner[1:]) & (times[1:] > times[:-1]) & (load[:-1] > 1e-9)
+        self._seg_owner = owner[:-1][segment]
+        self._seg_start = times[:-1][segment]
+        self._seg_stop = times[1:][segment]
+        self._seg_load = load[:-1][segment]
+        self.booked, self._offsets = np.unique(self._seg_owner, return_index=True)
+
+    def with_bookings(self, employees, starts, stops, hours):
+        """A new calendar with these bookings (employee positions, dates, hours/week) added."""
+        added = (np.asarray(employees, dtype=np.int64), day_numbers(starts), day_numbers(stops),
+                 np.broadcast_to(np.asarray(hours, dtype=np.float64), np.shape(employees)))
+        bookings = tuple(np.concatenate([old, new]) for old, new in zip(self.bookings, added))
+        return type(self)(self.starts, self.ends, self.weekly_hours, bookings)
+
+    def segments(self, emp):
+        """(start, stop, booked hours) segments of one employee, in date order."""
+        pos = np.searchsorted(self.booked, emp)
+        if pos == len(self.booked) or self.booked[pos] != emp:
+            return []
+        stop = self._offsets[pos + 1] if pos + 1 < len(self._offsets) else len(self._seg_owner)
+        rows = slice(self._offsets[pos], stop)
+        return list(zip(self._seg_start[rows].tolist(), self._seg_stop[rows].tolist(),
+                        self._seg_load[rows].tolist()))
+
+    # -------------------- Queries --------------------
+
+    def _free(self, starts, stops):
+        """Free hours/week over each window for every employee (employees x windows)."""
+        covers = (self.starts[:, None] <= starts) & (self.ends[:, None] >= stops)
+        free = np.where(covers, self.weekly_hours[:, None], 0.0)
+        if len(self._seg_owner):
+            overlap = (self._seg_start[:, None] < stops) & (self._seg_stop[:, None] > starts)
+            peak = np.maximum.reduceat(np.where(overlap, self._seg_load[:, None], 0.0), self._offsets, axis=0)
+            free[self.booked] -= peak
+        return np.maximum(free, 0.0)
+
+    def _chunks(self, n_windows):
+        step = max(1, CHUNK_CELLS // max(len(self), len(self._seg_owner), 1))
+        for first in range(0, n_windows, step):
+            yield slice(first, min(first + step, n_windows))
+
+    def free_hours(self, starts, stops):
+        """Free hours/week of every employee across each [start, stop) window (employees x windows)."""
+        starts, stops = day_numbers(starts), day_numbers(stops)
+        out = np.empty((len(self), len(starts)))
+        for cols in self._chunks(len(starts)):
+            out[:, cols] = self._free(starts[cols], stops[cols])
+        return out
+
+    def available(self, starts, stops, hours=0):
+        """Employees x windows mask: free hours > 0 and >= hours (a scalar or one value per window)."""
+        starts, stops = day_numbers(starts), day_numbers(stops)
+        hours = np.broadcast_to(np.asarray(hours, dtype=np.float64), starts.shape)
+        out = np.empty((len(self), len(starts)), dtype=bool)
+        for cols in self._chunks(len(starts)):
+            free = self._free(starts[cols], stops[cols])
+            out[:, cols] = (free > 0) & (free >= hours[cols])
+        return out
+
+    def free_employees(self, start, stop, hours=0):
+        """Positions of the employees with free hours > 0 and >= hours across one window."""
+        return np.flatnonzero(self.available([start], [stop], hours)[:, 0])
+
+# -------------------- Scheduling --------------------
+
+def _peak(intervals, start, stop):
+    """Highest summed hours over [start, stop) of (start, stop, hours) intervals."""
+    inside = [(s, e, h) for s, e, h in intervals if s < stop and e > start]
+    if not inside:
+        return 0.0
+    return max(sum(h for s, e, h in inside if s <= t < e) for t in {max(s, start) for s, _, _ in inside})
+
+class CalendarLedger:
+    """CapacityLedger counterpart that books hours inside each project's date window.
+
+    An employee's hours are only spent for the weeks a project runs, so an
+    intern can take one project in spring and another in summer at full
+    hours. employee_hours reports what is left in each employee's busiest
+    week.
+    """
+
+    def __init__(self, calendar, windows, current_projects, project_hours, max_projects):
+        self.calendar = calendar
+        self.window_starts, self.window_stops = (day_numbers(w) for w in windows)
+        self.employee_hours = calendar.weekly_hours.copy()
+        self.employee_projects = np.asarray(current_projects, dtype=np.int64).copy()
+        self.project_hours = np.asarray(project_hours, dtype=np.float64).copy()
+        self.max_projects = max_projects
+        self._intervals = {}
+        self._employees, self._projects, self._hours = [], [], []
+
+    def employee_open(self, emp):
+        """Whether an employee has weekly hours and a free project slot."""
+        return self.calendar.weekly_hours[emp] > 0 and self.employee_projects[emp] < self.max_projects
+
+    def project_open(self, proj):
+        """Whether a project still needs hours."""
+        return self.project_hours[proj] > 0
+
+    def free_hours(self, emp, proj):
+        """Hours/week the employee has left across the project's window."""
+        start, stop = self.window_starts[proj], self.window_stops[proj]
+        calendar = self.calendar
+        if calendar.starts[emp] > start or calendar.ends[emp] < stop:
+            return 0.0
+        if emp not in self._intervals:
+            self._intervals[emp] = calendar.segments(emp)
+        return max(calendar.weekly_hours[emp] - _peak(self._intervals[emp], start, stop), 0.0)
+
+    def book(self, emp, proj, hours):
+        """Book up to `hours` of an employee onto a project's window; returns the hours actually booked."""
+        hours = min(hours, self.free_hours(emp, proj), self.project_hours[proj])
+        if hours <= 0:
+            return 0
+        intervals = self._intervals[emp]
+        intervals.append((self.window_starts[proj], self.window_stops[proj], hours))
+        self.employee_hours[emp] = self.calendar.weekly_hours[emp] - _peak(intervals, NO_DAY, -NO_DAY)
+        self.employee_projects[emp] += 1
+        self.project_hours[proj] -= hours
+        self._employees.append(emp)
+        self._projects.append(proj)
+        self._hours.append(hours)
+        return hours
+
+    def allocations(self):
+        """Booked (employee position, project column, hours) triples as arrays."""
+        return (
+            np.asarray(self._employees, dtype=np.int64),
+            np.asarray(self._projects, dtype=np.int64),
+            np.asarray(self._hours, dtype=np.float64),
+        )
@@ -0,0 +1,151 @@
+"""Headless matching runs: the same pipelines as the Streamlit apps, without the UI.
+
+Heavy dependencies (pandas, openpyxl, SciPy) are imported inside the
+functions, so importing this module, or the CLI built on it, stays fast.
+"""
+
+import os
+import time
+from importlib import import_module
+
+# schema -> (backend module, employee normalizer in workforce.normalize, default mode)
+SCHEMAS = {
+    'realdata': ('workforce.realdata', 'normalize_intern_records', 'top'),
+    'version2': ('workforce.version2', 'normalize_employee_data', 'greedy'),
+}
+
+# (schema, mode) -> backend function name
+RUNNERS = {
+    ('realdata', 'top'): 'assign_employees_to_projects',
+    ('realdata', 'optimal'): 'allocate_employees_to_projects',
+    ('realdata', 'hours'): 'schedule_employee_hours',
+    ('version2', 'greedy'): 'assign_employees_to_projects',
+    ('version2', 'optimal'): 'optimize_employee_assignments',
+    ('version2', 'hours'): 'schedule_employee_hours',
+}
+
+MODES = sorted({mode for _, mode in RUNNERS})
+
+# Output file extension -> export format label in workforce.export.EXPORT_FORMATS
+OUTPUT_FORMATS = {
+    '.xlsx': 'Excel (one sheet per project)',
+    '.csv': 'CSV (single table)',
+    '.parquet': 'Parquet (single table)',
+}
+
+def detect_schema(employee_df):
+    """'realdata' for InternRecords-style exports (Name1 column), otherwise 'version2'."""
+    return 'realdata' if 'Name1' in employee_df.columns or 'Please Enter Your End Date' in employee_df.columns \
+        else 'version2'
+
+def run_matching(employee_df, project_df, schema='realdata', mode=None, top_n=10, max_projects=None, workers=1,
+                 synonyms=True, weights=None, explain=False, skill_vocabulary=None, project_dates=False, today=None):
+    """Run one matching pipeline on already-loaded frames; returns {project name: DataFrame}.
+
+    workers > 1 scores across a process pool; synonyms=False restores exact
+    token matching; weights ({criterion: weight}) or explain=True score with
+    a ScoringModel and add '<criterion> pts' breakdown columns;
+    project_dates=True checks availability against each project's dates, as
+    of `today` (all realdata schema only; version2 always uses canonical
+    skills). skill_vocabulary replaces the fresh SkillVocabulary used when
+    synonyms is on.
+    """
+    backend, _, default_mode = SCHEMAS[schema]
+    mode = mode or default_mode
+    if (schema, mode) not in RUNNERS:
+        raise ValueError(f"Mode '{mode}' is not available for the {schema} schema")
+    runner = getattr(import_module(backend), RUNNERS[(schema, mode)])
+
+    kwargs = {}
+    if schema == 'realdata':
+        from workforce.vocabulary import SkillVocabulary
+        kwargs = {'workers': workers, 'skill_vocabulary': (skill_vocabulary or SkillVocabulary()) if synonyms else None}
+        if weights or explain:
+            from workforce.scoring import ScoringModel
+            kwargs['scoring'] = ScoringModel(weights)
+        if project_dates:
+            kwargs['project_dates'] = True
+        if today is not None:
+            kwargs['today'] = today
+    if mode == 'top':
+        kwargs['top_n'] = top_n
+    elif mode == 'hours' and max_projects is not None:
+        kwargs['max_projects'] = max_projects
+    assignments, _, _ = runner(project_df, employee_df, **kwargs)
+    return assignments
+
+def run_scenario(scenario, use_disk_cache=True):
+    """Load inputs, match and write the output file for one scenario dict; returns a summary dict.
+
+    Keys: employees, projects, output (required); schema ('auto'), mode,
+    top_n, max_projects, workers, synonyms, weights, explain, project_dates, today, single_sheet.
+    Inputs go through load_table, so
+    scenarios sharing a file parse it only once per process.
+
+    With 'store' (a RosterStore path, realdata schema), the employees file is
+    optional: when given it is upserted, and matching runs on the store's
+    valid interns, narrowed to the candidates for these projects.
+    """
+    from workforce import normalize
+    from workforce.export import export_assignments
+    from workforce.ingest import CACHE_DIR, load_table
+    from workforce.profiling import span
+
+    start = time.perf_counter()
+    cache_dir = CACHE_DIR if use_disk_cache else None
+    schema = scenario.get('schema', 'auto')
+    project_df = load_table(scenario['projects'], cache_dir=cache_dir)
+    skill_vocabulary = None
+    if scenario.get('store'):
+        from workforce.store import RosterStore
+        from workforce.vocabulary import SkillVocabulary
+
+        if schema not in ('auto', 'realdata'):
+            raise ValueError("A roster store holds realdata (InternRecords) employees only")
+        schema = 'realdata'
+        # Pruning and scoring share one vocabulary so both resolve skills the same way
+        skill_vocabulary = SkillVocabulary() if scenario.get('synonyms', True) else None
+        with RosterStore(scenario['store']) as store:
+            if scenario.get('employees'):
+                store.upsert_records(load_table(scenario['employees'], cache_dir=cache_dir))
+            store.upsert_projects(project_df)
+            # Project dates replace the fixed horizon the store's valid filter applies
+            employee_df = store.employees(valid_only=not scenario.get('project_dates'), projects=project_df,
+                                          skill_vocabulary=skill_vocabulary, today=scenario.get('today'))
+    elif schema == 'auto':
+        # Parse once (cached), then normalize for whichever schema the columns reveal
+        raw = load_table(scenario['employees'], cache_dir=cache_dir)
+        schema = detect_schema(raw)
+        with span('normalize', rows=len(raw)):
+            employee_df = getattr(normalize, SCHEMAS[schema][1])(raw)
+    else:
+        normalizer = getattr(normalize, SCHEMAS[schema][1])
+        employee_df = load_table(scenario['employees'], normalize=normalizer, cache_dir=cache_dir)
+
+    with span('match', schema=schema):
+        assignments = run_matching(
+            employee_df, project_df, schema=schema, mode=scenario.get('mode'),
+            top_n=int(scenario.get('top_n', 10)), max_projects=scenario.get('max_projects'),
+            workers=int(scenario.get('workers') or 1), synonyms=scenario.get('synonyms', True),
+            weights=scenario.get('weights'), explain=scenario.get('explain', False),
+            skill_vocabulary=skill_vocabulary, project_dates=scenario.get('project_dates', False),
+            today=scenario.get('today'),
+        )
+
+    output = scenario['output']
+    ext = os.path.splitext(output)[1].lower()
+    if ext not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output type '{ext}' (use {', '.join(OUTPUT_FORMATS)})")
+    fmt = 'Excel (single sheet)' if ext == '.xlsx' and scenario.get('single_sheet') else OUTPUT_FORMATS[ext]
+    data = export_assignments(assignments, fmt)
+    with span('write'), open(output, 'wb') as fh:
+        fh.write(data.getvalue())
+
+    return {
+        'output': output,
+        'schema': schema,
+        'mode': scenario.get('mode') or SCHEMAS[schema][2],
+        'projects': len(assignments),
+        'matched_rows': int(sum(len(df) for df in assignments.values())),
+        'seconds': round(time.perf_counter() - start, 3),
+    }
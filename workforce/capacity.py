@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+from workforce.compact import as_score_matrix
+from workforce.ranking import RankingIndex
+
+# Weekly hours per person when a project's commitment can't be parsed (e.g. 'TBD')
+DEFAULT_COMMITMENT_HOURS = 10
+# Most projects one employee can hold at once, including 'Current Projects'
+DEFAULT_MAX_PROJECTS = 3
+
+# -------------------- Capacity Ledger --------------------
+
+class CapacityLedger:
+    """Remaining employee hours, project hours and project counts kept in flat arrays.
+
+    Employees and projects are addressed by position, so booking is O(1)
+    array arithmetic instead of a DataFrame .loc write per assignment.
+    """
+
+    def __init__(self, available_hours, current_projects, project_hours, max_projects=DEFAULT_MAX_PROJECTS):
+        self.employee_hours = np.asarray(available_hours, dtype=np.float64).copy()
+        self.employee_projects = np.asarray(current_projects, dtype=np.int64).copy()
+        self.project_hours = np.asarray(project_hours, dtype=np.float64).copy()
+        self.max_projects = max_projects
+        self._employees, self._projects, self._hours = [], [], []
+
+    def employee_open(self, emp):
+        """Whether an employee still has hours and a free project slot."""
+        return self.employee_hours[emp] > 0 and self.employee_projects[emp] < self.max_projects
+
+    def project_open(self, proj):
+        """Whether a project still needs hours."""
+        return self.project_hours[proj] > 0
+
+    def book(self, emp, proj, hours):
+        """Book up to `hours` of an employee onto a project; returns the hours actually booked.
+
+        Any booking takes one of the employee's project slots, even a last
+        sliver of hours: the schedule counts projects per assignment, as the
+        original per-row loop did, and there is no minimum booking size.
+        """
+        hours = min(hours, self.employee_hours[emp], self.project_hours[proj])
+        if hours <= 0:
+            return 0
+        self.employee_hours[emp] -= hours
+        self.employee_projects[emp] += 1
+        self.project_hours[proj] -= hours
+        self._employees.append(emp)
+        self._projects.append(proj)
+        self._hours.append(hours)
+        return hours
+
+    def allocations(self):
+        """Booked (employee position, project column, hours) triples as arrays."""
+        return (
+            np.asarray(self._employees, dtype=np.int64),
+            np.asarray(self._projects, dtype=np.int64),
+            np.asarray(self._hours, dtype=np.float64),
+        )
+
+# -------------------- Scheduler --------------------
+
+def schedule_hours(scores, ids, ledger, hours_per_person, min_score=0, pool_size=50):
+    """Split employees' weekly hours across projects, best matches first.
+
+    Each open project offers its next `pool_size` ranked candidates (taken
+    from a RankingIndex, so nobody is resorted); all offered (employee,
+    project) pairs are booked in descending Match % order. Projects that are
+    still short after a round double their pool until they are filled or run
+    out of candidates. Returns the ledger.
+
+    pool_size must be at least 1 (a project offering nobody would never fill
+    or run out); ValueError otherwise.
+    """
+    if pool_size < 1:
+        raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+    scores = as_score_matrix(scores)
+    ids = np.asarray(ids)
+    hours_per_person = np.asarray(hours_per_person, dtype=np.float64)
+    n_projects = scores.shape[1]
+    ranking = RankingIndex(scores, ids, min_score)
+    offered = np.zeros(n_projects, dtype=np.int64)
+    pool = np.full(n_projects, pool_size, dtype=np.int64)
+    exhausted = np.zeros(n_projects, dtype=bool)
+
+    while True:
+        open_projects = [p for p in range(n_projects) if ledger.project_open(p) and not exhausted[p]]
+        if not open_projects:
+            break
+        pair_emps, pair_projs = [], []
+        for proj in open_projects:
+            ranked = ranking.top(proj, pool[proj])
+            new = ranked[offered[proj]:]
+            if len(ranked) < pool[proj]:
+                exhausted[proj] = True
+            offered[proj] = len(ranked)
+            pool[proj] *= 2
+            pair_emps.append(new)
+            pair_projs.append(np.full(len(new), proj, dtype=np.int64))
+        emps = np.concatenate(pair_emps)
+        projs = np.concatenate(pair_projs)
+        if len(emps) == 0:
+            continue
+        order = np.lexsort((projs, ids[emps], -scores[emps, projs]))
+        for emp, proj in zip(emps[order], projs[order]):
+            if ledger.project_open(proj) and ledger.employee_open(emp):
+                ledger.book(emp, proj, hours_per_person[proj])
+    return ledger
+
+# -------------------- Column Helpers --------------------
+
+def parse_weekly_hours(commitment, default=DEFAULT_COMMITMENT_HOURS):
+    """Leading number of free-text commitments like '5 hrs/week', '8/week' or 30."""
+    hours = pd.to_numeric(commitment.astype(str).str.extract(r'(\d+(?:\.\d+)?)')[0], errors='coerce')
+    return hours.fillna(default).to_numpy(dtype=np.float64)
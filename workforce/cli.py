@@ -0,0 +1,122 @@
+"""``workforce-match``: run the employee/project matcher from the command line.
+
+Examples:
+    workforce-match InternRecords.xlsx Projects.xlsx -o ProjectAssignments.xlsx
+    workforce-match InternRecords.xlsx Projects.xlsx -o matches.parquet --mode optimal
+    workforce-match --scenarios nightly.json
+    workforce-match InternRecords.xlsx Projects.xlsx -o out.xlsx --trace --profile match.prof
+    workforce-match NewRecords.xlsx Projects.xlsx -o out.xlsx --store roster.sqlite
+    workforce-match InternRecords.xlsx Projects.xlsx -o plan.xlsx --mode hours --project-dates --as-of 2025-03-01
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+
+from workforce.batch import MODES, SCHEMAS, run_scenario
+
+def parse_weights(text):
+    """'Languages=2,Tools=0.5' -> {'Languages': 2.0, 'Tools': 0.5}."""
+    weights = {}
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        criterion, sep, value = item.partition('=')
+        try:
+            weights[criterion.strip()] = float(value)
+        except ValueError:
+            sep = ''
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected CRITERION=WEIGHT, got '{item}'")
+    return weights
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='workforce-match',
+        description='Match employees to projects without starting the Streamlit UI.',
+    )
+    parser.add_argument('employees', nargs='?', help='Employee file (.xlsx, .csv or .parquet)')
+    parser.add_argument('projects', nargs='?', help='Project requirements file (.xlsx, .csv or .parquet)')
+    parser.add_argument('-o', '--output', help='Output file: .xlsx (one sheet per project), .csv or .parquet')
+    parser.add_argument('--schema', choices=['auto'] + sorted(SCHEMAS), default='auto',
+                        help='Input layout: realdata (InternRecords export) or version2 (employee_datav2)')
+    parser.add_argument('--mode', choices=MODES,
+                        help='top (realdata default), greedy (version2 default), optimal or hours')
+    parser.add_argument('--top-n', type=int, default=10, help='Matches per project in top mode (default 10)')
+    parser.add_argument('--max-projects', type=int, help='Project limit per employee in hours mode')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Score across this many processes (realdata schema; default 1)')
+    parser.add_argument('--exact-skills', action='store_true',
+                        help='Match skill tokens exactly instead of through the synonym/typo vocabulary (realdata schema)')
+    parser.add_argument('--weights', type=parse_weights, metavar='CRITERION=W,...',
+                        help='Criterion weights, e.g. Languages=2,Tools=0.5,Certifications=0 (realdata schema); '
+                             'implies --explain')
+    parser.add_argument('--explain', action='store_true',
+                        help="Add a '<criterion> pts' column per criterion showing how each Match %% was earned")
+    parser.add_argument('--project-dates', action='store_true',
+                        help="Check availability against each project's start/end dates and hours/week (realdata)")
+    parser.add_argument('--as-of', metavar='YYYY-MM-DD',
+                        help='Planning date for the availability rules (default today)')
+    parser.add_argument('--single-sheet', action='store_true', help='Write one long sheet instead of one per project')
+    parser.add_argument('--scenarios', help='JSON file with a list of scenario objects to run in one process; '
+                                            'each uses the same keys as the options above')
+    parser.add_argument('--store', metavar='DB',
+                        help='SQLite roster store (realdata schema): upsert EMPLOYEES into it and match its latest '
+                             'valid records; in --scenarios files the employees key may then be omitted')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the on-disk ingestion cache')
+    parser.add_argument('--trace', action='store_true',
+                        help='Log every pipeline stage (seconds, rows, memory delta) to stderr as JSON lines')
+    parser.add_argument('--profile', metavar='FILE', help='Run under cProfile and write the stats to FILE')
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    defaults = {
+        'schema': args.schema,
+        'mode': args.mode,
+        'top_n': args.top_n,
+        'max_projects': args.max_projects,
+        'workers': args.workers,
+        'synonyms': not args.exact_skills,
+        'weights': args.weights,
+        'explain': args.explain,
+        'project_dates': args.project_dates,
+        'today': args.as_of,
+        'single_sheet': args.single_sheet,
+        'store': args.store,
+    }
+    if args.scenarios:
+        with open(args.scenarios) as fh:
+            scenarios = [{**defaults, **entry} for entry in json.load(fh)]
+    elif args.employees and args.projects and args.output:
+        scenarios = [{**defaults, 'employees': args.employees, 'projects': args.projects, 'output': args.output}]
+    else:
+        parser.error('pass EMPLOYEES PROJECTS -o OUTPUT, or --scenarios FILE')
+
+    trace, current = None, {}
+    if args.trace or args.profile:
+        from workforce.profiling import Trace
+
+        def log_stage(record):
+            print(json.dumps({'event': 'stage', 'scenario': current.get('output'), **record}),
+                  file=sys.stderr, flush=True)
+
+        trace = Trace(profile=bool(args.profile), sink=log_stage if args.trace else None)
+
+    failures = 0
+    with trace or contextlib.nullcontext():
+        for scenario in scenarios:
+            current['output'] = scenario.get('output')
+            try:
+                summary = run_scenario(scenario, use_disk_cache=not args.no_cache)
+            except Exception as e:
+                failures += 1
+                summary = {'output': scenario.get('output'), 'error': str(e)}
+            print(json.dumps(summary), flush=True)
+    if args.profile:
+        trace.dump_profile(args.profile)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
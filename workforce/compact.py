@@ -0,0 +1,204 @@
+"""Compact in-memory score storage for large rosters.
+
+A dense float64 employee x project Match % matrix takes 8 bytes per pair,
+plus same-sized temporaries while it is built. Unweighted scores are fully
+determined by the matched-token counts, so MatchCounts keeps those instead
+(1 byte per pair when every project has at most 255 requirement tokens) and
+computes Match % only for the pairs a caller indexes:
+
+    scores = SkillMatrix(employees, projects).match_scores()
+    scores[:, col]                 # float64 Match % of one project, as scores() would return it
+    scores[np.ix_(rows, cols)]     # any NumPy index works
+
+Weighted scores are not integers, but they are determined by the matched
+tokens of each criterion, so WeightedCounts keeps one count per field (plus
+the certificate-covered tokens under a relevance model) and replays
+score_breakdown's arithmetic for the selected pairs.
+
+The ranking, assignment and scheduling helpers accept either wherever they
+accept a score matrix (see as_score_matrix). Caches that reuse parts of an
+earlier matrix assemble a new one with empty() and place().
+"""
+
+import copy
+
+import numpy as np
+
+# Employees x projects cells built per chunk while scoring (bounds the float64 temporaries)
+CHUNK_CELLS = 1 << 20
+
+def row_chunks(n_rows, n_cols, cells=CHUNK_CELLS):
+    """Consecutive row slices holding about `cells` cells each."""
+    step = max(1, cells // max(n_cols, 1))
+    for first in range(0, n_rows, step):
+        yield slice(first, min(first + step, n_rows))
+
+def count_dtype(max_count):
+    """Smallest unsigned integer dtype holding counts up to max_count."""
+    return np.min_scalar_type(max(int(max_count), 0))
+
+class CompactScores:
+    """Employee x project Match % computed on indexing from compact per-pair counts.
+
+    Subclasses keep `counts` (employees x projects, with a trailing axis
+    when there is more than one count per pair), the per-employee arrays
+    named in ROW_ARRAYS and the per-project arrays named in COLUMN_ARRAYS,
+    and compute float64 Match % for the selected pairs in _scores. Pairs
+    outside `mask` (employees x projects booleans) score 0.
+    """
+
+    ndim = 2
+    dtype = np.dtype(np.float64)
+    ROW_ARRAYS = ('certified',)
+    COLUMN_ARRAYS = ('totals',)
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def nbytes(self):
+        """Bytes held by the counts, per-employee and per-project arrays and mask."""
+        arrays = [getattr(self, name) for name in self.ROW_ARRAYS + self.COLUMN_ARRAYS]
+        mask = self.mask.nbytes if self.mask is not None else 0
+        return self.counts.nbytes + sum(array.nbytes for array in arrays) + mask
+
+    def __getitem__(self, key):
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        cert = self.certified[rows]
+        if np.ndim(cert) == 1 and np.ndim(self.totals[cols]) == 1 and (isinstance(rows, slice) or isinstance(cols, slice)):
+            # A slice on either axis makes the selection a rows x columns block
+            cert = cert[:, None]
+        scores = self._scores((rows, cols), cert)
+        scores *= 100
+        if self.mask is not None:
+            np.copyto(scores, 0.0, where=~self.mask[key])
+        return scores[()]
+
+    def __array__(self, dtype=None, copy=None):
+        scores = self[:, :]
+        return scores if dtype is None else scores.astype(dtype)
+
+    def masked(self, mask):
+        """The same scores with every pair outside mask set to 0."""
+        scores = copy.copy(self)
+        scores.mask = mask if self.mask is None else mask & self.mask
+        return scores
+
+    def empty(self, shape, dtype=None):
+        """A matrix of the given (employees, projects) shape to place() blocks into, scored like this one.
+
+        Counts are zero and of `dtype` (default this matrix's count dtype).
+        """
+        scores = copy.copy(self)
+        scores.shape = tuple(shape)
+        scores.counts = np.zeros(scores.shape + self.counts.shape[2:], dtype=dtype or self.counts.dtype)
+        for name in self.ROW_ARRAYS:
+            setattr(scores, name, np.zeros(scores.shape[0]))
+        for name in self.COLUMN_ARRAYS:
+            setattr(scores, name, np.zeros(scores.shape[1]))
+        scores.mask = None
+        return scores
+
+    def place(self, rows, cols, source, source_rows, source_cols):
+        """Copy source's source_rows x source_cols block (same kind and weights) to rows x cols."""
+        if len(rows) == 0 or len(cols) == 0:
+            # An empty source (a zero-row or zero-column matrix) has no flags or totals to copy
+            return
+        block, source_block = np.ix_(rows, cols), np.ix_(source_rows, source_cols)
+        self.counts[block] = source.counts[source_block]
+        for name in self.ROW_ARRAYS:
+            getattr(self, name)[rows] = getattr(source, name)[source_rows]
+        for name in self.COLUMN_ARRAYS:
+            getattr(self, name)[cols] = getattr(source, name)[source_cols]
+        if source.mask is not None or self.mask is not None:
+            if self.mask is None:
+                self.mask = np.ones(self.shape, dtype=bool)
+            self.mask[block] = source.mask[source_block] if source.mask is not None else True
+
+class MatchCounts(CompactScores):
+    """Employee x project Match % stored as matched-token counts.
+
+    Match % is 100 * (matched + c) / (total + c), where c is 1 for employees
+    with a counted certification, so the counts, one flag per employee and
+    one requirement total per project determine it. Indexing with a
+    (rows, columns) key returns float64 Match % for the selected pairs,
+    computed with the same operations as SkillMatrix.scores(), so values are
+    bit-identical to the dense matrix.
+    """
+
+    def __init__(self, counts, certified, totals, mask=None):
+        self.counts = counts
+        self.certified = np.asarray(certified, dtype=np.float64)
+        self.totals = np.asarray(totals, dtype=np.float64)
+        self.mask = mask
+        self.shape = counts.shape
+
+    def _scores(self, key, cert):
+        totals = self.totals[key[1]]
+        scores = np.asarray(self.counts[key] + cert, dtype=np.float64)
+        # Certified and uncertified pairs are divided separately, so no pair-sized total is built;
+        # a pair with total 0 has no requirement to match, so its count is 0 and stays 0
+        certified = cert > 0
+        np.divide(scores, totals, out=scores, where=~certified & (totals > 0))
+        np.divide(scores, totals + 1.0, out=scores, where=certified)
+        return scores
+
+def weighted_totals(weights, field_totals):
+    """Weighted requirement total per project (fields x projects counts), summed as score_breakdown does."""
+    total = np.zeros(field_totals.shape[1], dtype=np.float64)
+    for weight, totals in zip(weights, field_totals):
+        total = total + weight * totals
+    return total
+
+class WeightedCounts(CompactScores):
+    """Employee x project weighted Match % stored as matched-token counts per criterion.
+
+    counts[..., f] holds the matched tokens of field f; with `relevance`, a
+    last entry holds the project tokens the employee's certificates cover.
+    Indexing repeats SkillMatrix.score_breakdown()'s operations on the
+    selected pairs, so values are bit-identical to its Match % matrix.
+    `certified` flags employees with a counted certificate, `totals` is the
+    unweighted and `weighted` the weighted requirement total per project.
+    """
+
+    COLUMN_ARRAYS = ('totals', 'weighted')
+
+    def __init__(self, counts, certified, totals, weighted, weights, cert_weight, relevance, mask=None):
+        self.counts = counts
+        self.certified = np.asarray(certified, dtype=np.float64)
+        self.totals = np.asarray(totals, dtype=np.float64)
+        self.weighted = np.asarray(weighted, dtype=np.float64)
+        self.weights = list(weights)
+        self.cert_weight = cert_weight
+        self.relevance = relevance
+        self.mask = mask
+        self.shape = counts.shape[:2]
+
+    def _scores(self, key, cert):
+        counts = self.counts[key]
+        # Two pair-sized buffers, updated in place in score_breakdown's order of operations
+        matched = np.zeros(counts.shape[:-1], dtype=np.float64)
+        points = np.empty_like(matched)
+        for field_idx, weight in enumerate(self.weights):
+            np.multiply(counts[..., field_idx], weight, out=points)
+            matched += points
+        if self.relevance:
+            # Share of the project's requirement tokens the certificate covers; full credit when nothing is required
+            totals = self.totals[key[1]]
+            np.copyto(points, counts[..., -1])
+            np.divide(points, totals, out=points, where=totals > 0)
+            np.copyto(points, 1.0, where=~(totals > 0))
+            np.minimum(points, 1.0, out=points)
+            points *= cert
+        else:
+            np.copyto(points, cert)
+        points *= self.cert_weight
+        matched += points
+        total = np.add(self.weighted[key[1]], self.cert_weight * cert, out=points)
+        np.divide(matched, total, out=matched, where=total > 0)
+        np.copyto(matched, 0.0, where=~(total > 0))
+        return matched
+
+def as_score_matrix(scores):
+    """A compact score matrix as is, anything else as a NumPy array."""
+    return scores if isinstance(scores, CompactScores) else np.asarray(scores)
@@ -0,0 +1,136 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from workforce.profiling import span
+
+EXCEL_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Download formats offered by the apps: label -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    'Excel (one sheet per project)': ('xlsx', EXCEL_MIME),
+    'Excel (single sheet)': ('xlsx', EXCEL_MIME),
+    'CSV (single table)': ('csv', 'text/csv'),
+    'Parquet (single table)': ('parquet', 'application/octet-stream'),
+}
+
+# -------------------- Sheet Names --------------------
+
+def sanitize_sheet_name(name):
+    """Sanitize sheet names for Excel compatibility."""
+    invalid_chars = ['\\', '/', '*', '?', ':', '[', ']']
+    name = str(name)
+    for char in invalid_chars:
+        name = name.replace(char, '-')
+    name = name.strip("'")
+    return name[:31] or 'Sheet'
+
+def unique_sheet_names(names):
+    """Sanitized sheet names with ' (2)', ' (3)'... suffixes so no two projects share a sheet.
+
+    Excel compares sheet names case-insensitively, so uniqueness is checked on
+    the lowercased name; suffixes are fitted inside the 31-character limit.
+    """
+    used = set()
+    result = []
+    for name in names:
+        base = sanitize_sheet_name(name)
+        candidate, n = base, 1
+        while candidate.lower() in used:
+            n += 1
+            suffix = f" ({n})"
+            candidate = base[:31 - len(suffix)] + suffix
+        used.add(candidate.lower())
+        result.append(candidate)
+    return result
+
+# -------------------- Writers --------------------
+
+def _cell(value):
+    """Plain Python value for a spreadsheet cell (NaN/NaT become blanks)."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+def _rows(df):
+    yield list(df.columns)
+    for row in df.itertuples(index=False, name=None):
+        yield [_cell(v) for v in row]
+
+def write_sheets(sheets, output):
+    """Stream (sheet name, DataFrame) pairs into an xlsx file without holding the workbook in memory.
+
+    Uses xlsxwriter's constant_memory mode when installed, otherwise an
+    openpyxl write-only workbook; both flush rows as they are written.
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True, 'in_memory': False})
+        date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        for sheet_name, df in sheets:
+            worksheet = workbook.add_worksheet(sheet_name)
+            for r, row in enumerate(_rows(df)):
+                for c, value in enumerate(row):
+                    if hasattr(value, 'year'):
+                        worksheet.write_datetime(r, c, value, date_format)
+                    else:
+                        worksheet.write(r, c, value)
+        workbook.close()
+        return output
+
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    for sheet_name, df in sheets:
+        worksheet = workbook.create_sheet(title=sheet_name)
+        for row in _rows(df):
+            worksheet.append(row)
+    workbook.save(output)
+    return output
+
+def long_format(assignments):
+    """All project tables stacked into one frame with a leading 'Project' column."""
+    frames = [df.assign(Project=name) for name, df in assignments.items()]
+    if not frames:
+        return pd.DataFrame(columns=['Project'])
+    combined = pd.concat(frames, ignore_index=True)
+    return combined[['Project'] + [c for c in combined.columns if c != 'Project']]
+
+def to_excel_download(assignments):
+    """Convert project assignments to Excel (one sheet per project) for download."""
+    names = unique_sheet_names(assignments.keys())
+    output = BytesIO()
+    write_sheets(zip(names, assignments.values()), output)
+    output.seek(0)
+    return output
+
+def export_assignments(assignments, fmt='Excel (one sheet per project)'):
+    """Serialize assignments in one of EXPORT_FORMATS; returns a BytesIO positioned at 0."""
+    with span('export', format=fmt, rows=int(sum(len(df) for df in assignments.values()))) as stage:
+        output = _serialize(assignments, fmt)
+        stage.note(bytes=output.getbuffer().nbytes)
+        return output
+
+def _serialize(assignments, fmt):
+    if fmt == 'Excel (one sheet per project)':
+        return to_excel_download(assignments)
+    table = long_format(assignments)
+    output = BytesIO()
+    if fmt == 'Excel (single sheet)':
+        write_sheets([('Assignments', table)], output)
+    elif fmt == 'CSV (single table)':
+        output.write(table.to_csv(index=False).encode('utf-8'))
+    elif fmt == 'Parquet (single table)':
+        table.to_parquet(output, index=False)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    output.seek(0)
+    return output
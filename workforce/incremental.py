@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+from workforce.matching import MATCH_FIELDS, SkillMatrix
+from workforce.ranking import top_k
+
+# -------------------- Fingerprints --------------------
+
+def row_keys(df, key_column):
+    """Stable row keys: (key value, occurrence) so duplicate keys stay distinct."""
+    occurrence = df.groupby(key_column, sort=False, dropna=False).cumcount()
+    return list(zip(df[key_column].tolist(), occurrence.tolist()))
+
+def row_fingerprints(df, columns):
+    """64-bit content hash per row over the given columns."""
+    return pd.util.hash_pandas_object(df[columns].astype(str), index=False).to_numpy()
+
+# -------------------- Incremental Matcher --------------------
+
+class MatchUpdate:
+    """Result of one IncrementalMatcher.update call."""
+
+    def __init__(self, scores, top, changed_projects, rescored_employees, rescored_projects, first_run):
+        self.scores = scores
+        self.top = top
+        self.changed_projects = changed_projects
+        self.rescored_employees = rescored_employees
+        self.rescored_projects = rescored_projects
+        self.first_run = first_run
+
+class IncrementalMatcher:
+    """Keeps the last score matrix and top-n lists and only rescores what changed.
+
+    Employee rows are keyed by `employee_key` (Id) and project columns by
+    `project_key` (Project Name); each row also carries a hash of the columns
+    that affect its score. The matrix is kept in SkillMatrix.match_scores()'s
+    compact form. On update, unchanged rows and columns are copied from the
+    previous matrix, changed or new rows are scored against every project and
+    changed or new projects against every employee. Only projects whose
+    ranking could have moved are re-ranked. A `skill_vocabulary`
+    (SkillVocabulary) is kept for the matcher's lifetime so canonical skill
+    IDs stay stable between updates; `model` (ScoringModel) weights the
+    scores.
+    """
+
+    def __init__(self, fields=MATCH_FIELDS, top_n=10, employee_key='Id', project_key='Project Name',
+                 skill_vocabulary=None, model=None):
+        self.fields = list(fields)
+        self.skill_vocabulary = skill_vocabulary
+        self.model = model
+        self.top_n = top_n
+        self.employee_key = employee_key
+        self.project_key = project_key
+        self.employee_columns = [emp for emp, _ in self.fields] + ['Certifications']
+        self.project_columns = [proj for _, proj in self.fields]
+        self._employee_keys = []
+        self._employee_fps = np.zeros(0, dtype=np.uint64)
+        self._project_keys = []
+        self._project_fps = np.zeros(0, dtype=np.uint64)
+        self._scores = None
+        self._ids = np.zeros(0)
+        self._top = {}
+        self.last_update = None
+
+    def reset(self):
+        """Forget the previous run so the next update rescores everything."""
+        self.__init__(self.fields, self.top_n, self.employee_key, self.project_key, self.skill_vocabulary,
+                      self.model)
+
+    def update(self, employees, projects, top_n=None):
+        """Score a new roster/project snapshot, reusing everything unchanged since the last call."""
+        if top_n is not None and top_n != self.top_n:
+            self.top_n = top_n
+            self._top = {}
+
+        emp_keys = row_keys(employees, self.employee_key)
+        emp_fps = row_fingerprints(employees, self.employee_columns)
+        proj_keys = row_keys(projects, self.project_key)
+        proj_fps = row_fingerprints(projects, self.project_columns)
+
+        old_emp = {key: (pos, fp) for pos, (key, fp) in enumerate(zip(self._employee_keys, self._employee_fps))}
+        old_proj = {key: (pos, fp) for pos, (key, fp) in enumerate(zip(self._project_keys, self._project_fps))}
+
+        emp_src = np.array([old_emp[k][0] if k in old_emp and old_emp[k][1] == fp else -1
+                            for k, fp in zip(emp_keys, emp_fps)], dtype=np.int64)
+        proj_src = np.array([old_proj[k][0] if k in old_proj and old_proj[k][1] == fp else -1
+                             for k, fp in zip(proj_keys, proj_fps)], dtype=np.int64)
+        dirty_rows = np.flatnonzero(emp_src < 0)
+        dirty_cols = np.flatnonzero(proj_src < 0)
+
+        kept_rows = np.flatnonzero(emp_src >= 0)
+        kept_cols = np.flatnonzero(proj_src >= 0)
+        if len(kept_rows) == 0 or len(kept_cols) == 0:
+            # Nothing to reuse: every row or every project is rescored anyway
+            scores = self._match_scores(employees, projects)
+        else:
+            all_rows, all_cols = np.arange(len(employees)), np.arange(len(projects))
+            parts = [(kept_rows, kept_cols, self._scores, emp_src[kept_rows], proj_src[kept_cols])]
+            if len(dirty_rows):
+                fresh = self._match_scores(employees.iloc[dirty_rows], projects)
+                parts.append((dirty_rows, all_cols, fresh, np.arange(len(dirty_rows)), all_cols))
+            if len(dirty_cols):
+                fresh = self._match_scores(employees, projects.iloc[dirty_cols])
+                parts.append((all_rows, dirty_cols, fresh, all_rows, np.arange(len(dirty_cols))))
+            scores = self._scores.empty((len(employees), len(projects)),
+                                        np.result_type(*[source.counts.dtype for _, _, source, _, _ in parts]))
+            for part in parts:
+                scores.place(*part)
+
+        ids = employees[self.employee_key].to_numpy() if self.employee_key in employees.columns \
+            else np.arange(len(employees))
+        # Ids whose old scores are gone (removed or rescored rows) can drop out of any old top-n
+        stale_ids = set(self._ids[np.setdiff1d(np.arange(len(self._employee_keys)), emp_src[kept_rows])].tolist())
+
+        id_positions = {i: pos for pos, i in enumerate(ids.tolist())}
+        top, changed = {}, []
+        for col, key in enumerate(proj_keys):
+            previous = self._top.get(key)
+            needs_rank = (
+                previous is None
+                or proj_src[col] < 0
+                or any(i in stale_ids for i in previous)
+                or self._may_enter(scores, col, previous, dirty_rows, id_positions)
+            )
+            if needs_rank:
+                positions = top_k(scores[:, col], self.top_n, ids)
+                ranked_ids = tuple(ids[positions].tolist())
+            else:
+                ranked_ids = previous
+            top[key] = ranked_ids
+            if previous != ranked_ids:
+                changed.append(key[0])
+
+        self._employee_keys, self._employee_fps = emp_keys, emp_fps
+        self._project_keys, self._project_fps = proj_keys, proj_fps
+        first_run = self.last_update is None
+        self._scores, self._ids, self._top = scores, ids, top
+
+        top_positions = {key[0]: np.array([id_positions[i] for i in ranked], dtype=np.int64)
+                         for key, ranked in top.items()}
+        self.last_update = MatchUpdate(scores, top_positions, changed, len(dirty_rows), len(dirty_cols), first_run)
+        return self.last_update
+
+    def _match_scores(self, employees, projects):
+        return SkillMatrix(employees, projects, self.fields, self.skill_vocabulary, self.model).match_scores()
+
+    def _may_enter(self, scores, col, previous, dirty_rows, id_positions):
+        """Whether a rescored row could displace someone in an otherwise unchanged top-n."""
+        if len(dirty_rows) == 0:
+            return False
+        candidates = scores[dirty_rows, col]
+        if len(previous) < self.top_n:
+            return bool((candidates > 0).any())
+        cutoff = scores[id_positions[previous[-1]], col]
+        return bool((candidates >= cutoff).any())
@@ -0,0 +1,145 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+import pandas as pd
+
+from workforce.profiling import span
+
+# Parsed frames live here, keyed by file content hash
+CACHE_DIR = os.environ.get(
+    'WORKFORCE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'workforce-tool')
+)
+# Oldest cache files are evicted once the directory grows past this size
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+# Frames also kept in process memory so Streamlit reruns skip the disk entirely
+MAX_MEMORY_ENTRIES = 8
+
+# Bump when a normalizer's output changes so stale cache entries are not served
+NORMALIZE_VERSION = 2
+
+_memory = OrderedDict()
+# load_table is also called from background matching threads
+_memory_lock = threading.Lock()
+
+# -------------------- Reading --------------------
+
+def _read_bytes(source):
+    """Raw bytes and file name of a path, Streamlit UploadedFile or file-like object."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as fh:
+            return fh.read(), os.fspath(source)
+    if hasattr(source, 'getvalue'):
+        return source.getvalue(), getattr(source, 'name', '')
+    return source.read(), getattr(source, 'name', '')
+
+def _parse(data, name):
+    """Parse Excel, Parquet or CSV bytes into a DataFrame."""
+    lowered = name.lower()
+    if data[:4] == b'PAR1' or lowered.endswith('.parquet'):
+        return pd.read_parquet(BytesIO(data))
+    if data[:2] == b'PK' or lowered.endswith(('.xlsx', '.xls')):
+        return pd.read_excel(BytesIO(data))
+    return pd.read_csv(BytesIO(data))
+
+def content_hash(data):
+    """SHA-256 hex digest of file contents."""
+    return hashlib.sha256(data).hexdigest()
+
+def load_table(source, normalize=None, cache_dir=CACHE_DIR, max_cache_bytes=MAX_CACHE_BYTES):
+    """Read an employee/project file once and serve later reads from a columnar cache.
+
+    The cache key is the file's content hash plus the normalizer, so re-uploading
+    the same workbook (or rerunning the Streamlit script) never re-parses it.
+    Pass cache_dir=None to keep the cache in memory only. Returns a fresh copy
+    that callers may mutate.
+    """
+    with span('load') as stage:
+        data, name = _read_bytes(source)
+        key = content_hash(data)
+        if normalize is not None:
+            key = f"{key}-{normalize.__module__}.{normalize.__qualname__}-v{NORMALIZE_VERSION}"
+            key = content_hash(key.encode())
+
+        with _memory_lock:
+            df = _memory.get(key)
+        cache = 'memory'
+        if df is None and cache_dir is not None:
+            df = _read_cache(cache_dir, key)
+            cache = 'disk'
+        if df is None:
+            cache = 'miss'
+            with span('parse') as parsed:
+                df = _parse(data, name)
+                parsed.note(rows=len(df))
+            if normalize is not None:
+                with span('normalize') as normalized:
+                    df = normalize(df)
+                    normalized.note(rows=len(df))
+            if cache_dir is not None:
+                _write_cache(cache_dir, key, df, max_cache_bytes)
+
+        with _memory_lock:
+            _memory[key] = df
+            _memory.move_to_end(key)
+            while len(_memory) > MAX_MEMORY_ENTRIES:
+                _memory.popitem(last=False)
+        stage.note(rows=len(df), cache=cache)
+        return df.copy()
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """Drop every cached frame, in memory and on disk."""
+    with _memory_lock:
+        _memory.clear()
+    if os.path.isdir(cache_dir):
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(('.parquet', '.pkl')):
+                os.remove(entry.path)
+
+# -------------------- Disk Cache --------------------
+
+def _read_cache(cache_dir, key):
+    for ext, reader in (('.parquet', pd.read_parquet), ('.pkl', pd.read_pickle)):
+        path = os.path.join(cache_dir, key + ext)
+        if os.path.exists(path):
+            try:
+                df = reader(path)
+            except Exception:
+                os.remove(path)
+                return None
+            os.utime(path)  # mark as recently used for eviction
+            return df
+    return None
+
+def _write_cache(cache_dir, key, df, max_cache_bytes):
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return
+    path = os.path.join(cache_dir, key + '.parquet')
+    try:
+        df.to_parquet(path, index=True)
+    except Exception:
+        # No pyarrow, or mixed-type object columns (e.g. dates next to 'TBD') Parquet can't store
+        if os.path.exists(path):
+            os.remove(path)
+        path = os.path.join(cache_dir, key + '.pkl')
+        try:
+            df.to_pickle(path, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            return
+    _evict(cache_dir, max_cache_bytes)
+
+def _evict(cache_dir, max_cache_bytes):
+    """Delete least recently used cache files until the directory fits in max_cache_bytes."""
+    entries = [e for e in os.scandir(cache_dir) if e.name.endswith(('.parquet', '.pkl'))]
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    total = sum(e.stat().st_size for e in entries)
+    for entry in entries[:-1]:
+        if total <= max_cache_bytes:
+            break
+        total -= entry.stat().st_size
+        os.remove(entry.path)
@@ -0,0 +1,107 @@
+"""Background matching jobs with progress, cached by input hashes and parameters.
+
+Used by the Streamlit app so a long run does not block the page: the script
+submits a job, draws its progress and polls until it finishes, and any later
+rerun with the same inputs is served from the finished job. Nothing here
+imports Streamlit; jobs must not call Streamlit functions either.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Finished or running jobs kept per cache; the oldest are dropped first
+MAX_CACHED_JOBS = 8
+
+class Job:
+    """One background run. `report(fraction, message)` is handed to the job function."""
+
+    def __init__(self, key):
+        self.key = key
+        self.progress = 0.0
+        self.message = 'Queued'
+        self.started = None
+        self.finished = None
+        self.future = None
+
+    def report(self, fraction, message):
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+        self.message = message
+
+    @property
+    def done(self):
+        return self.future is not None and self.future.done()
+
+    @property
+    def error(self):
+        """The exception the job raised, or None (also None while running)."""
+        return self.future.exception() if self.done else None
+
+    def result(self):
+        return self.future.result()
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def _run(self, fn, args, kwargs):
+        self.started = time.monotonic()
+        self.report(0.0, 'Starting')
+        try:
+            result = fn(*args, progress=self.report, **kwargs)
+            self.report(1.0, 'Done')
+            return result
+        finally:
+            self.finished = time.monotonic()
+
+class JobCache:
+    """Jobs keyed by a hashable description of their inputs, run on a shared executor.
+
+    get_or_submit returns the existing job for a key (running or finished),
+    so identical requests never run twice; clear() is the explicit
+    invalidation. Failed jobs stay cached until cleared, so an error is
+    shown rather than retried on every rerun.
+    """
+
+    def __init__(self, executor, max_entries=MAX_CACHED_JOBS):
+        self.executor = executor
+        self.max_entries = max_entries
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def get_or_submit(self, key, fn, *args, **kwargs):
+        """Job for key, submitting fn(*args, progress=job.report, **kwargs) if there is none yet."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                job = Job(key)
+                job.future = self.executor.submit(job._run, fn, args, kwargs)
+                self._jobs[key] = job
+                while len(self._jobs) > self.max_entries:
+                    self._jobs.popitem(last=False)
+            self._jobs.move_to_end(key)
+            return job
+
+    def discard(self, key):
+        """Forget one job, so the next get_or_submit for its key runs it again."""
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def clear(self):
+        """Forget every job; running ones finish in the background but their results are dropped."""
+        with self._lock:
+            self._jobs.clear()
+
+def make_executor(max_workers=2):
+    """Thread pool for matching jobs (NumPy/SciPy release the GIL during the heavy products)."""
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='workforce-match')
@@ -0,0 +1,425 @@
+import numpy as np
+import pandas as pd
+
+from workforce.compact import MatchCounts, WeightedCounts, count_dtype, row_chunks, weighted_totals
+from workforce.scoring import CERTIFICATIONS
+
+try:
+    from scipy import sparse
+except ImportError:  # SciPy is optional; fall back to dense NumPy matrices
+    sparse = None
+
+# -------------------- Column Names --------------------
+
+LANGUAGES_REQUIRED = 'Langauages proficiency required (e.g. Python, Java)'
+SKILLS_REQUIRED = 'Skills Required (e.g. Risk Management, Data Analysis, Data Visualization )'
+TOOLS_REQUIRED = 'Tools (e.g. Power BI, Jira)'
+
+# (employee column, project column) pairs compared token by token
+MATCH_FIELDS = [
+    ('Languages', LANGUAGES_REQUIRED),
+    ('Experience', SKILLS_REQUIRED),
+    ('Tools', TOOLS_REQUIRED),
+]
+
+# Same comparison for the version2 sample data (employee_datav2.xlsx)
+V2_MATCH_FIELDS = [
+    ('Languages', 'Languages'),
+    ('Skills', 'Skills'),
+    ('Tools', 'Tools'),
+]
+
+# -------------------- Tokenization --------------------
+
+def employee_tokens(value):
+    """Split an employee cell into its set of stripped, lowercased tokens."""
+    return {v.strip() for v in str(value).strip().lower().split(';')}
+
+def project_tokens(value):
+    """Split a project cell into its requirement tokens, or [] when nothing is required."""
+    proj_val = str(value).strip().lower().split(',')
+    if not proj_val or proj_val[0] == 'n/a' or proj_val[0] == '':
+        return []
+    return [val.strip() for val in proj_val]
+
+def has_certification(certifications, strict=False):
+    """Vectorized certification check: present and not 'n/a' (strict: not blank either)."""
+    labels = certifications.astype(str).str.strip().str.lower()
+    present = certifications.notna() & (labels != 'n/a')
+    if strict:
+        present &= labels != ''
+    return present.to_numpy()
+
+def canonical_employee_terms(value, skill_vocabulary):
+    """Canonical IDs of an employee cell; blank cells and empty tokens match nothing."""
+    if pd.isna(value):
+        return set()
+    return skill_vocabulary.encode(employee_tokens(value))
+
+def canonical_project_terms(value, skill_vocabulary):
+    """Canonical ID per non-blank requirement token (None when no employee term matches)."""
+    if pd.isna(value):
+        return []
+    return [skill_vocabulary.lookup(tok) for tok in project_tokens(value) if tok]
+
+# -------------------- Skill Matrix --------------------
+
+class SkillMatrix:
+    """Employee x term and project x term matrices over one shared vocabulary.
+
+    Every distinct cell value is tokenized once; vocabulary terms are
+    (field index, token) pairs so a 'Python' requirement only matches the
+    Languages column it was asked for. The full employee x project Match %
+    matrix is then one sparse product, scored exactly like
+    calculate_match_percentage.
+
+    With a SkillVocabulary, tokens are first mapped to canonical IDs, so
+    aliases, spelling variants and typos of one skill match each other;
+    blank cells, empty tokens and blank certifications no longer count.
+
+    With a ScoringModel, criteria are weighted and certificates are scored
+    by their relevance to each project (see workforce.scoring);
+    score_breakdown also returns every criterion's contribution.
+
+    Employee term membership is stored as uint8 ones (int32 column indices),
+    and match_scores() keeps the matrix as matched-token counts (MatchCounts,
+    or WeightedCounts with a model).
+    """
+
+    def __init__(self, employees, projects, fields=MATCH_FIELDS, skill_vocabulary=None, model=None):
+        self.fields = list(fields)
+        self.skill_vocabulary = skill_vocabulary
+        self.model = model
+        if model is not None:
+            unknown = set(model.weights) - set(model.criteria(self.fields))
+            if unknown:
+                raise ValueError(f"Unknown scoring criteria: {', '.join(sorted(unknown))}")
+        self.vocabulary = {}
+        self.employee_index = employees.index
+        self.project_index = projects.index
+        self.employee_terms = self._employee_matrix(employees)
+        self.certified = has_certification(employees['Certifications'], strict=skill_vocabulary is not None)
+        self.certificate_terms = None
+        if model is not None and model.relevance:
+            # Certificate skills join the vocabulary before projects are tokenized, so they can be looked up
+            self.certificate_terms, self.certified = self._certificate_matrix(employees['Certifications'])
+            self.employee_terms = _resize_columns(self.employee_terms, len(self.vocabulary))
+        self.project_terms, self.project_field_totals = self._project_matrix(projects)
+        self.project_totals = self.project_field_totals.sum(axis=0)
+
+    def _employee_tokens(self, value):
+        if self.skill_vocabulary is None:
+            return employee_tokens(value)
+        return canonical_employee_terms(value, self.skill_vocabulary)
+
+    def _project_tokens(self, value):
+        if self.skill_vocabulary is None:
+            return project_tokens(value)
+        return canonical_project_terms(value, self.skill_vocabulary)
+
+    def _employee_matrix(self, employees):
+        rows, cols = [], []
+        n_rows = len(employees)
+        for field_idx, (emp_field, _) in enumerate(self.fields):
+            # Tokenize each distinct value once, then broadcast term ids to rows through the codes
+            codes, uniques = pd.factorize(employees[emp_field], use_na_sentinel=False)
+            term_lists = [
+                [self.vocabulary.setdefault((field_idx, tok), len(self.vocabulary))
+                 for tok in self._employee_tokens(value)]
+                for value in uniques
+            ]
+            lengths = np.array([len(t) for t in term_lists], dtype=np.int64)
+            flat = np.array([t for terms in term_lists for t in terms], dtype=np.int64)
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(lengths) else lengths
+            row_lengths = lengths[codes] if n_rows else np.zeros(0, dtype=np.int64)
+            starts = np.repeat(offsets[codes] - np.cumsum(row_lengths) + row_lengths, row_lengths)
+            rows.append(np.repeat(np.arange(n_rows), row_lengths))
+            cols.append(flat[starts + np.arange(int(row_lengths.sum()))])
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+        shape = (n_rows, len(self.vocabulary))
+        return _build_matrix(rows, cols, np.ones(len(rows), dtype=np.uint8), shape)
+
+    def _certificate_matrix(self, certifications):
+        """Employee x term matrix of the skills each employee's certificates cover, plus a known-certificate mask.
+
+        A certificate skill covers that token in every field, since maps like
+        CERTIFICATION_SKILLS mix languages, tools and skills in one list.
+        """
+        codes, uniques = pd.factorize(certifications, use_na_sentinel=False)
+        value_terms, value_known = [], np.zeros(len(uniques), dtype=bool)
+        for pos, value in enumerate(uniques):
+            skills = None if pd.isna(value) else self.model.certificate_skills(value)
+            value_known[pos] = skills is not None
+            tokens = self._employee_tokens(';'.join(skills)) if skills else ()
+            value_terms.append(sorted({
+                self.vocabulary.setdefault((field_idx, tok), len(self.vocabulary))
+                for tok in tokens if tok != '' for field_idx in range(len(self.fields))
+            }))
+        rows = [row for row, code in enumerate(codes) for _ in value_terms[code]]
+        cols = [term for code in codes for term in value_terms[code]]
+        shape = (len(codes), len(self.vocabulary))
+        matrix = _build_matrix(rows, cols, np.ones(len(rows), dtype=np.uint8), shape)
+        return matrix, value_known[codes] if len(codes) else np.zeros(0, dtype=bool)
+
+    def _project_matrix(self, projects):
+        rows, cols, counts = [], [], []
+        totals = np.zeros((len(self.fields), len(projects)), dtype=np.int64)
+        for field_idx, (_, proj_field) in enumerate(self.fields):
+            for row, value in enumerate(projects[proj_field].to_numpy()):
+                tokens = self._project_tokens(value)
+                totals[field_idx, row] += len(tokens)
+                # Tokens no employee has can never match; they only count toward the total
+                for tok in tokens:
+                    term_id = self.vocabulary.get((field_idx, tok))
+                    if term_id is not None:
+                        rows.append(row)
+                        cols.append(term_id)
+                        counts.append(1.0)
+        shape = (len(projects), len(self.vocabulary))
+        return _build_matrix(rows, cols, np.asarray(counts, dtype=np.float64), shape), totals
+
+    def match_counts(self):
+        """Matched requirement tokens per (employee, project), excluding certifications."""
+        return _dense(self.employee_terms @ self.project_terms.T)
+
+    def _term_fields(self):
+        return np.fromiter((field_idx for field_idx, _ in self.vocabulary), dtype=np.int64, count=len(self.vocabulary))
+
+    def _certificate_points(self, rows=None):
+        """(earned, counted): certificate credit per (employee, project) and whether it enters the total."""
+        counted = self.certified.astype(np.float64)
+        if rows is not None:
+            counted = counted[rows]
+        if self.certificate_terms is None:
+            return np.repeat(counted[:, None], len(self.project_index), axis=1), counted
+        # Share of the project's requirement tokens the certificate covers; full credit when nothing is required
+        certificate_terms = self.certificate_terms if rows is None else self.certificate_terms[rows]
+        covered = _dense(certificate_terms @ self.project_terms.T)
+        totals = self.project_totals.astype(np.float64)[None, :]
+        relevance = np.ones_like(covered)
+        np.divide(covered, totals, out=relevance, where=totals > 0)
+        return np.minimum(relevance, 1.0) * counted[:, None], counted
+
+    def scores(self):
+        """Full employee x project Match % matrix."""
+        if self.model is not None:
+            return self._weighted_scores()
+        cert = self.certified.astype(np.float64)[:, None]
+        matched = self.match_counts() + cert
+        total = self.project_totals.astype(np.float64)[None, :] + cert
+        out = np.zeros_like(matched)
+        np.divide(matched, total, out=out, where=total > 0)
+        return out * 100
+
+    def match_scores(self):
+        """Full Match % matrix in compact form, built a block of rows at a time.
+
+        Without a model, a MatchCounts holding the matched-token counts;
+        with one, a WeightedCounts holding them per criterion (weighted
+        points are not integers). Values equal scores() / score_breakdown()
+        exactly.
+        """
+        counts = self.empty_counts()
+        field_cols = [np.flatnonzero(self._term_fields() == field_idx) for field_idx in range(len(self.fields))]
+        for rows in row_chunks(len(self.employee_index), len(self.project_index)):
+            if self.model is None:
+                counts[rows] = _dense(self.employee_terms[rows] @ self.project_terms.T)
+                continue
+            employee_terms = self.employee_terms[rows]
+            for field_idx, cols in enumerate(field_cols):
+                counts[rows, :, field_idx] = _dense(employee_terms[:, cols] @ self.project_terms[:, cols].T)
+            if self.certificate_terms is not None:
+                counts[rows, :, -1] = _dense(self.certificate_terms[rows] @ self.project_terms.T)
+        return self.compact_scores(counts)
+
+    def _count_layout(self):
+        """(counts per pair, count dtype) of match_scores(): one count, or one per criterion with a model."""
+        planes = 1 if self.model is None else len(self.fields) + (self.certificate_terms is not None)
+        totals = self.project_totals
+        return planes, count_dtype(totals.max() if len(totals) else 0)
+
+    def pair_bytes(self):
+        """Bytes match_scores() keeps per (employee, project) pair."""
+        planes, dtype = self._count_layout()
+        return planes * dtype.itemsize
+
+    def empty_counts(self):
+        """Uninitialized count storage for match_scores(): employees x projects (x criteria with a model)."""
+        planes, dtype = self._count_layout()
+        shape = (len(self.employee_index), len(self.project_index))
+        return np.empty(shape if self.model is None else shape + (planes,), dtype=dtype)
+
+    def compact_scores(self, counts):
+        """The match_scores() matrix of counts filled in like empty_counts()."""
+        if self.model is None:
+            return MatchCounts(counts, self.certified, self.project_totals)
+        weights = [self.model.weight(emp_field) for emp_field, _ in self.fields]
+        return WeightedCounts(counts, self.certified, self.project_totals,
+                              weighted_totals(weights, self.project_field_totals), weights,
+                              self.model.weight(CERTIFICATIONS), self.certificate_terms is not None)
+
+    def _weighted_scores(self):
+        """Weighted Match % from one product: each project term column is scaled by its field's weight."""
+        weights = np.array([self.model.weight(emp_field) for emp_field, _ in self.fields], dtype=np.float64)
+        column_weights = weights[self._term_fields()]
+        if sparse is not None and sparse.issparse(self.project_terms):
+            weighted_terms = self.project_terms @ sparse.diags(column_weights)
+        else:
+            weighted_terms = self.project_terms * column_weights[None, :]
+        cert_weight = self.model.weight(CERTIFICATIONS)
+        earned, counted = self._certificate_points()
+        matched = _dense(self.employee_terms @ weighted_terms.T) + cert_weight * earned
+        total = (weights @ self.project_field_totals)[None, :] + cert_weight * counted[:, None]
+        out = np.zeros_like(matched)
+        np.divide(matched, total, out=out, where=total > 0)
+        return out * 100
+
+    def _weight(self, criterion):
+        return self.model.weight(criterion) if self.model is not None else 1.0
+
+    def score_breakdown(self, rows=None):
+        """(Match % matrix, {criterion: Match % points}) from one pass over the per-field products.
+
+        The contributions of a row add up to its Match %; criteria are the
+        employee field names plus 'Certifications'. Without a model every
+        criterion weighs 1, any certificate earns full credit and the Match %
+        equals scores() exactly. `rows` limits the result to those employee
+        positions (same values as the full matrix's rows).
+        """
+        weight = self._weight
+        employee_terms = self.employee_terms if rows is None else self.employee_terms[rows]
+        term_fields = self._term_fields()
+        points = {}
+        matched = np.zeros((employee_terms.shape[0], len(self.project_index)), dtype=np.float64)
+        total = np.zeros((1, len(self.project_index)), dtype=np.float64)
+        for field_idx, (emp_field, _) in enumerate(self.fields):
+            cols = np.flatnonzero(term_fields == field_idx)
+            points[emp_field] = weight(emp_field) * _dense(employee_terms[:, cols] @ self.project_terms[:, cols].T)
+            matched += points[emp_field]
+            total = total + weight(emp_field) * self.project_field_totals[field_idx][None, :]
+        earned, counted = self._certificate_points(rows)
+        points[CERTIFICATIONS] = weight(CERTIFICATIONS) * earned
+        matched += points[CERTIFICATIONS]
+        total = total + weight(CERTIFICATIONS) * counted[:, None]
+
+        scores = np.zeros_like(matched)
+        np.divide(matched, total, out=scores, where=total > 0)
+        scale = np.zeros_like(matched)
+        np.divide(100.0, total, out=scale, where=total > 0)
+        return scores * 100, {criterion: pts * scale for criterion, pts in points.items()}
+
+    def candidate_share(self):
+        """Upper bound on the share of (employee, project) pairs candidate_scores() returns.
+
+        Sums, per project, the postings lengths (employees holding the term)
+        of its requirement terms, certificate skills included, capped at the
+        roster size; no product is computed.
+        """
+        n_rows, n_projects = len(self.employee_index), len(self.project_index)
+        if n_rows == 0 or n_projects == 0:
+            return 0.0
+        postings = np.asarray((self.employee_terms != 0).sum(axis=0), dtype=np.float64).ravel()
+        if self.certificate_terms is not None:
+            postings += np.asarray((self.certificate_terms != 0).sum(axis=0), dtype=np.float64).ravel()
+        required = (self.project_terms != 0).astype(np.float64)
+        per_project = np.minimum(np.asarray(required @ postings).ravel(), n_rows)
+        return float(per_project.sum()) / (n_rows * n_projects)
+
+    def candidate_scores(self):
+        """Match % only for the (employee, project) pairs that share a term, scored like score_breakdown.
+
+        Returns (rows, cols, scores, floor), pairs ordered by column then row.
+        Each project's candidates are the union of the postings (term ->
+        employees) of its requirement terms, certificate skills included
+        under a relevance model. Every other pair scores floor[col] if the
+        employee holds a counted certificate (a certification-only match),
+        else 0.
+        """
+        n_projects = len(self.project_index)
+        if sparse is None:
+            # Without SciPy every positive pair is a candidate, so no floor is needed
+            scores = self.score_breakdown()[0]
+            rows, cols = np.nonzero(scores > 0)
+            return rows, cols, scores[rows, cols], np.zeros(n_projects)
+
+        # Same operations, in the same order, as score_breakdown; the sparse sums skip zero terms,
+        # which changes no value, and their nonzeros are the union of the postings lists
+        weight = self._weight
+        term_fields = self._term_fields()
+        points = None
+        total = np.zeros(n_projects, dtype=np.float64)
+        for field_idx, (emp_field, _) in enumerate(self.fields):
+            field_cols = np.flatnonzero(term_fields == field_idx)
+            field_points = weight(emp_field) * (self.employee_terms[:, field_cols] @ self.project_terms[:, field_cols].T)
+            points = field_points if points is None else points + field_points
+            total = total + weight(emp_field) * self.project_field_totals[field_idx]
+        if points is None:
+            points = sparse.csr_matrix((len(self.employee_index), n_projects))
+        if self.certificate_terms is None:
+            pairs = sparse.csc_matrix(points)
+        else:
+            covered = self.certificate_terms @ self.project_terms.T
+            pairs = sparse.csc_matrix(abs(points) + covered)
+        pairs.sort_indices()
+        rows = pairs.indices.astype(np.int64)
+        cols = np.repeat(np.arange(n_projects), np.diff(pairs.indptr))
+        counted = self.certified.astype(np.float64)
+        totals = self.project_totals.astype(np.float64)
+        if self.certificate_terms is None:
+            matched = pairs.data.astype(np.float64)
+            earned = counted[rows]
+            floor_earned = np.ones(n_projects)
+        else:
+            matched = _align(points, pairs)
+            covered = _align(covered, pairs)
+            relevance = np.ones_like(covered)
+            np.divide(covered, totals[cols], out=relevance, where=totals[cols] > 0)
+            earned = np.minimum(relevance, 1.0) * counted[rows]
+            # A certificate covers none of a non-candidate's project terms: full credit only when nothing is required
+            floor_earned = (totals <= 0).astype(np.float64)
+        cert_weight = weight(CERTIFICATIONS)
+        matched += cert_weight * earned
+        pair_total = total[cols] + cert_weight * counted[rows]
+        scores = np.zeros_like(matched)
+        np.divide(matched, pair_total, out=scores, where=pair_total > 0)
+
+        floor_matched = np.zeros(n_projects) + cert_weight * floor_earned
+        floor_total = total + cert_weight * 1.0
+        floor = np.zeros(n_projects)
+        np.divide(floor_matched, floor_total, out=floor, where=floor_total > 0)
+        return rows, cols, scores * 100, floor * 100
+
+def _dense(product):
+    if sparse is not None and sparse.issparse(product):
+        product = product.toarray()
+    return np.asarray(product, dtype=np.float64)
+
+def _align(matrix, pairs):
+    """Values of a sparse matrix at the nonzeros of `pairs` (sorted CSC, same shape, superset structure)."""
+    matrix = sparse.csc_matrix(matrix)
+    matrix.sum_duplicates()
+    n_rows = pairs.shape[0]
+    keys = np.repeat(np.arange(pairs.shape[1], dtype=np.int64), np.diff(pairs.indptr)) * n_rows + pairs.indices
+    found = np.repeat(np.arange(matrix.shape[1], dtype=np.int64), np.diff(matrix.indptr)) * n_rows + matrix.indices
+    values = np.zeros(len(keys), dtype=np.float64)
+    values[np.searchsorted(keys, found)] = matrix.data
+    return values
+
+def _resize_columns(matrix, n_cols):
+    """Widen a term matrix to n_cols columns (terms added after it was built are all zero)."""
+    if sparse is not None and sparse.issparse(matrix):
+        return sparse.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], n_cols))
+    return np.pad(matrix, ((0, 0), (0, n_cols - matrix.shape[1])))
+
+def _build_matrix(rows, cols, data, shape):
+    if sparse is not None:
+        # Duplicate (row, col) entries are summed, which gives repeated requirement tokens their weight
+        return sparse.csr_matrix((data, (rows, cols)), shape=shape)
+    dense = np.zeros(shape, dtype=np.asarray(data).dtype)
+    np.add.at(dense, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), data)
+    return dense
+
+def compute_match_matrix(employees, projects, fields=MATCH_FIELDS, skill_vocabulary=None, model=None):
+    """Score every employee against every project in one batched pass."""
+    return SkillMatrix(employees, projects, fields, skill_vocabulary, model).scores()
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+ASSIGNED_FLAG = 'Are you currently assigned to a project?'
+END_DATE = 'Please Enter Your End Date'
+
+# Low-cardinality text columns stored as categoricals (values repeat across thousands of rows)
+CATEGORY_COLUMNS = [
+    'Availability', ASSIGNED_FLAG, 'Time Zone', 'Role',
+    'Languages', 'Experience', 'Skills', 'Tools', 'Certifications',
+]
+
+# -------------------- Column Helpers --------------------
+
+def _normalized_labels(series):
+    """Stripped, lowercased values, computed once per category instead of once per row."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        labels = series.cat.categories.astype(str).str.strip().str.lower()
+        codes = series.cat.codes.to_numpy()
+        out = np.asarray(labels, dtype=object)[codes]
+        out[codes < 0] = 'nan'
+        return out
+    return series.astype(str).str.strip().str.lower().to_numpy()
+
+def available_hours(availability):
+    """Weekly hours per employee: 40 for Full-Time, 20 for anything else."""
+    return np.where(_normalized_labels(availability) == 'full-time', 40, 20)
+
+def is_unassigned(flag):
+    """True where the assignment flag reads 'no' (case and whitespace insensitive)."""
+    return _normalized_labels(flag) == 'no'
+
+def to_categories(df, columns=CATEGORY_COLUMNS):
+    """Convert the listed text columns that exist in df to categoricals, in place."""
+    for col in columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    if ASSIGNED_FLAG in df.columns:
+        # Assignment code writes 'Yes' back into this column, so both labels must exist
+        missing = [v for v in ('Yes', 'No') if v not in df[ASSIGNED_FLAG].cat.categories]
+        if missing:
+            df[ASSIGNED_FLAG] = df[ASSIGNED_FLAG].cat.add_categories(missing)
+    return df
+
+# -------------------- Normalizers --------------------
+
+def normalize_intern_records(df):
+    """Latest record per intern (highest Id per Name1) with typed columns, in one pass.
+
+    Rows are ordered by Id descending, the first row per normalized Name1 is
+    kept and all column edits happen on that single selection instead of on
+    several intermediate copies of the full export.
+    """
+    order = np.argsort(-df['Id'].to_numpy(), kind='stable')
+    name_key = df['Name1'].str.strip().str.lower().take(order)
+    keep = order[~name_key.duplicated().to_numpy()]
+
+    columns = [pos for pos, c in enumerate(df.columns) if c != 'Name']
+    out = df.iloc[keep, columns]
+    out = out.rename(columns={'Name1': 'Name'})
+    out['Name'] = out['Name'].str.title()
+    out[END_DATE] = pd.to_datetime(out[END_DATE], errors='coerce')
+    return to_categories(out)
+
+def normalize_employee_data(df):
+    """Typed version2 roster: parsed End Date, integer counters and categorical text columns."""
+    df = df.copy()
+    df['End Date'] = pd.to_datetime(df['End Date'], errors='coerce')
+    for col in ('Current Projects', 'Current Availability'):
+        if col in df.columns:
+            df[col] = df[col].fillna(0).astype(int)
+    return to_categories(df)
@@ -0,0 +1,181 @@
+"""Process-pool scoring for very large rosters.
+
+The roster is tokenized once in the parent process and its employee x term
+matrices are placed in shared memory; worker processes attach to them instead
+of receiving a pickled copy. Projects are split into shards, each worker scores
+its shard with SkillMatrix.match_scores() (so a ScoringModel weights it exactly
+as in one process) and returns either the shard's matched-token counts, which
+the parent copies into its one compact output matrix as they arrive, or only
+the shard's top-k lists.
+"""
+
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from workforce.matching import MATCH_FIELDS, SkillMatrix, sparse
+from workforce.ranking import top_k
+
+# Per-worker state set by _init_worker
+_worker = {}
+
+# -------------------- Shared Memory --------------------
+
+def _share(arrays):
+    """Copy named arrays into shared memory blocks; returns (blocks, picklable layout)."""
+    blocks, layout = [], {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        blocks.append(block)
+        layout[name] = (block.name, array.shape, array.dtype.str)
+    return blocks, layout
+
+def _attach(layout):
+    """Map a shared layout back to NumPy views; returns (blocks, arrays)."""
+    blocks, arrays = [], {}
+    for name, (block_name, shape, dtype) in layout.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return blocks, arrays
+
+def _employee_arrays(matrix, prefix=''):
+    """Flatten an employee x term matrix (CSR or dense) into plain arrays for sharing."""
+    if sparse is not None and sparse.issparse(matrix):
+        return {prefix + 'indptr': matrix.indptr, prefix + 'indices': matrix.indices, prefix + 'data': matrix.data}
+    return {prefix + 'dense': matrix}
+
+def _employee_matrix(arrays, n_terms, prefix=''):
+    if prefix + 'dense' in arrays:
+        return arrays[prefix + 'dense']
+    indptr = arrays[prefix + 'indptr']
+    return sparse.csr_matrix((arrays[prefix + 'data'], arrays[prefix + 'indices'], indptr),
+                             shape=(len(indptr) - 1, n_terms))
+
+def _template(skills):
+    """A picklable SkillMatrix without its employee-side arrays, which the workers attach from shared memory."""
+    template = copy.copy(skills)
+    template.employee_terms = template.certificate_terms = template.certified = None
+    # Only needed while tokenizing, which is done
+    template.skill_vocabulary = None
+    template.employee_index = pd.RangeIndex(len(skills.employee_index))
+    return template
+
+def _project_shard(skills, start, stop):
+    """The same SkillMatrix restricted to project columns start:stop."""
+    shard = copy.copy(skills)
+    shard.project_terms = skills.project_terms[start:stop]
+    shard.project_field_totals = skills.project_field_totals[:, start:stop]
+    shard.project_totals = skills.project_totals[start:stop]
+    shard.project_index = skills.project_index[start:stop]
+    return shard
+
+# -------------------- Worker --------------------
+
+def _init_worker(layout, skills):
+    blocks, arrays = _attach(layout)
+    _worker['blocks'] = blocks  # keep the mappings alive for the worker's lifetime
+    _worker['arrays'] = arrays
+    n_terms = len(skills.vocabulary)
+    skills.employee_terms = _employee_matrix(arrays, n_terms)
+    if 'certificate_indptr' in arrays or 'certificate_dense' in arrays:
+        skills.certificate_terms = _employee_matrix(arrays, n_terms, 'certificate_')
+    skills.certified = arrays['certified']
+    _worker['skills'] = skills
+
+def _score_shard(start, stop, k):
+    """Score one shard of projects; returns its counts (k None) or its top-k per column."""
+    scores = _project_shard(_worker['skills'], start, stop).match_scores()
+    if k is None:
+        # The matched-token counts are all the parent needs to rebuild the compact matrix
+        return start, scores.counts
+    ids = _worker['arrays']['ids']
+    shard_top = []
+    for col in range(stop - start):
+        column = scores[:, col]
+        positions = top_k(column, k, ids)
+        shard_top.append((positions, column[positions]))
+    return start, shard_top
+
+# -------------------- Driver --------------------
+
+def default_workers():
+    """One worker per available CPU."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def _shards(n_projects, workers, shards_per_worker=4):
+    """Contiguous project ranges; a few per worker so uneven shards balance out."""
+    n_shards = max(1, min(n_projects, workers * shards_per_worker))
+    bounds = np.linspace(0, n_projects, n_shards + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+def _run(skills, ids, workers, k):
+    """Score every project shard in the pool; the full scores when k is None, else top-k per column."""
+    arrays = _employee_arrays(skills.employee_terms)
+    if skills.certificate_terms is not None:
+        arrays.update(_employee_arrays(skills.certificate_terms, 'certificate_'))
+    arrays['certified'] = skills.certified
+    arrays['ids'] = np.asarray(ids)
+
+    blocks, layout = _share(arrays)
+    try:
+        output = skills.empty_counts() if k is None else {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(layout, _template(skills))) as pool:
+            shards = _shards(len(skills.project_index), workers)
+            # Results are copied into the output as they arrive; no future is kept, so each is released after
+            for future in as_completed([pool.submit(_score_shard, a, b, k) for a, b in shards]):
+                start, result = future.result()
+                if k is None:
+                    output[:, start:start + result.shape[1]] = result
+                else:
+                    output.update((start + offset, entry) for offset, entry in enumerate(result))
+        return skills.compact_scores(output) if k is None else output
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def parallel_scores(skills, workers=None):
+    """SkillMatrix.match_scores(), scored across a process pool."""
+    workers = workers or default_workers()
+    if workers <= 1 or len(skills.project_index) == 0:
+        return skills.match_scores()
+    return _run(skills, np.arange(len(skills.employee_index)), workers, None)
+
+def parallel_rankings(skills, k, ids, workers=None):
+    """Top-k (positions, scores) per project column of a SkillMatrix, merged from per-shard worker results.
+
+    Only k rows per project travel back from the workers, so this never
+    materializes the full score matrix in the parent.
+    """
+    workers = workers or default_workers()
+    ids = np.asarray(ids)
+    if workers <= 1 or len(skills.project_index) == 0:
+        scores = skills.match_scores()
+        top = {}
+        for col in range(scores.shape[1]):
+            column = scores[:, col]
+            positions = top_k(column, k, ids)
+            top[col] = (positions, column[positions])
+        return top
+    return _run(skills, ids, workers, k)
+
+def parallel_match_matrix(employees, projects, workers=None, fields=MATCH_FIELDS, skill_vocabulary=None, model=None):
+    """Full employee x project Match % matrix, scored across a process pool (see parallel_scores)."""
+    return parallel_scores(SkillMatrix(employees, projects, fields, skill_vocabulary, model), workers)
+
+def parallel_top_k(employees, projects, k=10, ids=None, workers=None, fields=MATCH_FIELDS,
+                   skill_vocabulary=None, model=None):
+    """Top-k (positions, scores) per project column (see parallel_rankings)."""
+    ids = np.arange(len(employees)) if ids is None else ids
+    return parallel_rankings(SkillMatrix(employees, projects, fields, skill_vocabulary, model), k, ids, workers)
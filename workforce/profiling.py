@@ -0,0 +1,150 @@
+"""Per-stage timings, row counts and memory deltas for the matching pipeline.
+
+Library code marks its stages with `span('filter')`; nothing is recorded
+unless a Trace is active in the current thread (or asyncio task):
+
+    with Trace(profile=True) as trace:
+        assign_employees_to_projects(projects, employees)
+    trace.records      # [{'stage': 'filter', 'depth': 0, 'seconds': ..., 'mem_mb': ..., 'rows': ...}, ...]
+    trace.profile_text()
+
+Without an active trace, span() is one context-variable lookup that returns
+a shared no-op span. Memory deltas are resident-set-size differences (psutil
+when installed, else /proc/self/statm), which are cheap enough to take
+around every stage, unlike tracemalloc. Work done in process-pool workers is
+timed as a whole but not profiled.
+"""
+
+import contextvars
+import cProfile
+import io
+import os
+import pstats
+import time
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; fall back to /proc on Linux
+    psutil = None
+
+_current = contextvars.ContextVar('workforce_trace', default=None)
+
+def _rss_bytes():
+    """Resident set size of this process, or None where it cannot be read cheaply."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+# -------------------- Spans --------------------
+
+class _NullSpan:
+    """Stand-in returned when tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def note(self, **fields):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """One timed stage; note(rows=..., ...) adds fields once they are known inside the block."""
+
+    def __init__(self, trace, name, fields):
+        self.trace = trace
+        self.name = name
+        self.fields = fields
+
+    def note(self, **fields):
+        self.fields.update(fields)
+
+    def __enter__(self):
+        trace = self.trace
+        self._slot = len(trace.records)
+        self._depth = len(trace._stack)
+        trace.records.append(None)   # parents are listed before their children
+        trace._stack.append(self)
+        self._rss = _rss_bytes() if trace.memory else None
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self._start
+        trace = self.trace
+        trace._stack.pop()
+        record = {'stage': self.name, 'depth': self._depth, 'seconds': round(seconds, 6)}
+        if self._rss is not None:
+            after = _rss_bytes()
+            if after is not None:
+                record['mem_mb'] = round((after - self._rss) / 1e6, 2)
+        record.update(self.fields)
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        trace.records[self._slot] = record
+        if trace.sink is not None:
+            trace.sink(record)
+        return False
+
+def span(name, **fields):
+    """Time a pipeline stage in the active Trace; a no-op when none is active."""
+    trace = _current.get()
+    if trace is None:
+        return _NULL_SPAN
+    return Span(trace, name, fields)
+
+# -------------------- Trace --------------------
+
+class Trace:
+    """Collects the spans opened while it is active, optionally under cProfile.
+
+    memory=False skips the resident-size reads; sink, when given, is called
+    with each record as its span closes (the CLI writes them as JSON lines).
+    A trace belongs to the thread that entered it.
+    """
+
+    def __init__(self, memory=True, profile=False, sink=None):
+        self.memory = memory
+        self.sink = sink
+        self.records = []
+        self.profiler = cProfile.Profile() if profile else None
+        self._stack = []
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current.set(self)
+        if self.profiler is not None:
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profiler is not None:
+            self.profiler.disable()
+        _current.reset(self._token)
+        return False
+
+    def total(self, stage):
+        """Seconds spent in every span with the given name."""
+        return sum(r['seconds'] for r in self.records if r is not None and r['stage'] == stage)
+
+    def profile_text(self, limit=30, sort='cumulative'):
+        """The profiler's top functions as pstats text ('' when not profiling)."""
+        if self.profiler is None:
+            return ''
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def dump_profile(self, path):
+        """Write the raw profile for snakeviz / pstats."""
+        if self.profiler is not None:
+            self.profiler.dump_stats(path)
@@ -0,0 +1,188 @@
+import numpy as np
+
+from workforce.compact import as_score_matrix
+
+# -------------------- Top-k Selection --------------------
+
+def top_k(scores, k, ids, min_score=0):
+    """Positions of the k best scores above min_score, best first, ties broken by ascending id.
+
+    Uses argpartition so only the selected slice is sorted: O(N + k log k)
+    instead of a full O(N log N) sort per project.
+    """
+    scores = np.asarray(scores)
+    ids = np.asarray(ids)
+    candidates = np.flatnonzero(scores > min_score)
+    if k <= 0:
+        return candidates[:0]
+    if k < len(candidates):
+        part = np.argpartition(-scores[candidates], k - 1)[:k]
+        kth_score = scores[candidates[part]].min()
+        # Keep every tie at the cut-off so the id tie-break decides who gets in
+        candidates = candidates[scores[candidates] >= kth_score]
+    order = np.lexsort((ids[candidates], -scores[candidates]))
+    return candidates[order][:k]
+
+# -------------------- Ranking Index --------------------
+
+class RankingIndex:
+    """Reusable per-project rankings over a precomputed employee x project score matrix.
+
+    Each project's ranked prefix is cached and grown by doubling, so asking for
+    top-10, then top-25, then top-50, then paging through candidates never
+    rescores and never resorts the whole roster.
+    """
+
+    def __init__(self, scores, ids, min_score=0):
+        self.scores = as_score_matrix(scores)
+        self.ids = np.asarray(ids)
+        self.min_score = min_score
+        self._ranked = {}
+        self._complete = set()
+
+    def top(self, project, k):
+        """Positions of the top k employees for a project column."""
+        ranked = self._ranked.get(project)
+        if ranked is None or (len(ranked) < k and project not in self._complete):
+            size = max(k, 2 * len(ranked)) if ranked is not None else k
+            ranked = top_k(self.scores[:, project], size, self.ids, self.min_score)
+            self._ranked[project] = ranked
+            if len(ranked) < size:
+                self._complete.add(project)
+        return ranked[:k]
+
+    def page(self, project, offset, limit):
+        """Positions ranked offset to offset + limit (0-based) for a project column."""
+        return self.top(project, offset + limit)[offset:]
+
+    def seed(self, project, ranked, k):
+        """Cache a project's top k computed elsewhere from the same scores, ids and min_score."""
+        self._ranked[project] = np.asarray(ranked, dtype=np.int64)
+        if len(ranked) < k:
+            self._complete.add(project)
+
+    def values(self, positions, project):
+        """Match % of the given employee positions for a project."""
+        return self.scores[positions, project]
+
+    def count(self, project):
+        """Number of employees with a score above min_score for a project."""
+        return int(np.count_nonzero(self.scores[:, project] > self.min_score))
+
+# -------------------- Candidate Ranking --------------------
+
+class CandidateRanking:
+    """Per-project rankings from candidate scores only, without an employee x project matrix.
+
+    Takes SkillMatrix.candidate_scores(): (rows, cols, scores) for the pairs
+    that share a term and, per project, the `floor` score every other
+    certified employee gets. Those certification-only matches all tie, so
+    only the `k` lowest ids among them can reach a top k and they are merged
+    in without enumerating the rest. Anyone else scores 0, so min_score must
+    be at least 0. Rankings equal RankingIndex over the dense matrix.
+    """
+
+    def __init__(self, n_employees, rows, cols, scores, floor, certified, ids, min_score=0):
+        if min_score < 0:
+            raise ValueError("CandidateRanking needs min_score >= 0 (non-candidates score 0)")
+        rows, cols, scores = np.asarray(rows), np.asarray(cols), np.asarray(scores)
+        keys = cols.astype(np.int64) * n_employees + rows
+        if np.any(keys[1:] < keys[:-1]):
+            order = np.argsort(keys, kind='stable')
+            rows, cols, scores = rows[order], cols[order], scores[order]
+        self.rows = rows
+        self.scores = scores
+        self.indptr = np.searchsorted(cols, np.arange(len(floor) + 1))
+        self.floor = np.asarray(floor)
+        self.certified = np.asarray(certified, dtype=bool)
+        self.ids = np.asarray(ids)
+        self.min_score = min_score
+        self.n_employees = n_employees
+        positions = np.flatnonzero(self.certified)
+        # Certified employees in tie-break order (id, then roster position)
+        self._floor_order = positions[np.lexsort((positions, self.ids[positions]))]
+
+    def __len__(self):
+        """Number of scored (employee, project) candidate pairs."""
+        return len(self.rows)
+
+    def _pool(self, project, k):
+        """(positions, scores) of everyone who can reach the project's top k, in roster order."""
+        start, end = self.indptr[project], self.indptr[project + 1]
+        positions, scores = self.rows[start:end], self.scores[start:end]
+        floor = self.floor[project]
+        if floor > self.min_score and k > 0:
+            # At most `end - start` of the first candidates can already be in the postings
+            extra = self._floor_order[:k + end - start]
+            extra = extra[~np.isin(extra, positions)][:k]
+            positions = np.concatenate([positions, extra])
+            scores = np.concatenate([scores, np.full(len(extra), floor)])
+            order = np.argsort(positions, kind='stable')
+            positions, scores = positions[order], scores[order]
+        return positions, scores
+
+    def top(self, project, k):
+        """Positions of the top k employees for a project column."""
+        positions, scores = self._pool(project, k)
+        return positions[top_k(scores, k, self.ids[positions], self.min_score)]
+
+    def page(self, project, offset, limit):
+        """Positions ranked offset to offset + limit (0-based) for a project column."""
+        return self.top(project, offset + limit)[offset:]
+
+    def values(self, positions, project):
+        """Match % of the given employee positions for a project."""
+        positions = np.asarray(positions, dtype=np.int64)
+        start, end = self.indptr[project], self.indptr[project + 1]
+        rows = self.rows[start:end]
+        found = np.searchsorted(rows, positions)
+        hit = found < len(rows)
+        hit[hit] = rows[found[hit]] == positions[hit]
+        values = np.where(self.certified[positions], self.floor[project], 0.0)
+        values[hit] = self.scores[start:end][found[hit]]
+        return values
+
+    def count(self, project):
+        """Number of employees with a score above min_score for a project."""
+        start, end = self.indptr[project], self.indptr[project + 1]
+        above = int(np.count_nonzero(self.scores[start:end] > self.min_score))
+        if self.floor[project] > self.min_score:
+            above += len(self._floor_order) - int(np.count_nonzero(self.certified[self.rows[start:end]]))
+        return above
+
+# -------------------- Ranked Prefixes --------------------
+
+class RankedPrefixes:
+    """Per-project rankings known only up to a fixed depth, e.g. the top lists of parallel_rankings.
+
+    `ranked` maps each project column to (positions, scores) of its best
+    `depth` employees. Asking past the depth of a ranking that goes on raises
+    ValueError: those employees were never sent back.
+    """
+
+    def __init__(self, ranked, depth):
+        self.ranked = ranked
+        self.depth = depth
+
+    def top(self, project, k):
+        """Positions of the top k employees for a project column."""
+        positions = self.ranked[project][0]
+        if k > self.depth and len(positions) == self.depth:
+            raise ValueError(f"Rankings were only kept to depth {self.depth}, asked for {k}")
+        return positions[:k]
+
+    def page(self, project, offset, limit):
+        """Positions ranked offset to offset + limit (0-based) for a project column."""
+        return self.top(project, offset + limit)[offset:]
+
+    def values(self, positions, project):
+        """Match % of the given employee positions (all within the kept prefix) for a project."""
+        ranked, scores = self.ranked[project]
+        order = np.argsort(ranked)
+        return scores[order[np.searchsorted(ranked, positions, sorter=order)]]
+
+def employee_ids(employees):
+    """Tie-break ids for a roster: the 'Id' column when present, otherwise row order."""
+    if 'Id' in employees.columns:
+        return employees['Id'].to_numpy()
+    return np.arange(len(employees))
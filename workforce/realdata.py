@@ -0,0 +1,344 @@
+"""Matching backend for the intern records schema used by version2realdata.py."""
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from workforce.assignment import optimal_assignment, project_members
+from workforce.availability import (
+    VALID_AFTER_DAYS, AvailabilityCalendar, CalendarLedger, planning_date, project_windows
+)
+from workforce.capacity import DEFAULT_MAX_PROJECTS, CapacityLedger, parse_weekly_hours, schedule_hours
+from workforce.matching import SkillMatrix, compute_match_matrix
+from workforce.normalize import available_hours, is_unassigned
+from workforce.parallel import parallel_rankings, parallel_scores
+from workforce.profiling import span
+from workforce.ranking import CandidateRanking, RankedPrefixes, RankingIndex, employee_ids, top_k
+
+# Bytes per candidate pair while top mode builds and ranks them (indices, scores and sort keys)
+CANDIDATE_PAIR_BYTES = 32
+
+# -------------------- Helper Functions --------------------
+
+def parsed_end_dates(df):
+    """The end date column as datetimes (df itself is left unchanged)."""
+    end_dates = df['Please Enter Your End Date']
+    if not pd.api.types.is_datetime64_any_dtype(end_dates):
+        end_dates = pd.to_datetime(end_dates, errors='coerce')
+    return end_dates
+
+def valid_employee_mask(df, today=None):
+    """Unassigned employees whose end date is more than VALID_AFTER_DAYS after today, as a boolean array."""
+    threshold_date = planning_date(today) + timedelta(days=VALID_AFTER_DAYS)
+    return (parsed_end_dates(df) > threshold_date).to_numpy() & is_unassigned(df['Are you currently assigned to a project?'])
+
+def with_parsed_columns(valid_df):
+    """Parsed end dates and weekly 'Available Hours' on a selection of employees (a new frame)."""
+    return valid_df.assign(**{
+        'Please Enter Your End Date': parsed_end_dates(valid_df),
+        'Available Hours': available_hours(valid_df['Availability']),
+    })
+
+def filter_valid_employees(df, today=None):
+    """Filter employees who are not currently assigned to any project (returns a new frame)."""
+    with span('filter', rows_in=len(df)) as stage:
+        valid_df = df[valid_employee_mask(df, today)]
+        stage.note(rows=len(valid_df))
+        return with_parsed_columns(valid_df)
+
+def available_employees(df, projects_df, today=None):
+    """(Employees free for at least one project, employees x projects availability mask).
+
+    An employee is available for a project when their stay covers its date
+    window (see project_windows) with at least its hours/week commitment free.
+    """
+    with span('filter', rows_in=len(df), windows=len(projects_df)) as stage:
+        calendar = AvailabilityCalendar.from_intern_records(df)
+        starts, stops = project_windows(projects_df, today)
+        hours_per_person = parse_weekly_hours(projects_df['Time Commitment per Person (hrs/week)'])
+        mask = calendar.available(starts, stops, hours_per_person)
+        keep = mask.any(axis=1)
+        stage.note(rows=int(keep.sum()))
+        return with_parsed_columns(df[keep]), mask[keep]
+
+def select_employees(df, projects_df, project_dates=False, today=None):
+    """(Valid employees, availability mask or None): the fixed horizon, or each project's own dates."""
+    if project_dates:
+        return available_employees(df, projects_df, today)
+    return filter_valid_employees(df, today), None
+
+def calculate_match_percentage(employee, project):
+    """Calculate match percentage based on Languages, Experience, Tools, and Certifications."""
+    match_count = 0
+    total_count = 0
+    match_fields = [
+        ('Languages', 'Langauages proficiency required (e.g. Python, Java)'),
+        ('Experience', 'Skills Required (e.g. Risk Management, Data Analysis, Data Visualization )'),
+        ('Tools', 'Tools (e.g. Power BI, Jira)')
+    ]
+    
+    for emp_field, proj_field in match_fields:
+        emp_val = str(employee[emp_field]).strip().lower().split(';')
+        proj_val = str(project[proj_field]).strip().lower().split(',')
+        if proj_val and proj_val[0] != 'n/a' and proj_val[0] != '':
+            total_count += len(proj_val)
+            match_count += sum(1 for val in proj_val if val.strip() in [v.strip() for v in emp_val])
+    
+    if pd.notna(employee['Certifications']) and str(employee['Certifications']).strip().lower() != 'n/a':
+        total_count += 1
+        match_count += 1
+    
+    return (match_count / total_count) * 100 if total_count else 0
+
+def match_scores(valid_employees, projects_df, workers=1, skill_vocabulary=None, scoring=None, availability=None):
+    """(Match % matrix, SkillMatrix) in the compact form the assignment modes use.
+
+    The matrix is SkillMatrix.match_scores() (matched-token counts, per criterion with a model),
+    computed across `workers` processes when more than one. The SkillMatrix is returned for
+    explain_rows. Pairs outside an availability mask score 0.
+    """
+    with span('score', rows=len(valid_employees), projects=len(projects_df), workers=workers):
+        skills = SkillMatrix(valid_employees, projects_df, skill_vocabulary=skill_vocabulary, model=scoring)
+        if workers > 1:
+            match_matrix = parallel_scores(skills, workers)
+        else:
+            match_matrix = skills.match_scores()
+        if availability is not None:
+            match_matrix = match_matrix.masked(availability)
+        return match_matrix, skills
+
+def explain_rows(skills, rows):
+    """Per-criterion contributions for the given roster positions (None without a scoring model)."""
+    if skills.model is None:
+        return None
+    with span('explain', rows=len(rows)):
+        return skills.score_breakdown(rows=rows)[1]
+
+def with_breakdown(table, contributions, rows, col):
+    """Add a '<criterion> pts' column per scoring criterion (rows index the contribution matrices)."""
+    if contributions is None:
+        return table
+    return table.assign(**{f"{criterion} pts": points[rows, col] for criterion, points in contributions.items()})
+
+def shown_rows(top, n_employees):
+    """(positions shown in any top list, row of each roster position among them or -1)."""
+    shown = np.unique(np.concatenate([np.zeros(0, dtype=np.int64), *top]))
+    breakdown_row = np.full(n_employees, -1, dtype=np.int64)
+    breakdown_row[shown] = np.arange(len(shown))
+    return shown, breakdown_row
+
+def match_employees_to_project(project, available_employees):
+    """Match employees to a project based on requirements and update availability."""
+    required_people = int(project['Number of Employees Needed'])
+    scores = compute_match_matrix(available_employees, project.to_frame().T)[:, 0]
+    available_employees.loc[:, 'Match %'] = scores
+
+    positions = top_k(scores, required_people, employee_ids(available_employees))
+    selected = available_employees.iloc[positions]
+    available_employees = available_employees[available_employees['Match %'] > 0]
+    
+    for idx in selected.index:
+        available_employees.loc[idx, 'Are you currently assigned to a project?'] = 'Yes'
+    
+    return selected.copy(), available_employees
+
+class ProjectRankings:
+    """Every project's ranking of the valid employees, from which top-match tables of any length are cut.
+
+    `ranking` answers page(project, offset, limit) and values(positions, project)
+    (RankingIndex, CandidateRanking or RankedPrefixes); `explain(rows)` gives the
+    per-criterion contributions for roster positions, or None. The tables of the
+    last few pages asked for are kept, so rereading them costs nothing.
+    """
+
+    MAX_PAGES = 4
+
+    def __init__(self, valid_employees, project_names, ranking, explain):
+        self.valid_employees = valid_employees
+        self.project_names = list(project_names)
+        self.ranking = ranking
+        self.explain = explain
+        self._pages = {}
+
+    def page(self, offset=0, limit=10):
+        """{project: table of the employees ranked offset to offset + limit (0-based)}."""
+        key = (offset, limit)
+        if key not in self._pages:
+            with span('assign', mode='top'):
+                # Top matches with Match % > 0, ties broken by Id
+                top = [self.ranking.page(col, offset, limit) for col in range(len(self.project_names))]
+            shown, breakdown_row = shown_rows(top, len(self.valid_employees))
+            contributions = self.explain(shown)
+            tables = {}
+            with span('tables', projects=len(self.project_names)):
+                for col, project_name in enumerate(self.project_names):
+                    positions = top[col]
+                    table = self.valid_employees.iloc[positions][[
+                        'Name', 'Availability', 'Languages', 'Experience', 'Tools', 'Certifications'
+                    ]]
+                    tables[project_name] = with_breakdown(
+                        table.assign(**{'Match %': self.ranking.values(positions, col)}), contributions,
+                        breakdown_row[positions], col
+                    )
+            if len(self._pages) >= self.MAX_PAGES:
+                self._pages.pop(next(iter(self._pages)))
+            self._pages[key] = tables
+        return self._pages[key]
+
+def rank_employees(projects_df, employee_df, depth=10, matcher=None, workers=1, skill_vocabulary=None,
+                   scoring=None, project_dates=False, today=None):
+    """(ProjectRankings, valid employees) for top mode; see assign_employees_to_projects.
+
+    depth is how many ranks are computed up front: an IncrementalMatcher keeps that many
+    current across updates and worker processes send that many back per project, and the
+    latter rankings cannot be read past it. The single-process rankings grow on demand.
+    """
+    if matcher is not None and project_dates:
+        raise ValueError("project_dates is not supported with an IncrementalMatcher")
+    valid_employees, availability = select_employees(employee_df, projects_df, project_dates, today)
+    ids = employee_ids(valid_employees)
+
+    if matcher is not None:
+        with span('score', rows=len(valid_employees), projects=len(projects_df), incremental=True) as stage:
+            update = matcher.update(valid_employees, projects_df, depth)
+            stage.note(rescored_employees=update.rescored_employees, rescored_projects=update.rescored_projects)
+        # The matcher's top lists come from the same scores and tie-break, so they seed the index
+        ranking = RankingIndex(update.scores, ids)
+        for col, project_name in enumerate(projects_df['Project Name']):
+            ranking.seed(col, update.top[project_name], matcher.top_n)
+
+        def explain(rows):
+            if matcher.model is None:
+                return None
+            with span('explain', rows=len(rows)):
+                return SkillMatrix(valid_employees.iloc[rows], projects_df, matcher.fields,
+                                   matcher.skill_vocabulary, matcher.model).score_breakdown()[1]
+    elif availability is None and workers > 1:
+        # Each worker scores and ranks a shard of projects; only the top lists come back
+        with span('score', rows=len(valid_employees), projects=len(projects_df), workers=workers) as stage:
+            skills = SkillMatrix(valid_employees, projects_df, skill_vocabulary=skill_vocabulary, model=scoring)
+            ranking = RankedPrefixes(parallel_rankings(skills, depth, ids, workers), depth)
+            stage.note(ranked=True)
+        explain = lambda rows: explain_rows(skills, rows)
+    elif availability is not None:
+        # Score every employee against every project (split across processes with more workers)
+        match_matrix, skills = match_scores(
+            valid_employees, projects_df, workers, skill_vocabulary, scoring, availability
+        )
+        ranking = RankingIndex(match_matrix, ids)
+        explain = lambda rows: explain_rows(skills, rows)
+    else:
+        # Score only the employees that share a term with each project (plus the certified), unless so
+        # many pairs do that the full matrix in compact form (match_scores) takes less memory
+        with span('score', rows=len(valid_employees), projects=len(projects_df), candidates=True) as stage:
+            skills = SkillMatrix(valid_employees, projects_df, skill_vocabulary=skill_vocabulary, model=scoring)
+            if skills.candidate_share() * CANDIDATE_PAIR_BYTES > skills.pair_bytes():
+                ranking = RankingIndex(skills.match_scores(), ids)
+                stage.note(candidates=False)
+            else:
+                rows, cols, scores, floor = skills.candidate_scores()
+                ranking = CandidateRanking(len(valid_employees), rows, cols, scores, floor, skills.certified, ids)
+                stage.note(pairs=len(ranking))
+        explain = lambda rows: explain_rows(skills, rows)
+
+    return ProjectRankings(valid_employees, projects_df['Project Name'], ranking, explain), valid_employees
+
+def assign_employees_to_projects(projects_df, employee_df, top_n=10, matcher=None, workers=1,
+                                 skill_vocabulary=None, scoring=None, project_dates=False, today=None):
+    """For each project, show the top_n employees with highest match percentage.
+
+    With an IncrementalMatcher, only rows and projects changed since its last run are rescored
+    (the matcher's own skill_vocabulary and scoring model apply). Otherwise, with one worker, each
+    project only scores the employees sharing a skill token with it, certification-only matches
+    being ranked without scoring them (see CandidateRanking), unless most pairs share a token and
+    the compact full matrix is smaller. More workers each score and rank a shard of projects and
+    send back only its top lists (parallel_rankings). The breakdown columns are computed in one
+    batch for the employees shown. rank_employees keeps the rankings for further pages.
+
+    project_dates=True replaces the fixed availability horizon with each project's own date
+    window and hours/week (see available_employees); the full matrix is then scored and masked.
+    today is the planning date for either rule.
+    """
+    rankings, valid_employees = rank_employees(projects_df, employee_df, top_n, matcher, workers,
+                                               skill_vocabulary, scoring, project_dates, today)
+    return rankings.page(0, top_n), valid_employees, employee_df
+
+def allocate_employees_to_projects(projects_df, employee_df, workers=1, skill_vocabulary=None, scoring=None,
+                                   project_dates=False, today=None):
+    """Assign each employee to at most one project, maximizing total match percentage.
+
+    project_dates and today select employees as in assign_employees_to_projects.
+    """
+    valid_employees, availability = select_employees(employee_df, projects_df, project_dates, today)
+    project_assignments = {}
+
+    match_matrix, skills = match_scores(valid_employees, projects_df, workers, skill_vocabulary, scoring,
+                                        availability)
+    seats = projects_df['Number of Employees Needed'].fillna(0).astype(int).to_numpy()
+    with span('assign', mode='optimal', seats=int(seats.sum())):
+        assigned = optimal_assignment(match_matrix, seats, ids=employee_ids(valid_employees))
+    shown, breakdown_row = shown_rows([np.flatnonzero(assigned >= 0)], len(valid_employees))
+    contributions = explain_rows(skills, shown)
+
+    with span('tables', projects=len(projects_df)):
+        for col, project_name in enumerate(projects_df['Project Name']):
+            members = project_members(assigned, col, match_matrix)
+            matched = valid_employees.iloc[members][[
+                'Name', 'Availability', 'Languages', 'Experience', 'Tools', 'Certifications'
+            ]]
+            project_assignments[project_name] = with_breakdown(
+                matched.assign(**{'Match %': match_matrix[members, col]}), contributions, breakdown_row[members], col
+            )
+
+    valid_employees.loc[valid_employees.index[assigned >= 0], 'Are you currently assigned to a project?'] = 'Yes'
+    return project_assignments, valid_employees, employee_df
+
+def schedule_employee_hours(projects_df, employee_df, max_projects=DEFAULT_MAX_PROJECTS, workers=1,
+                            skill_vocabulary=None, scoring=None, project_dates=False, today=None):
+    """Split employees' weekly hours across projects, filling each project's hours/week commitment.
+
+    With project_dates, hours are booked only for the weeks each project runs (a CalendarLedger),
+    so projects that do not overlap in time can each take an employee's full hours.
+    """
+    valid_employees, availability = select_employees(employee_df, projects_df, project_dates, today)
+    project_assignments = {}
+
+    match_matrix, skills = match_scores(valid_employees, projects_df, workers, skill_vocabulary, scoring,
+                                        availability)
+    hours_per_person = parse_weekly_hours(projects_df['Time Commitment per Person (hrs/week)'])
+    people = projects_df['Number of Employees Needed'].fillna(0).astype(int).to_numpy()
+    if 'Current Projects' in valid_employees.columns:
+        current_projects = valid_employees['Current Projects'].fillna(0).astype(int)
+    else:
+        current_projects = np.zeros(len(valid_employees), dtype=int)
+    with span('assign', mode='hours') as stage:
+        if project_dates:
+            ledger = CalendarLedger(
+                AvailabilityCalendar.from_intern_records(valid_employees), project_windows(projects_df, today),
+                current_projects, hours_per_person * people, max_projects
+            )
+        else:
+            ledger = CapacityLedger(
+                valid_employees['Available Hours'], current_projects, hours_per_person * people, max_projects
+            )
+        schedule_hours(match_matrix, employee_ids(valid_employees), ledger, hours_per_person)
+        emps, projs, hours = ledger.allocations()
+        stage.note(bookings=len(emps))
+    shown, breakdown_row = shown_rows([emps], len(valid_employees))
+    contributions = explain_rows(skills, shown)
+
+    with span('tables', projects=len(projects_df)):
+        for col, project_name in enumerate(projects_df['Project Name']):
+            booked = projs == col
+            members = emps[booked]
+            matched = valid_employees.iloc[members][[
+                'Name', 'Availability', 'Languages', 'Experience', 'Tools', 'Certifications'
+            ]]
+            project_assignments[project_name] = with_breakdown(matched.assign(**{
+                'Match %': match_matrix[members, col], 'Booked Hours': hours[booked]
+            }), contributions, breakdown_row[members], col)
+
+    valid_employees['Available Hours'] = ledger.employee_hours
+    valid_employees['Current Projects'] = ledger.employee_projects
+    return project_assignments, valid_employees, employee_df
@@ -0,0 +1,96 @@
+"""Weighted, explainable Match % scoring.
+
+Match % = 100 * weighted matched points / weighted possible points, where
+every matched requirement token earns its criterion's weight and a
+certification earns the Certifications weight scaled by how relevant the
+certificate is to the project: the share of the project's requirement
+tokens that the certificate covers according to CERTIFICATION_SKILLS.
+Certificates that are not in the map are neutral (they neither add points
+nor count toward the total).
+
+SkillMatrix.score_breakdown returns the score together with each
+criterion's contribution in Match % points from the same matrix products,
+so explanations never need a per-row rescore.
+"""
+
+from workforce.vocabulary import SkillVocabulary
+
+# Certificate -> skills it demonstrates (same map as employee_data.py)
+CERTIFICATION_SKILLS = {
+    "Google Data Analytics Professional Certificate": ["SQL", "R", "Tableau", "Excel",
+                                                       "Data Cleaning", "Data Visualization"],
+    "IBM Data Analyst Professional Certificate": ["Python", "SQL", "Excel", "Power BI", "Data Analysis",
+                                                  "Data Manipulation"],
+    "Microsoft Certified: Power BI Data Analyst Associate": ["Power BI", "SQL", "Excel", "Azure",
+                                                             "Data Visualization", "Data Analysis"],
+    "SAS Statistical Business Analyst Professional Certificate": ["SAS", "Statistical Analysis",
+                                                                  "Data Manipulation", "Data Cleaning"],
+    "CompTIA Data+": ["Database Management", "Data Visualization", "SQL", "Python", "Data Analysis"],
+    "Meta Data Analyst Professional Certificate": ["Python", "SQL", "Data Visualization", "Excel",
+                                                   "Power BI", "Data Manipulation"],
+    "Certified Analytics Professional (CAP)": ["Data Analysis", "Machine Learning Basics", "Statistical Analysis",
+                                               "Business Acumen"],
+    "Tableau Desktop Certified Associate": ["Tableau", "Data Visualization", "Data Cleaning", "Data Analysis"],
+    "Microsoft Certified: Azure Enterprise Data Analyst Associate": ["Azure", "SQL", "Power BI", "Data Management"],
+    "Cloudera Certified Associate (CCA) Data Analyst": ["SQL", "NoSQL", "Database Management", "Data Collection"],
+}
+
+# Other names the certificates above are entered under
+CERTIFICATION_ALIASES = {
+    "Google Data Analytics Professional Certificate": ["google data analytics", "google data analyst",
+                                                       "google data analytics certificate"],
+    "IBM Data Analyst Professional Certificate": ["ibm data analyst"],
+    "Microsoft Certified: Power BI Data Analyst Associate": ["pl-300", "power bi data analyst associate",
+                                                             "microsoft power bi associate"],
+    "CompTIA Data+": ["comptia data plus"],
+    "Meta Data Analyst Professional Certificate": ["meta data analyst"],
+    "Certified Analytics Professional (CAP)": ["certified analytics professional"],
+    "Tableau Desktop Certified Associate": ["tableau certified associate"],
+    "Cloudera Certified Associate (CCA) Data Analyst": ["cloudera data analyst"],
+}
+
+CERTIFICATIONS = 'Certifications'
+
+class ScoringModel:
+    """Per-criterion weights plus the certificate -> skill relevance map.
+
+    Weights are keyed by employee column ('Languages', 'Experience', 'Tools',
+    ...) and 'Certifications'; missing criteria weigh 1. With
+    certification_skills=None any certificate earns its full weight for
+    every project, which with default weights reproduces the unweighted
+    score exactly.
+    """
+
+    def __init__(self, weights=None, certification_skills=CERTIFICATION_SKILLS,
+                 certification_aliases=CERTIFICATION_ALIASES):
+        self.weights = dict(weights or {})
+        self.certification_skills = certification_skills
+        self._certificates = None
+        if certification_skills is not None:
+            names = {name: certification_aliases.get(name, []) for name in certification_skills}
+            self._certificates = SkillVocabulary(synonyms=names)
+
+    def weight(self, criterion):
+        return float(self.weights.get(criterion, 1.0))
+
+    @property
+    def relevance(self):
+        """Whether certificates are scored by relevance rather than mere presence."""
+        return self.certification_skills is not None
+
+    def certificate_skills(self, value):
+        """Skills demonstrated by a Certifications cell, or None when no listed certificate is known.
+
+        A cell may list several certificates separated by ',' or ';'.
+        """
+        skills, known = [], False
+        for part in str(value).replace(';', ',').split(','):
+            term_id = self._certificates.lookup(part) if part.strip() else None
+            if term_id is not None:
+                known = True
+                skills.extend(self.certification_skills[self._certificates.label(term_id)])
+        return skills if known else None
+
+    def criteria(self, fields):
+        """Breakdown column order: one per matched field, then Certifications."""
+        return [emp_field for emp_field, _ in fields] + [CERTIFICATIONS]
@@ -0,0 +1,263 @@
+"""Local SQLite store for the intern records history and project requirements.
+
+Uploads are upserted by Id, so the roster grows across sessions without
+re-sending the whole history. The "latest record per intern" view that
+normalize_intern_records builds on every load is kept in the table itself
+(a `latest` flag per normalized Name1, maintained on upsert), and the
+filters filter_valid_employees applies are answered by a partial index:
+
+    with RosterStore('roster.sqlite') as store:
+        store.upsert_records(pd.read_excel('InternRecords.xlsx'))
+        employees = store.employees(valid_only=True, projects=projects_df)
+        assign_employees_to_projects(projects_df, employees)
+
+An inverted (field, token) -> Id index over the latest records narrows the
+roster to employees that share at least one requirement token with some
+project (or hold a certification, which always scores) before any row is
+loaded. Everyone left out scores 0 for every project, and zero scores are
+never shown or assigned, so results are unchanged.
+"""
+
+import copy
+import json
+import os
+import sqlite3
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from workforce.availability import VALID_AFTER_DAYS, planning_date
+from workforce.ingest import CACHE_DIR
+from workforce.matching import (
+    MATCH_FIELDS, canonical_project_terms, employee_tokens, has_certification, project_tokens
+)
+from workforce.normalize import ASSIGNED_FLAG, END_DATE, is_unassigned, normalize_intern_records
+from workforce.profiling import span
+from workforce.vocabulary import normalize_token
+
+DEFAULT_STORE = os.environ.get('WORKFORCE_STORE', os.path.join(CACHE_DIR, 'roster.sqlite'))
+
+# Name key for records without a Name1 (normalize_intern_records treats them as one intern)
+MISSING_NAME = '\x00'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS intern_records (
+    id INTEGER PRIMARY KEY,
+    name_key TEXT NOT NULL,
+    end_date TEXT,
+    unassigned INTEGER NOT NULL,
+    certified INTEGER NOT NULL,
+    latest INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS intern_records_name ON intern_records (name_key, id);
+CREATE INDEX IF NOT EXISTS intern_records_latest ON intern_records (id) WHERE latest = 1;
+CREATE INDEX IF NOT EXISTS intern_records_valid ON intern_records (end_date) WHERE latest = 1 AND unassigned = 1;
+
+CREATE TABLE IF NOT EXISTS skill_terms (
+    field TEXT NOT NULL,
+    token TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (field, token, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS skill_terms_id ON skill_terms (id);
+
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+def _json_rows(df):
+    """One JSON object per row (NaN as null, timestamps as ISO strings)."""
+    if df.empty:
+        return []
+    return df.to_json(orient='records', lines=True, date_format='iso').splitlines()
+
+def _frame(rows):
+    """DataFrame from JSON row strings, columns in first-seen order."""
+    return pd.DataFrame([json.loads(row) for row in rows])
+
+class RosterStore:
+    """Intern records and project requirements in one SQLite file (':memory:' for a scratch store).
+
+    `fields` are the (employee column, project column) pairs whose employee
+    tokens go into the inverted index; use the pairs you match on. A store
+    opens its own connection, so create one per thread.
+    """
+
+    def __init__(self, path=DEFAULT_STORE, fields=MATCH_FIELDS):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.fields = fields
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(SCHEMA)
+        self.conn.executescript("""
+            CREATE TEMP TABLE IF NOT EXISTS upload_ids (id INTEGER PRIMARY KEY);
+            CREATE TEMP TABLE IF NOT EXISTS touched_names (name_key TEXT PRIMARY KEY);
+            CREATE TEMP TABLE IF NOT EXISTS wanted_terms (field TEXT, token TEXT, PRIMARY KEY (field, token));
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # -------------------- Upserts --------------------
+
+    def upsert_records(self, df):
+        """Insert or replace raw InternRecords rows by Id; returns the number of rows written.
+
+        Rows without a numeric Id cannot be keyed and are skipped, so the
+        return value falls short of len(df) by their number. The latest flag
+        and the token index are recomputed only for the interns whose records
+        were touched.
+        """
+        ids = pd.to_numeric(df['Id'], errors='coerce')
+        with span('upsert', rows=len(df)) as stage:
+            stage.note(skipped=int(ids.isna().sum()))
+            df, ids = df[ids.notna()], ids[ids.notna()]
+            names = df['Name1'].str.strip().str.lower()
+            end_dates = pd.to_datetime(df[END_DATE], errors='coerce')
+            rows = list(zip(
+                ids.astype(int).tolist(),
+                names.where(names.notna(), MISSING_NAME).tolist(),
+                end_dates.dt.strftime('%Y-%m-%dT%H:%M:%S').astype(object).where(end_dates.notna(), None).tolist(),
+                is_unassigned(df[ASSIGNED_FLAG]).astype(int).tolist(),
+                has_certification(df['Certifications']).astype(int).tolist(),
+                # Dates are stored parsed, so uploads with different date formats never mix
+                _json_rows(df.assign(**{END_DATE: end_dates})),
+            ))
+            with self.conn:
+                cur = self.conn.cursor()
+                cur.execute("DELETE FROM upload_ids")
+                cur.execute("DELETE FROM touched_names")
+                cur.executemany("INSERT OR IGNORE INTO upload_ids VALUES (?)", [(r[0],) for r in rows])
+                # An Id can move to another intern, whose previous latest record must then be restored
+                touched = ("INSERT OR IGNORE INTO touched_names SELECT DISTINCT name_key FROM intern_records "
+                           "WHERE id IN (SELECT id FROM upload_ids)")
+                cur.execute(touched)
+                cur.executemany("""
+                    INSERT INTO intern_records (id, name_key, end_date, unassigned, certified, data)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET
+                        name_key = excluded.name_key, end_date = excluded.end_date,
+                        unassigned = excluded.unassigned, certified = excluded.certified, data = excluded.data
+                """, rows)
+                cur.execute(touched)
+                cur.execute("""
+                    DELETE FROM skill_terms WHERE id IN (
+                        SELECT id FROM intern_records WHERE name_key IN (SELECT name_key FROM touched_names))
+                """)
+                cur.execute("""
+                    UPDATE intern_records SET latest = (id = (
+                        SELECT MAX(r.id) FROM intern_records r WHERE r.name_key = intern_records.name_key))
+                    WHERE name_key IN (SELECT name_key FROM touched_names)
+                """)
+                latest = cur.execute("""
+                    SELECT id, data FROM intern_records
+                    WHERE latest = 1 AND name_key IN (SELECT name_key FROM touched_names)
+                """).fetchall()
+                # Sorted inserts append to the index B-tree instead of splitting pages all over it
+                cur.executemany("INSERT OR IGNORE INTO skill_terms VALUES (?, ?, ?)", sorted(self._terms(latest)))
+        return len(rows)
+
+    def _terms(self, records):
+        """(field, token, id) index entries for (id, JSON row) pairs, tokenized like the matcher."""
+        for record_id, data in records:
+            row = json.loads(data)
+            for emp_field, _ in self.fields:
+                value = row.get(emp_field)
+                for token in employee_tokens(np.nan if value is None else value):
+                    yield emp_field, token, record_id
+
+    def upsert_projects(self, df):
+        """Insert or replace project rows by Project Name; new projects are listed after existing ones."""
+        with span('upsert', rows=len(df), table='projects'), self.conn:
+            start = self.conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM projects").fetchone()[0]
+            self.conn.executemany("""
+                INSERT INTO projects (name, position, data) VALUES (?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET data = excluded.data
+            """, zip(df['Project Name'].astype(str).tolist(), range(start, start + len(df)), _json_rows(df)))
+        return len(df)
+
+    # -------------------- Queries --------------------
+
+    def projects(self):
+        """Stored project requirements in upload order."""
+        rows = self.conn.execute("SELECT data FROM projects ORDER BY position").fetchall()
+        return _frame(row for row, in rows)
+
+    def employees(self, valid_only=False, projects=None, skill_vocabulary=None, today=None):
+        """Latest record per intern, normalized like normalize_intern_records (highest Id first).
+
+        valid_only keeps unassigned interns whose end date is more than
+        VALID_AFTER_DAYS away (the filter_valid_employees rule, answered by the
+        index). With `projects`, only candidates that can score on at least one
+        of them are loaded: interns sharing a requirement token with some
+        project in the token index, or certified. With a SkillVocabulary,
+        stored and requirement tokens are compared by canonical ID; pass the
+        vocabulary the roster will be scored with (it learns the stored tokens
+        here, exactly as scoring would).
+        """
+        with span('query', valid_only=valid_only, pruned=projects is not None) as stage:
+            where, params = ["latest = 1"], []
+            if valid_only:
+                today = planning_date(today)
+                where.append("unassigned = 1 AND end_date > ?")
+                params.append((today + timedelta(days=VALID_AFTER_DAYS)).isoformat())
+            if projects is not None:
+                self._select_candidates(projects, skill_vocabulary)
+                where.append("(certified = 1 OR id IN (SELECT t.id FROM skill_terms t "
+                             "JOIN wanted_terms w ON w.field = t.field AND w.token = t.token))")
+            rows = self.conn.execute(
+                f"SELECT data FROM intern_records WHERE {' AND '.join(where)} ORDER BY id DESC", params
+            ).fetchall()
+            stage.note(rows=len(rows))
+            if not rows:
+                # Keep the stored columns so the backends can run on an empty roster
+                sample = self.conn.execute("SELECT data FROM intern_records LIMIT 1").fetchone()
+                columns = list(json.loads(sample[0])) if sample else ['Id', 'Name1', END_DATE]
+                return normalize_intern_records(pd.DataFrame(columns=columns))
+            return normalize_intern_records(_frame(row for row, in rows)).reset_index(drop=True)
+
+    def _select_candidates(self, projects, skill_vocabulary):
+        """Fill the wanted_terms temp table with the stored (field, token) pairs any project requires."""
+        wanted = set()
+        if skill_vocabulary is None:
+            for emp_field, proj_field in self.fields:
+                for value in projects[proj_field]:
+                    wanted.update((emp_field, token) for token in project_tokens(value))
+        else:
+            # Scoring adds unknown employee tokens as new terms, which requirements can then match, so
+            # stored tokens are mapped the same way but on a copy that the shared vocabulary never sees
+            skill_vocabulary = copy.deepcopy(skill_vocabulary)
+            for emp_field, proj_field in self.fields:
+                stored = [t for t, in self.conn.execute(
+                    "SELECT DISTINCT token FROM skill_terms WHERE field = ?", (emp_field,))]
+                by_id = {}
+                for token in stored:
+                    if normalize_token(token):
+                        by_id.setdefault(skill_vocabulary.canonical_id(token), []).append(token)
+                for value in projects[proj_field]:
+                    for term_id in canonical_project_terms(value, skill_vocabulary):
+                        wanted.update((emp_field, token) for token in by_id.get(term_id, ()))
+        with self.conn:
+            self.conn.execute("DELETE FROM wanted_terms")
+            self.conn.executemany("INSERT OR IGNORE INTO wanted_terms VALUES (?, ?)", wanted)
+
+    def counts(self):
+        """{'records': stored rows, 'employees': distinct interns, 'unassigned': interns flagged 'no'}."""
+        records, employees, unassigned = self.conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(latest), 0), COALESCE(SUM(latest AND unassigned), 0)
+            FROM intern_records
+        """).fetchone()
+        return {'records': records, 'employees': employees, 'unassigned': unassigned}
@@ -0,0 +1,224 @@
+"""Seeded synthetic rosters and project lists at any scale, in both app schemas.
+
+The vocabularies are the ones employee_data.py and project.py draw from
+(plus the extra terms that appear in the real InternRecords export), so
+generated data exercises the same tokens the matcher sees in practice.
+Rows are built column by column with NumPy; 100k employees x 2k projects
+takes a few seconds. Dates are offsets from `reference_date` (today by
+default), so the same seed and date always give the same files.
+
+    python -m workforce.synthetic data/ --schema realdata --employees 100000 --projects 2000 --format parquet
+"""
+
+import argparse
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from workforce.export import write_sheets
+from workforce.matching import LANGUAGES_REQUIRED, SKILLS_REQUIRED, TOOLS_REQUIRED
+from workforce.scoring import CERTIFICATION_SKILLS
+
+# -------------------- Vocabularies --------------------
+
+# employee_data.py / project.py
+AVAILABILITIES = ["Part-Time", "Full-Time"]
+LANGUAGES = ["Julia", "Python", "R", "SQL", "Javascript", "NoSQL"]
+TOOLS = ["Tableau", "Power BI", "Git", "VS Code", "Microsoft Excel", "Looker", "AWS", "Azure", "GCP"]
+SKILLS = ["Data Cleaning", "Data Visualization", "Data Analysis", "Data Collection",
+          "Data Manipulation and Management", "Statitical Analysis", "Database Management"]
+TIME_ZONES = ["EST", "CST", "MST", "PST", "GMT", "WAT", "CET", "IST", "AEST"]
+HOURS = [100, 150, 200, 250, 300, 350, 400]
+CERTIFICATIONS = list(CERTIFICATION_SKILLS)
+CERTIFICATION_PROBABILITY = 0.3
+
+# Extra terms and spellings seen in the InternRecords export
+INTERN_LANGUAGES = LANGUAGES + ["Java", "HTML", "JavaScript"]
+INTERN_TOOLS = TOOLS + ["PowerBI", "Jira", "MS Excel", "Microsoft Visio", "draw.io"]
+INTERN_SKILLS = SKILLS + ["ETL", "Process Mapping", "Agile", "Risk Management", "Statistical Analysis"]
+ROLES = ["Data Analyst", "Business Analyst", "Data Engineer", "Data Scientist", "Project Manager"]
+DEPARTMENTS = ["IT", "Finance", "HR", "Operations", "PNC and IT", "ESG", "Marketing"]
+PRIORITIES = ["High", "Medium", "Low"]
+PROFICIENCY = ["Beginner", "Intermediate", "Expert"]
+COMMITMENTS = ["10", "20", "30", "5 hrs/week", "8/week", "4 hrs/Week", "20hrs/Week", "10 hours per week"]
+NAME_PARTS = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn",
+              "Patel", "Garcia", "Smith", "Okafor", "Nguyen", "Kim", "Silva", "Mueller", "Rossi", "Khan"]
+PROJECT_WORDS = ["Dashboard", "Migration", "Automation", "Documentation", "Analysis", "Platform",
+                 "Onboarding", "Forecasting", "Pipeline", "Audit", "Tracker", "Optimization"]
+
+SCHEMAS = ('realdata', 'version2')
+FORMATS = ('xlsx', 'csv', 'parquet')
+
+# -------------------- Column Builders --------------------
+
+def _token_lists(rng, vocabulary, n_rows, low, high, sep, trailing=''):
+    """n_rows cells of low..high distinct vocabulary items joined by sep."""
+    vocabulary = np.asarray(vocabulary, dtype=object)
+    counts = rng.integers(low, high + 1, n_rows)
+    # Random sort keys per row give a distinct sample; the first `count` items are kept
+    order = np.argsort(rng.random((n_rows, len(vocabulary))), axis=1)[:, :max(high, 1)]
+    picks = vocabulary[order]
+    return [sep.join(row[:k]) + trailing if k else '' for row, k in zip(picks.tolist(), counts.tolist())]
+
+def _dates(reference, offsets_days, fmt=None):
+    values = pd.Timestamp(reference) + pd.to_timedelta(offsets_days, unit='D')
+    return values.strftime(fmt).to_numpy(dtype=object) if fmt else values
+
+def _certifications(rng, n_rows):
+    certs = np.asarray(CERTIFICATIONS, dtype=object)[rng.integers(0, len(CERTIFICATIONS), n_rows)]
+    return np.where(rng.random(n_rows) < CERTIFICATION_PROBABILITY, certs, None)
+
+# -------------------- realdata Schema --------------------
+
+def intern_records(n_employees, seed=0, reference_date=None, submissions_per_intern=1.3):
+    """InternRecords-style export: several submissions per intern, latest by Id wins on load."""
+    rng = np.random.default_rng(seed)
+    today = reference_date or date.today()
+    n_interns = max(1, int(n_employees / submissions_per_intern))
+    intern = rng.integers(0, n_interns, n_employees)
+    first = np.asarray(NAME_PARTS[:10], dtype=object)[intern % 10]
+    last = np.asarray(NAME_PARTS[10:], dtype=object)[(intern // 10) % 10]
+    names = (first + ' ' + last + ' ' + pd.Series(intern).astype(str).to_numpy(dtype=object))
+    # Inconsistent casing and padding, as in the real form export
+    noisy = rng.random(n_employees) < 0.1
+    names[noisy] = [f" {n.upper()} " for n in names[noisy]]
+
+    start = rng.integers(-120, 30, n_employees)
+    submitted = _dates(today, rng.integers(-180, 0, n_employees), '%m/%d/%Y %H:%M')
+    return pd.DataFrame({
+        'Id': np.arange(1, n_employees + 1),
+        'Start time': submitted,
+        'Completion time': submitted,
+        'Email': 'anonymous',
+        'Name': np.nan,
+        'Name1': names,
+        'Please Enter Your Start Date': _dates(today, start, '%m/%d/%Y'),
+        'Please Enter Your End Date': _dates(today, start + rng.choice([90, 180, 365], n_employees), '%m/%d/%Y'),
+        'Time Zone': rng.choice(TIME_ZONES, n_employees),
+        'Availability': rng.choice(AVAILABILITIES, n_employees, p=[0.4, 0.6]),
+        'Are you available between 9am - 2pm EST?': rng.choice(['Yes, all weekdays', 'Some weekdays', 'No'],
+                                                               n_employees),
+        'Days Available': np.nan,
+        'Role': rng.choice(ROLES, n_employees),
+        'Are you currently assigned to a project?': rng.choice(['Yes', 'No'], n_employees, p=[0.6, 0.4]),
+        'Tools': _token_lists(rng, INTERN_TOOLS, n_employees, 1, 4, ';', trailing=';'),
+        'Experience': _token_lists(rng, INTERN_SKILLS, n_employees, 1, 4, ';', trailing=';'),
+        'Languages': _token_lists(rng, INTERN_LANGUAGES, n_employees, 1, 3, ';', trailing=';'),
+        'Certifications': _certifications(rng, n_employees),
+    })
+
+def project_requirements(n_projects, seed=0, reference_date=None):
+    """Project requirements form with the long realdata headers."""
+    rng = np.random.default_rng(seed + 1)
+    today = reference_date or date.today()
+    words = np.asarray(PROJECT_WORDS, dtype=object)
+    start = rng.integers(-30, 60, n_projects)
+    languages = np.asarray(_token_lists(rng, INTERN_LANGUAGES, n_projects, 0, 2, ', '), dtype=object)
+    languages[languages == ''] = None  # most real projects leave languages blank
+    return pd.DataFrame({
+        'Project Name': [f"Project {i + 1}: {a} {b}" for i, (a, b) in
+                         enumerate(zip(rng.choice(words, n_projects), rng.choice(words, n_projects)))],
+        'Project Description': 'Synthetic project',
+        'Department / Team/ Pillar': rng.choice(DEPARTMENTS, n_projects),
+        'Project Start Date': _dates(today, start),
+        'Estimated End Date': _dates(today, start + rng.integers(14, 180, n_projects)),
+        LANGUAGES_REQUIRED: languages,
+        TOOLS_REQUIRED: _token_lists(rng, INTERN_TOOLS, n_projects, 1, 3, ', '),
+        SKILLS_REQUIRED: _token_lists(rng, INTERN_SKILLS, n_projects, 1, 3, ', '),
+        'Skill Proficiency Level (Beginner/Intermediate/Expert)': rng.choice(PROFICIENCY, n_projects),
+        'Number of Employees Needed': rng.integers(1, 6, n_projects),
+        'Employee Role(s) (e.g., Developer, Analyst, Tester)': rng.choice(ROLES, n_projects),
+        'Time Commitment per Person (hrs/week)': np.asarray(COMMITMENTS, dtype=object)[
+            rng.integers(0, len(COMMITMENTS), n_projects)],
+        'Project Priority (High/Medium/Low)': rng.choice(PRIORITIES, n_projects),
+        'Special Notes': np.nan,
+    })
+
+# -------------------- version2 Schema --------------------
+
+def employee_roster(n_employees, seed=0, reference_date=None):
+    """employee_datav2.xlsx layout: one language, skill and tool per employee."""
+    rng = np.random.default_rng(seed)
+    today = reference_date or date.today()
+    availability = rng.choice(AVAILABILITIES, n_employees)
+    full_time = availability == 'Full-Time'
+    start = rng.integers(-60, 30, n_employees)
+    names = np.array([f"Employee {i + 1:06d}" for i in range(n_employees)], dtype=object)
+    return pd.DataFrame({
+        'Name': names,
+        'Email': [f"employee.{i + 1:06d}@example.com" for i in range(n_employees)],
+        'Availability': availability,
+        'Current Projects': 0,
+        'Current Availability': np.where(full_time, 40, 20),
+        'Start Date': _dates(today, start),
+        'End Date': _dates(today, start + np.where(full_time, 90, 180)),
+        'Time Zone': rng.choice(TIME_ZONES, n_employees),
+        'Languages': rng.choice(LANGUAGES, n_employees),
+        'Skills': rng.choice(SKILLS, n_employees),
+        'Tools': rng.choice(TOOLS, n_employees),
+        'Certifications': _certifications(rng, n_employees),
+    })
+
+def project_list(n_projects, seed=0):
+    """project_requirementsv2.xlsx layout."""
+    rng = np.random.default_rng(seed + 1)
+    words = np.asarray(PROJECT_WORDS, dtype=object)
+    return pd.DataFrame({
+        'Project Name': [f"Project {i + 1}: {a} {b}" for i, (a, b) in
+                         enumerate(zip(rng.choice(words, n_projects), rng.choice(words, n_projects)))],
+        'Languages': rng.choice(LANGUAGES, n_projects),
+        'Skills': rng.choice(SKILLS, n_projects),
+        'Tools': rng.choice(TOOLS, n_projects),
+        'Number of People Required': rng.integers(1, 6, n_projects),
+        'Hours Required': rng.choice(HOURS, n_projects),
+    })
+
+# -------------------- Entry Points --------------------
+
+def generate(schema='realdata', n_employees=1000, n_projects=50, seed=0, reference_date=None):
+    """(employees, projects) frames in the given schema."""
+    if schema == 'realdata':
+        return (intern_records(n_employees, seed, reference_date),
+                project_requirements(n_projects, seed, reference_date))
+    if schema == 'version2':
+        return employee_roster(n_employees, seed, reference_date), project_list(n_projects, seed)
+    raise ValueError(f"Unknown schema '{schema}' (use {', '.join(SCHEMAS)})")
+
+def write_table(df, path):
+    """Write a frame as .xlsx (streamed), .csv or .parquet, chosen by extension."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.xlsx':
+        write_sheets([('Sheet1', df)], path)
+    elif ext == '.csv':
+        df.to_csv(path, index=False)
+    elif ext == '.parquet':
+        df.to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unsupported output type '{ext}' (use .xlsx, .csv or .parquet)")
+    return path
+
+def write_dataset(directory, schema='realdata', n_employees=1000, n_projects=50, seed=0, fmt='parquet',
+                  reference_date=None):
+    """Generate and write employees.<fmt> and projects.<fmt>; returns their paths."""
+    os.makedirs(directory, exist_ok=True)
+    employees, projects = generate(schema, n_employees, n_projects, seed, reference_date)
+    return (write_table(employees, os.path.join(directory, f"employees.{fmt}")),
+            write_table(projects, os.path.join(directory, f"projects.{fmt}")))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write a seeded synthetic employee/project dataset.')
+    parser.add_argument('directory', help='Output directory (employees.<fmt> and projects.<fmt>)')
+    parser.add_argument('--schema', choices=SCHEMAS, default='realdata')
+    parser.add_argument('--employees', type=int, default=1000)
+    parser.add_argument('--projects', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--format', choices=FORMATS, default='parquet')
+    args = parser.parse_args(argv)
+    for path in write_dataset(args.directory, args.schema, args.employees, args.projects, args.seed, args.format):
+        print(path)
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+"""Matching backend for the sample roster schema used by version2.py (employee_datav2.xlsx)."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from workforce.assignment import optimal_assignment, project_members
+from workforce.capacity import DEFAULT_MAX_PROJECTS, CapacityLedger, schedule_hours
+from workforce.matching import V2_MATCH_FIELDS, SkillMatrix, compute_match_matrix
+from workforce.normalize import available_hours
+from workforce.profiling import span
+from workforce.vocabulary import SkillVocabulary
+
+# -------------------- BACKEND LOGIC --------------------
+
+# Backends work on a prepared copy, so the caller's (possibly cached) frame is never modified
+def prepare_employees(employee_df):
+    return employee_df.assign(**{
+        'Current Projects': employee_df['Current Projects'].fillna(0).astype(int),
+        'Current Availability': employee_df['Current Availability'].fillna(0).astype(int),
+        'End Date': parsed_end_dates(employee_df),
+    })
+
+def parsed_end_dates(df):
+    if pd.api.types.is_datetime64_any_dtype(df['End Date']):
+        return df['End Date']
+    return pd.to_datetime(df['End Date'], errors='coerce')
+
+def filter_valid_employees(df):
+    with span('filter', rows_in=len(df)) as stage:
+        today = pd.to_datetime(datetime.today().date())
+        threshold_date = today + timedelta(days=15)
+        end_dates = parsed_end_dates(df)
+        keep = end_dates > threshold_date
+        df = df[keep].assign(**{'End Date': end_dates[keep]})
+        stage.note(rows=len(df))
+        hours = available_hours(df['Availability'])
+        return df.assign(**{'Available Hours': hours, 'Original Availability': hours})
+
+# Skills compare as canonical IDs, so 'PowerBI' matches 'Power BI' but 'R' no longer matches 'Javascript'
+# (the old whole-cell substring rule). Every pair is scored at once, rows in employee order; the matrix is
+# kept as matched-token counts (MatchCounts) and indexing it gives Match %.
+def skill_match_scores(employees, projects_df):
+    with span('score', rows=len(employees), projects=len(projects_df)):
+        return SkillMatrix(employees, projects_df, V2_MATCH_FIELDS, SkillVocabulary()).match_scores()
+
+def calculate_match_percentage(employee, project):
+    employees, projects = employee.to_frame().T, project.to_frame().T
+    return compute_match_matrix(employees, projects, V2_MATCH_FIELDS, SkillVocabulary())[0, 0]
+
+# Pool positions picked for one project: the best scores first (100% matches sort to the top),
+# in the same order as sorting the pool frame by 'Match %', without adding the column to it
+def match_employees_to_project(project, pool, match_scores):
+    required_people = int(project['Number of People Required'])
+    ranked = pd.Series(match_scores).sort_values(ascending=False).index.to_numpy()
+    return pool[ranked[:required_people]]
+
+def assign_employees_to_projects(projects_df, employee_df):
+    employee_df = prepare_employees(employee_df)
+    available_employees = filter_valid_employees(employee_df)
+    scores = skill_match_scores(available_employees, projects_df)
+
+    project_assignments = {}
+    pool = np.arange(len(available_employees))
+
+    with span('assign', mode='greedy'):
+        for col, (_, project) in enumerate(projects_df.iterrows()):
+            selected = match_employees_to_project(project, pool, scores[pool, col])
+            pool = np.setdiff1d(pool, selected, assume_unique=True)
+            project_assignments[project['Project Name']] = available_employees.iloc[selected][[
+                'Name', 'Availability', 'Languages', 'Skills', 'Tools', 'Certifications'
+            ]].assign(**{'Match %': scores[selected, col]})
+
+    return project_assignments, available_employees.iloc[pool], employee_df
+
+# Solve the whole employee -> project allocation at once, maximizing total Match %
+def optimize_employee_assignments(projects_df, employee_df):
+    employee_df = prepare_employees(employee_df)
+    available_employees = filter_valid_employees(employee_df)
+
+    scores = skill_match_scores(available_employees, projects_df)
+    seats = projects_df['Number of People Required'].fillna(0).astype(int).to_numpy()
+    ids = available_employees['Name'].astype(str).to_numpy()
+    with span('assign', mode='optimal', seats=int(seats.sum())):
+        assigned = optimal_assignment(scores, seats, ids=ids)
+
+    project_assignments = {}
+    with span('tables', projects=len(projects_df)):
+        for col, project_name in enumerate(projects_df['Project Name']):
+            members = project_members(assigned, col, scores)
+            matched_emps = available_employees.iloc[members][[
+                'Name', 'Availability', 'Languages', 'Skills', 'Tools', 'Certifications'
+            ]]
+            project_assignments[project_name] = matched_emps.assign(**{'Match %': scores[members, col]})
+
+    matched_idx = available_employees.index[assigned >= 0]
+    available_employees.loc[matched_idx, 'Current Projects'] += 1
+    available_employees.loc[matched_idx, 'Current Availability'] = 0
+    available_employees = available_employees.drop(index=matched_idx)
+
+    return project_assignments, available_employees, employee_df
+
+# Split each employee's weekly hours across several projects, respecting project hours and project limits
+def schedule_employee_hours(projects_df, employee_df, max_projects=DEFAULT_MAX_PROJECTS):
+    employee_df = prepare_employees(employee_df)
+    available_employees = filter_valid_employees(employee_df)
+
+    scores = skill_match_scores(available_employees, projects_df)
+    project_hours = projects_df['Hours Required'].fillna(0).astype(int).to_numpy()
+    people = projects_df['Number of People Required'].fillna(0).astype(int).clip(lower=1).to_numpy()
+    with span('assign', mode='hours') as stage:
+        ledger = CapacityLedger(
+            available_employees['Available Hours'], available_employees['Current Projects'],
+            project_hours, max_projects
+        )
+        schedule_hours(scores, np.arange(len(available_employees)), ledger, project_hours // people)
+        emps, projs, hours = ledger.allocations()
+        stage.note(bookings=len(emps))
+
+    project_assignments = {}
+    with span('tables', projects=len(projects_df)):
+        for col, project_name in enumerate(projects_df['Project Name']):
+            booked = projs == col
+            members = emps[booked]
+            matched_emps = available_employees.iloc[members][[
+                'Name', 'Availability', 'Languages', 'Skills', 'Tools', 'Certifications'
+            ]]
+            project_assignments[project_name] = matched_emps.assign(**{
+                'Match %': scores[members, col], 'Booked Hours': hours[booked]
+            })
+
+    # One vectorized write-back instead of a .loc update per booking
+    available_employees['Current Projects'] = ledger.employee_projects
+    available_employees['Available Hours'] = ledger.employee_hours
+    available_employees['Current Availability'] = ledger.employee_hours.astype(int)
+
+    return project_assignments, available_employees, employee_df
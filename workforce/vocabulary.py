@@ -0,0 +1,174 @@
+"""Canonical skill vocabulary: aliases, synonyms and typo-tolerant lookups.
+
+Every raw token ("PowerBI", "MS Excel", "Statitical Analysis") resolves to
+one integer canonical ID, so matching compares ID sets instead of strings.
+A token is looked up by its normalized form (lowercase, '&' as 'and',
+punctuation as spaces) and then its compact form ("power bi" == "powerbi")
+among the canonical labels and the alias / synonym table (SKILL_SYNONYMS).
+Failing that, a trigram index over every known key accepts the closest key
+whose Dice similarity reaches `fuzzy_threshold` (long tokens only);
+otherwise the token becomes a new canonical term that later variants can
+match. Each distinct raw token is resolved once and cached.
+"""
+
+import re
+from collections import Counter, defaultdict
+
+# Canonical label -> aliases and common spellings; the label itself is always a key
+SKILL_SYNONYMS = {
+    # Languages
+    'Python': ['py', 'python3'],
+    'R': ['r programming', 'rstats'],
+    'SQL': ['structured query language'],
+    'NoSQL': ['no sql'],
+    'JavaScript': ['js', 'ecmascript'],
+    'Julia': [],
+    'Java': [],
+    'HTML': ['html5'],
+    'SAS': [],
+    # Tools
+    'Power BI': ['pbi', 'microsoft power bi', 'ms power bi'],
+    'Microsoft Excel': ['excel', 'ms excel', 'msexcel', 'advanced excel'],
+    'Tableau': ['tableau desktop'],
+    'Git': [],
+    'VS Code': ['visual studio code'],
+    'Looker': [],
+    'AWS': ['amazon web services'],
+    'Azure': ['microsoft azure', 'ms azure'],
+    'GCP': ['google cloud', 'google cloud platform'],
+    'Jira': ['atlassian jira'],
+    # Skills
+    'Data Cleaning': ['data cleansing', 'data wrangling'],
+    'Data Visualization': ['data visualisation', 'data viz', 'dataviz'],
+    'Data Analysis': ['data analytics'],
+    'Data Collection': [],
+    'Data Manipulation': [],
+    'Data Management': [],
+    'Data Manipulation and Management': [],
+    'Statistical Analysis': ['statistics', 'statitical analysis'],
+    'Database Management': ['database administration', 'dbms'],
+    'Machine Learning': ['ml', 'machine learning basics'],
+    'Risk Management': [],
+    'Business Acumen': [],
+    'ETL': ['extract transform load'],
+    'Process Mapping': [],
+    'Agile': ['agile methodology', 'scrum'],
+}
+
+FUZZY_THRESHOLD = 0.8   # Dice similarity of trigram sets
+MIN_FUZZY_LENGTH = 5    # shorter tokens ("R", "SQL", "Git") must match exactly
+
+_SEPARATORS = re.compile(r"[^\w+#.]+")
+_NON_WORD = re.compile(r"[^\w+#]+")
+_NON_DIGIT = re.compile(r"\D+")
+
+# -------------------- Keys --------------------
+
+def normalize_token(token):
+    """Lowercase with '&' spelled 'and' and punctuation runs collapsed to single spaces."""
+    key = str(token).lower().replace('&', ' and ')
+    return ' '.join(_SEPARATORS.sub(' ', key).split()).strip('.')
+
+def compact_key(key):
+    """Normalized key without spaces or punctuation ('power bi' -> 'powerbi')."""
+    return _NON_WORD.sub('', key)
+
+def trigrams(key):
+    """Padded character trigrams of a compact key."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# -------------------- Vocabulary --------------------
+
+class SkillVocabulary:
+    """Maps raw skill tokens to canonical integer IDs; grows as new terms are seen.
+
+    One instance should be shared by everything that is compared together
+    (both sides of a score matrix, or every update of an IncrementalMatcher)
+    so the same token always gets the same ID.
+    """
+
+    def __init__(self, synonyms=SKILL_SYNONYMS, fuzzy_threshold=FUZZY_THRESHOLD,
+                 min_fuzzy_length=MIN_FUZZY_LENGTH):
+        self.synonyms = synonyms
+        self.fuzzy_threshold = fuzzy_threshold
+        self.min_fuzzy_length = min_fuzzy_length
+        self.labels = []                     # canonical ID -> display label
+        self._ids = {}                       # normalized or compact key -> canonical ID
+        self._grams = {}                     # compact key -> trigram set
+        self._postings = defaultdict(list)   # trigram -> compact keys containing it
+        self._resolved = {}                  # raw token -> canonical ID
+        for label, aliases in synonyms.items():
+            term_id = self._add_term(label)
+            for alias in aliases:
+                self._register(alias, term_id)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _add_term(self, label):
+        term_id = len(self.labels)
+        self.labels.append(label)
+        self._register(label, term_id)
+        return term_id
+
+    def _register(self, text, term_id):
+        key = normalize_token(text)
+        compact = compact_key(key)
+        for k in (key, compact):
+            if k:
+                self._ids.setdefault(k, term_id)
+        if len(compact) >= self.min_fuzzy_length and compact not in self._grams:
+            grams = trigrams(compact)
+            self._grams[compact] = grams
+            for gram in grams:
+                self._postings[gram].append(compact)
+
+    def _fuzzy(self, compact):
+        """Closest known key by trigram Dice similarity, or None below the threshold."""
+        grams = trigrams(compact)
+        digits = _NON_DIGIT.sub('', compact)
+        shared = Counter(k for gram in grams for k in self._postings.get(gram, ()))
+        best = None
+        for key, n in shared.items():
+            score = 2 * n / (len(grams) + len(self._grams[key]))
+            # "python2" and "python3" are different requirements however close they look
+            if score < self.fuzzy_threshold or _NON_DIGIT.sub('', key) != digits:
+                continue
+            # Highest similarity wins; ties go to the oldest term so results never depend on set order
+            candidate = (-score, self._ids[key], key)
+            if best is None or candidate < best:
+                best = candidate
+        return None if best is None else best[1]
+
+    def lookup(self, token):
+        """Canonical ID for a raw token, or None if it matches nothing known."""
+        term_id = self._resolved.get(token)
+        if term_id is not None:
+            return term_id
+        key = normalize_token(token)
+        compact = compact_key(key)
+        term_id = self._ids.get(key)
+        if term_id is None:
+            term_id = self._ids.get(compact)
+        if term_id is None and len(compact) >= self.min_fuzzy_length:
+            term_id = self._fuzzy(compact)
+        if term_id is not None:
+            # Fuzzy hits are cached but not indexed, so typos cannot chain away from the canonical term
+            self._resolved[token] = term_id
+        return term_id
+
+    def canonical_id(self, token):
+        """Canonical ID for a raw token, adding it as a new term when nothing matches."""
+        term_id = self.lookup(token)
+        if term_id is None:
+            term_id = self._add_term(str(token).strip())
+            self._resolved[token] = term_id
+        return term_id
+
+    def encode(self, tokens):
+        """Set of canonical IDs for an iterable of raw tokens (blank tokens skipped)."""
+        return {self.canonical_id(tok) for tok in tokens if normalize_token(tok)}
+
+    def label(self, term_id):
+        return self.labels[term_id]
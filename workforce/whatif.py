@@ -0,0 +1,450 @@
+"""What-if scenarios over one immutable roster and score matrix (intern records schema).
+
+A ScenarioBase keeps its own copy of the roster and projects, scores every
+valid employee against every project once and never modifies that matrix
+(kept in SkillMatrix.match_scores()'s compact form).
+A Scenario is nothing but its edits, keyed by employee Id and Project Name.
+Evaluating one rescores only the edited rows and the projects whose
+requirements changed, and top matches are merged from the base's ranked
+prefixes, so any number of scenarios share one copy of the data:
+
+    base = ScenarioBase(projects_df, employee_df)
+    extended = base.scenario('Extend 5 interns').extend_end_dates([101, 102, 103, 104, 105], days=14)
+    staffed = base.scenario('Project X +3').add_seats('Project X', 3)
+    results = {s.name: s.evaluate('optimal') for s in (base.scenario(), extended, staffed)}
+    compare_totals(results), compare_projects(results)
+
+An evaluated scenario matches what the realdata backend returns for the
+edited roster with the same settings (workers, project_dates, today); table
+columns are the backend's, without the breakdown.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from workforce.assignment import optimal_assignment, project_members
+from workforce.availability import PROJECT_END, PROJECT_START, AvailabilityCalendar, CalendarLedger, project_windows
+from workforce.capacity import DEFAULT_MAX_PROJECTS, CapacityLedger, parse_weekly_hours, schedule_hours
+from workforce.matching import MATCH_FIELDS
+from workforce.profiling import span
+from workforce.ranking import RankingIndex, employee_ids, top_k
+from workforce.realdata import match_scores, select_employees
+
+MODES = ('top', 'optimal', 'hours')
+
+END_DATE = 'Please Enter Your End Date'
+SEATS = 'Number of Employees Needed'
+HOURS_PER_PERSON = 'Time Commitment per Person (hrs/week)'
+TABLE_COLUMNS = ['Name', 'Availability', 'Languages', 'Experience', 'Tools', 'Certifications']
+
+# Project columns whose edits change scores (seat and hour edits only change the assignment)
+SCORED_PROJECT_COLUMNS = [proj_field for _, proj_field in MATCH_FIELDS]
+
+# Project columns that decide who is available for a project when planning with project dates
+WINDOW_PROJECT_COLUMNS = [PROJECT_START, PROJECT_END, HOURS_PER_PERSON]
+
+# -------------------- Base --------------------
+
+class ScenarioBase:
+    """Roster, projects and score matrix shared, unmodified, by every scenario built from it.
+
+    skill_vocabulary and scoring are used for the base and every scenario,
+    so canonical skill IDs and weights agree between them. workers,
+    project_dates and today select and score employees as in the realdata
+    backends (workers only for the base and for rescoring projects against
+    the whole roster).
+    """
+
+    def __init__(self, projects_df, employee_df, skill_vocabulary=None, scoring=None, workers=1,
+                 project_dates=False, today=None):
+        self.roster = employee_df.reset_index(drop=True).copy()
+        self.projects = projects_df.reset_index(drop=True).copy()
+        self.skill_vocabulary = skill_vocabulary
+        self.scoring = scoring
+        self.workers = workers
+        self.project_dates = project_dates
+        self.today = today
+        self.ids = employee_ids(self.roster)
+        # availability is the employees x projects mask with project dates, else None
+        self.valid, self.availability = select_employees(self.roster, self.projects, project_dates, today)
+        self.valid_positions = self.valid.index.to_numpy()
+        self.valid_ids = employee_ids(self.valid)
+        self.scores, _ = match_scores(self.valid, self.projects, workers, skill_vocabulary, scoring,
+                                      self.availability)
+        # Ranked prefixes are cached here and grown on demand by every scenario
+        self.ranking = RankingIndex(self.scores, self.valid_ids)
+        self.valid_row = np.full(len(self.roster), -1, dtype=np.int64)
+        self.valid_row[self.valid_positions] = np.arange(len(self.valid_positions))
+        self._positions = {}
+        for position, employee_id in enumerate(self.ids.tolist()):
+            self._positions.setdefault(employee_id, position)
+        self._project_names = set(self.projects['Project Name'])
+
+    def scenario(self, name='Base'):
+        """An empty scenario (no edits) on this base."""
+        return Scenario(self, name)
+
+    def position(self, employee_id):
+        """Roster position of an employee Id (the first record when Ids repeat)."""
+        try:
+            return self._positions[employee_id]
+        except KeyError:
+            raise ValueError(f"Unknown employee Id: {employee_id!r}") from None
+
+    def check_project(self, project_name):
+        if project_name not in self._project_names:
+            raise ValueError(f"Unknown project: {project_name!r}")
+
+# -------------------- Scenario --------------------
+
+class Scenario:
+    """Copy-on-write edits over a ScenarioBase; editing methods return the scenario for chaining.
+
+    Edits only touch the scenario's own {Id: {column: value}} and
+    {Project Name: {column: value}} overlays; the base frames are read, never
+    written. Results are cached per mode until the next edit.
+    """
+
+    def __init__(self, base, name, employee_edits=None, project_edits=None):
+        self.base = base
+        self.name = name
+        self.employee_edits = {key: dict(values) for key, values in (employee_edits or {}).items()}
+        self.project_edits = {key: dict(values) for key, values in (project_edits or {}).items()}
+        self._scored = None
+        self._results = {}
+
+    def fork(self, name):
+        """A new scenario starting from this one's edits."""
+        return Scenario(self.base, name, self.employee_edits, self.project_edits)
+
+    def _changed(self):
+        self._scored = None
+        self._results.clear()
+
+    # -------------------- Edits --------------------
+
+    def edit_employee(self, employee_id, values):
+        """Override roster columns of one employee, e.g. {'Are you currently assigned to a project?': 'Yes'}."""
+        self.base.position(employee_id)
+        self.employee_edits.setdefault(employee_id, {}).update(values)
+        self._changed()
+        return self
+
+    def extend_end_dates(self, employee_ids, days):
+        """Move the end date of each employee by `days` (negative to shorten)."""
+        for employee_id in employee_ids:
+            end_date = pd.to_datetime(self.employee_value(employee_id, END_DATE), errors='coerce')
+            self.edit_employee(employee_id, {END_DATE: end_date + timedelta(days=int(days))})
+        return self
+
+    def edit_project(self, project_name, values):
+        """Override project columns, e.g. {'Number of Employees Needed': 5} or a requirement cell.
+
+        With project dates, the dates and hours/week that decide availability cannot be edited.
+        """
+        self.base.check_project(project_name)
+        if self.base.project_dates and any(column in WINDOW_PROJECT_COLUMNS for column in values):
+            raise ValueError(f"Project dates and hours cannot be edited when planning with project dates: "
+                             f"{', '.join(column for column in values if column in WINDOW_PROJECT_COLUMNS)}")
+        self.project_edits.setdefault(project_name, {}).update(values)
+        self._changed()
+        return self
+
+    def add_seats(self, project_name, count):
+        """Ask for `count` more people on a project (negative to remove; never below 0)."""
+        seats = pd.to_numeric(pd.Series([self.project_value(project_name, SEATS)]), errors='coerce').fillna(0)
+        return self.edit_project(project_name, {SEATS: max(int(seats.iloc[0]) + int(count), 0)})
+
+    def employee_value(self, employee_id, column):
+        edits = self.employee_edits.get(employee_id, {})
+        if column in edits:
+            return edits[column]
+        return self.base.roster[column].iat[self.base.position(employee_id)]
+
+    def project_value(self, project_name, column):
+        edits = self.project_edits.get(project_name, {})
+        if column in edits:
+            return edits[column]
+        self.base.check_project(project_name)
+        projects = self.base.projects
+        return projects.loc[projects['Project Name'] == project_name, column].iloc[0]
+
+    def changes(self):
+        """One row per edited cell: Kind, Key, Column, Value."""
+        rows = [('Employee', key, column, value) for key, values in self.employee_edits.items()
+                for column, value in values.items()]
+        rows += [('Project', key, column, value) for key, values in self.project_edits.items()
+                 for column, value in values.items()]
+        return pd.DataFrame(rows, columns=['Kind', 'Key', 'Column', 'Value'])
+
+    # -------------------- Materialized Views --------------------
+
+    def edited_positions(self):
+        """Sorted roster positions of the edited employees."""
+        return np.array(sorted(self.base.position(key) for key in self.employee_edits), dtype=np.int64)
+
+    def employees(self):
+        """The edited employees' rows with the edits applied (a small frame, roster index kept)."""
+        positions = self.edited_positions()
+        rows = self.base.roster.iloc[positions].copy()
+        for employee_id, values in self.employee_edits.items():
+            label = self.base.position(employee_id)
+            for column, value in values.items():
+                if column == END_DATE:
+                    value = pd.to_datetime(value, errors='coerce')
+                    rows[END_DATE] = pd.to_datetime(rows[END_DATE], errors='coerce')
+                elif column in rows.columns and not pd.api.types.is_datetime64_any_dtype(rows[column]):
+                    # Categorical and string columns take any edited value
+                    rows[column] = rows[column].astype(object)
+                rows.loc[label, column] = value
+        return rows
+
+    def projects(self):
+        """Project requirements with the edits applied (the base frame itself when there are none)."""
+        if not self.project_edits:
+            return self.base.projects
+        projects = self.base.projects.copy()
+        names = projects['Project Name']
+        for project_name, values in self.project_edits.items():
+            for column, value in values.items():
+                projects.loc[names == project_name, column] = value
+        return projects
+
+    def rescored_projects(self):
+        """Columns of the projects whose requirement cells were edited."""
+        names = self.base.projects['Project Name']
+        edited = {name for name, values in self.project_edits.items()
+                  if any(column in SCORED_PROJECT_COLUMNS for column in values)}
+        return np.flatnonzero(names.isin(edited).to_numpy())
+
+    # -------------------- Evaluation --------------------
+
+    def _score(self):
+        """Score the edited rows and changed projects once per edit state."""
+        if self._scored is not None:
+            return self._scored
+        base = self.base
+        with span('whatif', scenario=self.name) as stage:
+            projects = self.projects()
+            positions = self.edited_positions()
+            edited = self.employees()
+            edited_valid, edited_availability = select_employees(edited, projects, base.project_dates, base.today)
+            keep = np.ones(len(base.valid), dtype=bool)
+            replaced = base.valid_row[positions]
+            keep[replaced[replaced >= 0]] = False
+            changed_cols = self.rescored_projects()
+
+            edited_scores = base.scores.empty((len(edited_valid), len(projects)))
+            if len(edited_valid) and len(projects):
+                edited_scores, _ = match_scores(edited_valid, projects, 1, base.skill_vocabulary, base.scoring,
+                                                edited_availability)
+            changed_scores = base.scores.empty((len(base.valid), len(changed_cols)))
+            if len(changed_cols) and len(base.valid):
+                changed_availability = base.availability[:, changed_cols] if base.project_dates else None
+                changed_scores, _ = match_scores(base.valid, projects.iloc[changed_cols], base.workers,
+                                                 base.skill_vocabulary, base.scoring, changed_availability)
+            stage.note(rescored_employees=len(edited), rescored_projects=len(changed_cols))
+
+        # Scenario rows: base valid rows 0..n-1 (the kept ones), then the edited valid rows from n on
+        n = len(base.valid)
+        roster_position = np.concatenate([base.valid_positions, edited_valid.index.to_numpy()])
+        rows = np.concatenate([np.flatnonzero(keep), n + np.arange(len(edited_valid))])
+        self._scored = {
+            'projects': projects, 'edited': edited, 'edited_valid': edited_valid, 'keep': keep,
+            'edited_scores': edited_scores, 'changed_cols': changed_cols, 'changed_scores': changed_scores,
+            # Roster order, as the backend would see the edited roster
+            'rows': rows[np.argsort(roster_position[rows], kind='stable')],
+            'ids': np.concatenate([base.valid_ids, employee_ids(edited_valid)]),
+        }
+        return self._scored
+
+    def _column(self, scored, col, rows):
+        """Scores of scenario rows for one project column."""
+        n = len(self.base.valid)
+        changed = np.flatnonzero(scored['changed_cols'] == col)
+        base_scores, base_col = (scored['changed_scores'], changed[0]) if len(changed) else (self.base.scores, col)
+        values = np.empty(len(rows))
+        from_base = rows < n
+        values[from_base] = base_scores[rows[from_base], base_col]
+        values[~from_base] = scored['edited_scores'][rows[~from_base] - n, col]
+        return values
+
+    def _matrix(self, scored):
+        """Scores of every scenario row (roster order) for the assignment modes, in compact form."""
+        n = len(self.base.valid)
+        rows = scored['rows']
+        from_base = rows < n
+        base_out, edited_out = np.flatnonzero(from_base), np.flatnonzero(~from_base)
+        cols = np.arange(len(scored['projects']))
+        changed_cols = scored['changed_cols']
+        # Changed projects overwrite the base columns they replace
+        parts = [
+            (base_out, cols, self.base.scores, rows[from_base], cols),
+            (base_out, changed_cols, scored['changed_scores'], rows[from_base], np.arange(len(changed_cols))),
+            (edited_out, cols, scored['edited_scores'], rows[~from_base] - n, cols),
+        ]
+        matrix = self.base.scores.empty((len(rows), len(cols)),
+                                        np.result_type(*[source.counts.dtype for _, _, source, _, _ in parts]))
+        for part in parts:
+            matrix.place(*part)
+        return matrix
+
+    def _values(self, scored, column):
+        """A roster column over scenario rows (roster order)."""
+        n = len(self.base.valid)
+        rows = scored['rows']
+        from_base = rows < n
+        values = np.empty(len(rows), dtype=object)
+        values[from_base] = self.base.valid[column].to_numpy()[rows[from_base]]
+        values[~from_base] = scored['edited_valid'][column].to_numpy()[rows[~from_base] - n]
+        return pd.Series(values)
+
+    def _table(self, scored, rows, columns=TABLE_COLUMNS):
+        """Roster columns (TABLE_COLUMNS by default) for scenario rows, in the given order."""
+        n = len(self.base.valid)
+        from_base = rows < n
+        frame = pd.concat([
+            self.base.valid.iloc[rows[from_base]][columns],
+            scored['edited_valid'].iloc[rows[~from_base] - n][columns],
+        ])
+        order = np.argsort(np.concatenate([np.flatnonzero(from_base), np.flatnonzero(~from_base)]), kind='stable')
+        return frame.iloc[order]
+
+    def _top(self, scored, col, top_n):
+        """Top scenario rows for one project, from the base's ranked prefix where the column is unchanged."""
+        n = len(self.base.valid)
+        edited_rows = n + np.arange(len(scored['edited_valid']))
+        if col in scored['changed_cols']:
+            rows = scored['rows']
+        else:
+            # Edited rows leave the base ranking; the prefix still holds the top_n best of the rest
+            removed = int(np.count_nonzero(~scored['keep']))
+            prefix = self.base.ranking.top(col, top_n + removed)
+            rows = np.concatenate([prefix[scored['keep'][prefix]], edited_rows])
+        return rows[top_k(self._column(scored, col, rows), top_n, scored['ids'][rows])]
+
+    def evaluate(self, mode='top', top_n=10, max_projects=DEFAULT_MAX_PROJECTS):
+        """ScenarioResult for one assignment mode ('top', 'optimal' or 'hours')."""
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+        cache_key = (mode, int(top_n), int(max_projects))
+        if cache_key not in self._results:
+            self._results[cache_key] = self._evaluate(mode, int(top_n), int(max_projects))
+        return self._results[cache_key]
+
+    def _evaluate(self, mode, top_n, max_projects):
+        scored = self._score()
+        projects = scored['projects']
+        picks = {}
+        with span('assign', mode=mode, scenario=self.name):
+            if mode == 'top':
+                for col, project_name in enumerate(projects['Project Name']):
+                    rows = self._top(scored, col, top_n)
+                    picks[project_name] = rows, {'Match %': self._column(scored, col, rows)}
+            else:
+                rows = scored['rows']
+                matrix = self._matrix(scored)
+                ids = scored['ids'][rows]
+                if mode == 'optimal':
+                    seats = projects[SEATS].fillna(0).astype(int).to_numpy()
+                    assigned = optimal_assignment(matrix, seats, ids=ids)
+                    for col, project_name in enumerate(projects['Project Name']):
+                        picked = project_members(assigned, col, matrix)
+                        picks[project_name] = rows[picked], {'Match %': matrix[picked, col]}
+                else:
+                    hours_per_person = parse_weekly_hours(projects[HOURS_PER_PERSON])
+                    people = projects[SEATS].fillna(0).astype(int).to_numpy()
+                    if 'Current Projects' in self.base.valid.columns:
+                        current = self._values(scored, 'Current Projects').fillna(0).astype(int)
+                    else:
+                        current = np.zeros(len(rows), dtype=int)
+                    if self.base.project_dates:
+                        calendar = AvailabilityCalendar.from_intern_records(
+                            self._table(scored, rows, list(self.base.valid.columns))
+                        )
+                        ledger = CalendarLedger(calendar, project_windows(projects, self.base.today), current,
+                                                hours_per_person * people, max_projects)
+                    else:
+                        ledger = CapacityLedger(self._values(scored, 'Available Hours').astype(float), current,
+                                                hours_per_person * people, max_projects)
+                    schedule_hours(matrix, ids, ledger, hours_per_person)
+                    emps, projs, hours = ledger.allocations()
+                    for col, project_name in enumerate(projects['Project Name']):
+                        booked = projs == col
+                        picked = emps[booked]
+                        picks[project_name] = rows[picked], {
+                            'Match %': matrix[picked, col], 'Booked Hours': hours[booked]
+                        }
+        return ScenarioResult(self.name, mode, picks, scored['ids'], lambda rows: self._table(scored, rows),
+                              len(scored['edited']), len(scored['changed_cols']))
+
+# -------------------- Results --------------------
+
+class ScenarioResult:
+    """Picks of one evaluated scenario: per project, the chosen rows and their Match % (and Booked Hours).
+
+    Tables are only built for the projects that are looked at (table() /
+    assignments); comparisons work on the member Ids and scores alone.
+    """
+
+    def __init__(self, name, mode, picks, ids, build_table, rescored_employees, rescored_projects):
+        self.name = name
+        self.mode = mode
+        self.picks = picks
+        self.members = {project: tuple(ids[rows].tolist()) for project, (rows, _) in picks.items()}
+        self.rescored_employees = rescored_employees
+        self.rescored_projects = rescored_projects
+        self._build_table = build_table
+        self._tables = {}
+
+    def table(self, project_name):
+        """The backend's result table for one project."""
+        if project_name not in self._tables:
+            rows, columns = self.picks[project_name]
+            self._tables[project_name] = self._build_table(rows).assign(**columns)
+        return self._tables[project_name]
+
+    @property
+    def assignments(self):
+        """{project: table} for every project, as the backends return them."""
+        return {project_name: self.table(project_name) for project_name in self.picks}
+
+    def scores(self, project_name):
+        return self.picks[project_name][1]['Match %']
+
+    def totals(self):
+        placed = set().union(*self.members.values()) if self.members else set()
+        scores = np.concatenate([np.zeros(0)] + [self.scores(project) for project in self.picks])
+        return {
+            'Employees placed': len(placed),
+            'Rows': len(scores),
+            'Avg Match %': round(float(scores.mean()), 2) if len(scores) else 0.0,
+            'Rescored employees': self.rescored_employees,
+            'Rescored projects': self.rescored_projects,
+        }
+
+def compare_totals(results):
+    """One row per scenario ({name: ScenarioResult}, the first being the reference)."""
+    return pd.DataFrame([result.totals() for result in results.values()], index=pd.Index(list(results), name='Scenario'))
+
+def compare_projects(results):
+    """Per project and scenario: people matched, average Match % and how many changed vs the first scenario.
+
+    Columns are a (scenario, metric) MultiIndex; projects only some
+    scenarios have are left empty for the others.
+    """
+    reference = next(iter(results.values()))
+    frames = {}
+    for name, result in results.items():
+        frames[name] = pd.DataFrame({
+            'Matches': {project: len(ids) for project, ids in result.members.items()},
+            'Avg Match %': {project: round(float(result.scores(project).mean()), 2) if len(ids) else 0.0
+                            for project, ids in result.members.items()},
+            'Changed': {project: len(set(ids) ^ set(reference.members.get(project, ())))
+                        for project, ids in result.members.items()},
+        })
+    table = pd.concat(frames, axis=1)
+    table.index.name = 'Project Name'
+    return table